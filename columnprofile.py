@@ -0,0 +1,166 @@
+from functools import cached_property
+import pandas as pd
+# Auxiliary functions:
+from parallelprofile import profile_numeric_columns
+# Auxiliary classes:
+from columnregistry import COLUMN_REGISTRY
+
+
+class ColumnProfile:
+
+    '''
+    This class is used to profile every column of a dataframe at once: null count, null percentage, mean, median, standard deviation, skewness, distinct count and data type.
+    Each statistic is calculated for every column in a single vectorised sweep the first time it is needed, and is then kept, so methods that read from the same profile don't rescan the dataframe.
+    The profile is not updated when the dataframe changes, a new profile should be created (or refresh() called) after the dataframe is altered.
+    With n_jobs greater than 1, the statistics of the numeric columns are calculated together by a pool of processes that read the columns from shared memory, which is faster for wide dataframes on machines with many cores.
+
+    Attributes:
+        DataFrame (pd.DataFrame): the dataframe that is profiled.
+        n_jobs (int): the number of processes used to calculate the statistics of the numeric columns.
+    '''
+
+    def __init__(self, DataFrame: pd.DataFrame, n_jobs: int = 1):
+
+        '''
+        This method is used to initialise this instance of the ColumnProfile class.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe that will be profiled.
+            n_jobs (int): DEFAULT = 1, the number of processes used to calculate the statistics of the numeric columns (the default calculates them in this process).
+        '''
+
+        self.DataFrame = DataFrame
+        self.n_jobs = n_jobs
+
+    def refresh(self):
+
+        '''
+        This method is used to discard every statistic that has been calculated, so they are recalculated from the dataframe when next needed.
+        '''
+
+        for statistic in ['dtypes', 'numeric_columns', 'null_count', 'null_percentage', 'mean', 'median', 'standard_deviation', 'skewness', 'distinct_count', 'numeric_statistics']:
+            self.__dict__.pop(statistic, None) # Removes the kept value of the statistic if it has been calculated.
+
+    @cached_property
+    def dtypes(self):
+
+        '''
+        pd.Series: The data type of each column.
+        '''
+
+        return self.DataFrame.dtypes
+
+    @cached_property
+    def numeric_columns(self):
+
+        '''
+        list: The names of the numeric columns, which the mean, median, standard deviation and skewness are calculated for.
+        '''
+
+        return COLUMN_REGISTRY.numeric_columns(self.DataFrame)
+
+    @cached_property
+    def numeric_statistics(self):
+
+        '''
+        pd.DataFrame: The null count, mean, median, standard deviation and skewness of each numeric column, calculated in parallel (only used when n_jobs is greater than 1).
+        '''
+
+        return profile_numeric_columns(self.DataFrame, self.numeric_columns, self.n_jobs)
+
+    @cached_property
+    def null_count(self):
+
+        '''
+        pd.Series: The number of null values in each column.
+        '''
+
+        if self.n_jobs > 1: # Numeric columns are counted in parallel, the other columns are counted here.
+            other_columns = self.DataFrame.columns.difference(self.numeric_columns, sort=False)
+            null_count = self.numeric_statistics['null_count']
+            if len(other_columns) > 0: # The counts are only combined if there are non-numeric columns, pandas warns when concatenating an empty series.
+                null_count = pd.concat([null_count, self.DataFrame[other_columns].isna().sum()])
+            return null_count.rename(None).reindex(self.DataFrame.columns).astype('int64')
+        return self.DataFrame.isna().sum()
+
+    @cached_property
+    def null_percentage(self):
+
+        '''
+        pd.Series: The percentage of null values in each column.
+        '''
+
+        return self.null_count / len(self.DataFrame) * 100 # Divides the number of nulls by the total number of values in each column, then multiplies by 100.
+
+    @cached_property
+    def mean(self):
+
+        '''
+        pd.Series: The mean value of each numeric column.
+        '''
+
+        if self.n_jobs > 1:
+            return self.numeric_statistics['mean'].rename(None)
+        return self.DataFrame[self.numeric_columns].mean(skipna=True).astype('float64') # Nullable columns would otherwise make the result nullable ('Float64').
+
+    @cached_property
+    def median(self):
+
+        '''
+        pd.Series: The median value of each numeric column.
+        '''
+
+        if self.n_jobs > 1:
+            return self.numeric_statistics['median'].rename(None)
+        return self.DataFrame[self.numeric_columns].median(skipna=True).astype('float64')
+
+    @cached_property
+    def standard_deviation(self):
+
+        '''
+        pd.Series: The standard deviation of each numeric column.
+        '''
+
+        if self.n_jobs > 1:
+            return self.numeric_statistics['standard_deviation'].rename(None)
+        return self.DataFrame[self.numeric_columns].std(skipna=True).astype('float64')
+
+    @cached_property
+    def skewness(self):
+
+        '''
+        pd.Series: The skewness of each numeric column.
+        '''
+
+        if self.n_jobs > 1:
+            return self.numeric_statistics['skewness'].rename(None)
+        return self.DataFrame[self.numeric_columns].skew(skipna=True).astype('float64')
+
+    @cached_property
+    def distinct_count(self):
+
+        '''
+        pd.Series: The number of distinct values in each column (null values count as one distinct value).
+        '''
+
+        return self.DataFrame.nunique(dropna=False)
+
+    def summary(self):
+
+        '''
+        This method is used to return every statistic of the profile in a single dataframe.
+
+        Returns:
+            pd.DataFrame: A dataframe with a row for each column of the profiled dataframe and a column for each statistic (NaN for statistics that only apply to numeric columns).
+        '''
+
+        return pd.DataFrame({
+            'dtype': self.dtypes,
+            'null_count': self.null_count,
+            'null_percentage': self.null_percentage,
+            'mean': self.mean,
+            'median': self.median,
+            'standard_deviation': self.standard_deviation,
+            'skewness': self.skewness,
+            'distinct_count': self.distinct_count
+        }, index=self.DataFrame.columns)
@@ -0,0 +1,91 @@
+from collections import OrderedDict
+import pandas as pd
+
+
+class ColumnRegistry:
+
+    '''
+    This class is used to classify the columns of dataframes by data type (numeric, categorical, date, boolean, text or other) using the kind of each data type, rather than comparing against lists of data type names.
+    This means nullable integers (e.g. 'Int32'), unsigned integers and every float size are recognised as numeric, while booleans are not.
+    The classification is kept for each schema (the column names and data types of a dataframe), so repeated queries on dataframes with the same schema don't check the columns again. Adding, removing or converting a column changes the schema, so the classification is always up to date.
+
+    Attributes:
+        max_schemas (int): the maximum number of schemas whose classification is kept.
+    '''
+
+    def __init__(self, max_schemas: int = 64):
+
+        '''
+        This method is used to initialise this instance of the ColumnRegistry class.
+
+        Parameters:
+            max_schemas (int): DEFAULT = 64, the maximum number of schemas whose classification is kept, when it is full the least recently used is discarded.
+        '''
+
+        self.max_schemas = max_schemas
+        self.classifications = OrderedDict() # Classification of each schema in order of use, the least recently used first.
+
+    def column_kind(self, dtype):
+
+        '''
+        This method is used to classify a single data type.
+
+        Parameters:
+            dtype: The data type of a column.
+
+        Returns:
+            str: 'numeric', 'categorical', 'date', 'boolean', 'text' or 'other'.
+        '''
+
+        if isinstance(dtype, pd.CategoricalDtype):
+            return 'categorical'
+        if isinstance(dtype, (pd.PeriodDtype, pd.DatetimeTZDtype)) or dtype.kind == 'M':
+            return 'date'
+        if dtype.kind == 'b': # Booleans (including the nullable 'boolean') are not treated as numeric.
+            return 'boolean'
+        if dtype.kind in 'iuf': # Signed and unsigned integers and floats, including nullable extension types.
+            return 'numeric'
+        if dtype.kind in 'OSU' or isinstance(dtype, pd.StringDtype):
+            return 'text'
+        return 'other'
+
+    def classify(self, DataFrame: pd.DataFrame):
+
+        '''
+        This method is used to classify every column of a dataframe, reusing the classification of a dataframe with the same schema.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+
+        Returns:
+            dict: The list of column names of each kind ('numeric', 'categorical', 'date', 'boolean', 'text' and 'other'), in the order of the dataframe's columns.
+        '''
+
+        schema = tuple(zip(DataFrame.columns, map(str, DataFrame.dtypes))) # Identifies the schema by the column names and data types.
+        if schema in self.classifications: # In the case a dataframe with this schema has already been classified.
+            self.classifications.move_to_end(schema)
+        else:
+            classification = {'numeric': [], 'categorical': [], 'date': [], 'boolean': [], 'text': [], 'other': []}
+            for column, dtype in zip(DataFrame.columns, DataFrame.dtypes): # For each column in the dataframe.
+                classification[ColumnRegistry.column_kind(self, dtype)].append(column)
+            self.classifications[schema] = classification
+            if len(self.classifications) > self.max_schemas: # In the case the registry is full, the least recently used schema is discarded.
+                self.classifications.popitem(last=False)
+        return {kind: list(columns) for kind, columns in self.classifications[schema].items()} # Copies so the kept classification can't be altered.
+
+    def numeric_columns(self, DataFrame: pd.DataFrame):
+
+        '''
+        This method is used to get the numeric columns of a dataframe.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+
+        Returns:
+            list: The names of the numeric columns.
+        '''
+
+        return ColumnRegistry.classify(self, DataFrame)['numeric']
+
+# The registry shared by DataFrameInfo, ColumnProfile, DataFrameTransform and Plotter.
+COLUMN_REGISTRY = ColumnRegistry()
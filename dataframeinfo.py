@@ -1,12 +1,80 @@
+import builtins
+import copy
+import numpy as np
 import pandas as pd
+# Auxiliary classes:
+from columnprofile import ColumnProfile
+from columnregistry import COLUMN_REGISTRY
+from statisticscache import StatisticsCache
+from streamingstatistics import ColumnSummary
 
 
 class DataFrameInfo:
 
     '''
     This class is used to retrieve information from the DataFrame.
+
+    Attributes:
+        statistics_cache (StatisticsCache): the cache of results of median(), standard_deviation(), mean(), null_count() and count_distinct(), or None if caching is not enabled.
+        n_jobs (int): the number of processes used by profile_columns() to calculate the statistics of numeric columns.
     '''
 
+    def __init__(self, cache_size: int = None, n_jobs: int = 1):
+
+        '''
+        This method is used to initialise this instance of the DataFrameInfo class.
+
+        Parameters:
+            cache_size (int): DEFAULT = None, if provided the results of median(), standard_deviation(), mean(), null_count() and count_distinct() are kept for up to this many column queries, so repeating a query on an unchanged dataframe is not recalculated (the default does not cache results).
+            n_jobs (int): DEFAULT = 1, if greater than 1 the profiles used by get_null_columns(), identify_conditional_null_columns(), get_skewed_columns() and get_skewness() calculate the statistics of numeric columns across this many processes, sharing the column data through shared memory (the default calculates them in this process).
+        '''
+
+        self.statistics_cache = StatisticsCache(cache_size) if cache_size is not None else None
+        self.n_jobs = n_jobs
+
+    def cached_statistic(self, statistic: str, DataFrame: pd.DataFrame, column_name: str, compute):
+
+        '''
+        This method is used to return a statistic from the cache if caching is enabled and the column is unchanged, otherwise the statistic is calculated.
+
+        Parameters:
+            statistic (str): The name of the statistic (e.g. 'median').
+            DataFrame (pd.DataFrame): The dataframe the statistic is calculated on.
+            column_name (str): The name of the column, or None if the statistic is for every column.
+            compute: A function with no arguments that calculates the statistic.
+
+        Returns:
+            The result of the statistic.
+        '''
+
+        cache = getattr(self, 'statistics_cache', None) # Other classes can call these methods on their own instance, which has no cache.
+        if cache is None: # In the case caching is not enabled.
+            return compute()
+        return cache.get_or_compute(statistic, DataFrame, column_name, compute)
+
+    def cache_info(self):
+
+        '''
+        This method is used to get the number of cache hits and misses.
+
+        Returns:
+            dict: the 'hits', 'misses', 'size' and 'max_size' of the cache, or None if caching is not enabled.
+        '''
+
+        return None if self.statistics_cache is None else self.statistics_cache.info()
+
+    def clear_cache(self, DataFrame: pd.DataFrame = None):
+
+        '''
+        This method is used to discard cached statistics, this should be called after a dataframe's values are edited in place.
+
+        Parameters:
+            DataFrame (pd.DataFrame): DEFAULT = None, the dataframe whose statistics are discarded (the default discards every statistic).
+        '''
+
+        if self.statistics_cache is not None:
+            self.statistics_cache.invalidate(DataFrame)
+
     def describe_dtypes(self, DataFrame: pd.DataFrame, column_name: str = None): # If no column_name argument is provided the method assumes a column_name value of None.
         # This is so the method can be applied to a specific column or the entire DataFrame.
         
@@ -47,10 +115,11 @@ class DataFrameInfo:
         if column_name is not None: # In the case that a column name IS provided.
             if column_name not in DataFrame.columns: # In the case the provided column_name is NOT in the DataFrame.
                 raise ValueError(f"Column '{column_name}' not found in the dataframe.") # Raises an error.
-            return DataFrame[column_name].median(numeric_only=True) # Applies method to specified column.
+            compute = lambda: DataFrame[column_name].median(numeric_only=True) # Applies method to specified column.
         else: # In the case a column name IS NOT provided.
-            return DataFrame.median(numeric_only=True) # Applies method to every column in the DataFrame.
-    
+            compute = lambda: DataFrame.median(numeric_only=True) # Applies method to every column in the DataFrame.
+        return DataFrameInfo.cached_statistic(self, 'median', DataFrame, column_name, compute)
+
     def standard_deviation(self, DataFrame: pd.DataFrame, column_name: str = None): # If no column_name argument is provided the method assumes a column_name value of None.
         # This is so the method can be applied to a specific column or the entire DataFrame.
 
@@ -69,10 +138,11 @@ class DataFrameInfo:
         if column_name is not None: # In the case that a column name IS provided.
             if column_name not in DataFrame.columns: # In the case the provided column_name is NOT in the DataFrame.
                 raise ValueError(f"Column '{column_name}' not found in the dataframe.") # Raises an error.
-            return DataFrame[column_name].std(skipna=True, numeric_only=True) # Applies method to specified column.
+            compute = lambda: DataFrame[column_name].std(skipna=True, numeric_only=True) # Applies method to specified column.
         else: # In the case a column name IS NOT provided.
-            return DataFrame.std(skipna=True, numeric_only=True) # Applies method to every column in the DataFrame.
-        
+            compute = lambda: DataFrame.std(skipna=True, numeric_only=True) # Applies method to every column in the DataFrame.
+        return DataFrameInfo.cached_statistic(self, 'standard_deviation', DataFrame, column_name, compute)
+
     def mean(self, DataFrame: pd.DataFrame, column_name: str = None): # If no column_name argument is provided the method assumes a column_name value of None.
         # This is so the method can be applied to a specific column or the entire DataFrame.
 
@@ -91,10 +161,11 @@ class DataFrameInfo:
         if column_name is not None: # In the case that a column name IS provided.
             if column_name not in DataFrame.columns: # In the case the provided column_name is NOT in the DataFrame.
                 raise ValueError(f"Column '{column_name}' not found in the dataframe.") # Raises an error.
-            return DataFrame[column_name].mean(skipna=True, numeric_only=True) # Applies method to specified column.
+            compute = lambda: DataFrame[column_name].mean(skipna=True, numeric_only=True) # Applies method to specified column.
         else: # In the case a column name IS NOT provided.
-            return DataFrame.mean(skipna=True, numeric_only=True) # Applies method to every column in the DataFrame.
-    
+            compute = lambda: DataFrame.mean(skipna=True, numeric_only=True) # Applies method to every column in the DataFrame.
+        return DataFrameInfo.cached_statistic(self, 'mean', DataFrame, column_name, compute)
+
     def count_distinct(self, DataFrame: pd.DataFrame, column_name: str):
 
         '''
@@ -108,7 +179,7 @@ class DataFrameInfo:
             int: The number of unique or distinct values within the column.
         '''
 
-        return len(DataFrame[column_name].unique())
+        return DataFrameInfo.cached_statistic(self, 'count_distinct', DataFrame, column_name, lambda: len(DataFrame[column_name].unique()))
 
     def shape(self, DataFrame: pd.DataFrame):
 
@@ -143,10 +214,11 @@ class DataFrameInfo:
         if column_name is not None: # In the case that a column name IS provided.
             if column_name not in DataFrame.columns: # In the case the provided column_name is NOT in the DataFrame.
                 raise ValueError(f"Column '{column_name}' not found in the dataframe.") # Raises an error.
-            return DataFrame[column_name].isna().sum() # Applies method to specified column.
+            compute = lambda: DataFrame[column_name].isna().sum() # Applies method to specified column.
         else: # In the case a column name IS NOT provided.
-            return DataFrame.isna().sum() # Applies method to every column in the DataFrame.
-        
+            compute = lambda: DataFrame.isna().sum() # Applies method to every column in the DataFrame.
+        return DataFrameInfo.cached_statistic(self, 'null_count', DataFrame, column_name, compute)
+
     def null_percentage(self, DataFrame: pd.DataFrame, column_name: str = None): # If no column_name argument is provided the method assumes a column_name value of None.
         # This is so the method can be applied to a specific column or the entire DataFrame.
 
@@ -173,7 +245,87 @@ class DataFrameInfo:
             # Applies method to every column in the DataFrame.
             return percentage
         
-    def get_null_columns(self, DataFrame: pd.DataFrame, print: bool = False):
+    def profile_columns(self, DataFrame: pd.DataFrame, profile: ColumnProfile = None):
+
+        '''
+        This method is used to get a profile of every column in the dataframe, in which the null count, null percentage, mean, median, standard deviation, skewness and distinct count are each calculated for every column in a single sweep and kept.
+        Passing the same profile to get_null_columns(), identify_conditional_null_columns(), get_skewed_columns() and get_skewness() means the dataframe is only scanned once for each statistic.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            profile (ColumnProfile): DEFAULT = None, an existing profile, this is returned if it is a profile of the same dataframe (otherwise a new profile is created).
+
+        Returns:
+            ColumnProfile: The profile of the dataframe's columns.
+        '''
+
+        if profile is not None and profile.DataFrame is DataFrame: # In the case the profile provided is of this dataframe.
+            return profile
+        return ColumnProfile(DataFrame, n_jobs=getattr(self, 'n_jobs', 1)) # Instances of other classes calling this method profile in a single process.
+
+    def summarise(self, DataFrame: pd.DataFrame, column_names: list = None, precision: int = 14, sketch_size: int = 100000):
+
+        '''
+        This method is used to get a mergeable summary of each column, so that the statistics of separate shards of the data (e.g. by issue year or region) can be combined without reloading them.
+        Each ColumnSummary() keeps the number of values and nulls, the count, mean and second and third central moments of numeric values, a HyperLogLog sketch of the distinct values and a sample of the numeric values for the median.
+        Combined summaries give the exact count, null count, null percentage, sum, mean, standard deviation and skewness, and an approximate distinct count and median (see streamingstatistics.py for the error bounds).
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            column_names (list): DEFAULT = None, the columns to summarise (the default summarises every column).
+            precision (int): DEFAULT = 14, the precision of the distinct count sketches, shards must use the same precision to be combined.
+            sketch_size (int): DEFAULT = 100000, the number of values kept for the median.
+
+        Returns:
+            dict: A ColumnSummary for each column.
+        '''
+
+        column_names = DataFrame.columns if column_names is None else column_names
+        summaries = {}
+        for column in column_names: # For each column to summarise.
+            if column not in DataFrame.columns: # In the case the provided column_name is NOT in the dataframe.
+                raise ValueError(f"Column '{column}' not found in the dataframe.")
+            summaries[column] = ColumnSummary(precision, sketch_size)
+            summaries[column].update(DataFrame[column])
+        return summaries
+
+    def merge_summaries(self, *shard_summaries: dict):
+
+        '''
+        This method is used to combine the summaries of separate shards into the summaries of all of them.
+        Combining is associative, so shards can be combined in any grouping (e.g. on separate machines, then together), the summaries provided are not altered.
+
+        Parameters:
+            *shard_summaries (dict): The summaries of each shard, from summarise() or StreamingDataFrameInfo.summarise().
+
+        Returns:
+            dict: A ColumnSummary for each column in any of the shards.
+        '''
+
+        merged = {}
+        for summaries in shard_summaries: # For each shard.
+            for column, summary in summaries.items():
+                if column in merged:
+                    merged[column].merge(summary)
+                else:
+                    merged[column] = copy.deepcopy(summary) # A copy is merged into, so the shard's summary is unchanged.
+        return merged
+
+    def summary_statistics(self, summaries: dict):
+
+        '''
+        This method is used to calculate the statistics of each column from its summary.
+
+        Parameters:
+            summaries (dict): A ColumnSummary for each column, from summarise() or merge_summaries().
+
+        Returns:
+            pd.DataFrame: A row for each column with the 'count', 'null_count', 'null_percentage', 'sum', 'mean', 'median', 'standard_deviation', 'skewness' and 'distinct_count'.
+        '''
+
+        return pd.DataFrame.from_dict({column: summary.statistics() for column, summary in summaries.items()}, orient='index')
+
+    def get_null_columns(self, DataFrame: pd.DataFrame, print: bool = False, profile: ColumnProfile = None):
 
         '''
         This method is used to retrieve a list of columns that contain null values as well as print the percentage of null values for each of those columns.
@@ -181,18 +333,20 @@ class DataFrameInfo:
         Parameters:
             DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
             print (bool): IF True then these columns are printed with their respective percentages.
+            profile (ColumnProfile): DEFAULT = None, a profile of the dataframe from profile_columns() to read the null counts from (the default profiles the dataframe).
         
         Returns:
             columns_with_null (list): List of column names that contain null values.
         '''
 
-        columns_with_null = list(DataFrame.columns[list(DataFrameInfo.null_count(self, DataFrame=DataFrame)>0)]) # Creating a list of columns that contain null values.
+        profile = DataFrameInfo.profile_columns(self, DataFrame, profile)
+        columns_with_null = profile.null_count.index[profile.null_count > 0].tolist() # Creating a list of columns that contain null values.
         if print == True:
             for col in columns_with_null:
-                print(f'{col}: {round(DataFrameInfo.null_percentage(self, DataFrame=DataFrame, column_name=col),1)} %') # For each column in the list print the column name and the percentage of null values.
+                builtins.print(f'{col}: {round(profile.null_percentage[col],1)} %') # For each column in the list print the column name and the percentage of null values.
         return columns_with_null
     
-    def identify_conditional_null_columns(self, DataFrame: pd.DataFrame, comparison_operator: str, null_percentage_condition: int):
+    def identify_conditional_null_columns(self, DataFrame: pd.DataFrame, comparison_operator: str, null_percentage_condition: int, profile: ColumnProfile = None):
         
         '''
         This method is used to produce a list of column names that contain null values based on conditions on the proportion of null values.
@@ -203,43 +357,52 @@ class DataFrameInfo:
             comparison_operator (str): either '>' or '<', this is the condition that will be used to specify the proportion of null values to be included.
 
             null_percentage_condition (int): the percentage of null values present in each column that will be used in the condition.
+            profile (ColumnProfile): DEFAULT = None, a profile of the dataframe from profile_columns() to read the null percentages from (the default profiles the dataframe).
 
         Returns:
             columns (list): a list of the columns that meet the criteria in terms of percentage of null values.
         '''
         
-        columns = [] # Create empty list.
-        for col in DataFrame.columns: # For each column in the dataframe
-            if '>' in comparison_operator and '<' not in comparison_operator: # If greater than condition specified.
-                if DataFrameInfo.null_percentage(self, DataFrame=DataFrame, column_name=col) > null_percentage_condition: # If percentage of nulls in column is greater than specified integer.
-                    columns.append(col) # Add column to list.
-            elif '<' in comparison_operator and '>' not in comparison_operator: # If less than condition specified.
-                if DataFrameInfo.null_percentage(self, DataFrame=DataFrame, column_name=col) < null_percentage_condition and DataFrameInfo.null_percentage(self, DataFrame=DataFrame, column_name=col) > 0: # If percentage of nulls in column is less than specified integer but greater than 0.
-                        columns.append(col) # Add column to list.
-            else:
-                raise ValueError(f"'{comparison_operator}' is not a comparison operator please input either '>' or '<'.") # Otherwise raise ValueError requesting valid conditional operator.
+        null_percentages = DataFrameInfo.profile_columns(self, DataFrame, profile).null_percentage # The percentage of nulls in every column, calculated in one pass.
+        if '>' in comparison_operator and '<' not in comparison_operator: # If greater than condition specified.
+            condition = null_percentages > null_percentage_condition # If percentage of nulls in column is greater than specified integer.
+        elif '<' in comparison_operator and '>' not in comparison_operator: # If less than condition specified.
+            condition = (null_percentages < null_percentage_condition) & (null_percentages > 0) # If percentage of nulls in column is less than specified integer but greater than 0.
+        else:
+            raise ValueError(f"'{comparison_operator}' is not a comparison operator please input either '>' or '<'.") # Otherwise raise ValueError requesting valid conditional operator.
+        columns = null_percentages.index[condition].tolist() # List of columns that meet the condition.
         return columns
     
     def get_numeric_columns(self, DataFrame: pd.DataFrame):
 
         '''
         This method is used to obtain a list of all numeric columns in a dataframe.
+        Columns are classified by the kind of their data type, so nullable integers (e.g. 'Int32'), unsigned integers and floats of any size are included and booleans are not.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+
+        Returns:
+            numeric_columns (list): A list containing the names of all the numeric columns in the dataframe.
+        '''
+
+        return COLUMN_REGISTRY.numeric_columns(DataFrame) # The classification is reused for dataframes with the same columns and data types.
+
+    def classify_columns(self, DataFrame: pd.DataFrame):
+
+        '''
+        This method is used to classify every column in a dataframe by its data type.
 
         Parameters:
             DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
 
         Returns:
-            _numeric_columns (list): A list containing the names of all the numeric columns in the dataframe.
+            dict: The list of column names of each kind ('numeric', 'categorical', 'date', 'boolean', 'text' and 'other').
         '''
 
-        numerics = ['int16', 'int32', 'int64', 'float16', 'float32', 'float64'] # List of numeric datatypes in string format.
-        numeric_columns = [] # Empty list.
-        for column in DataFrame.columns: # For each column in the dataframe.
-            if DataFrame[column].dtypes in numerics: # If the columns datatype is numeric.
-                numeric_columns.append(column) # Add column to list.
-        return numeric_columns
+        return COLUMN_REGISTRY.classify(DataFrame)
 
-    def get_skewed_columns(self, DataFrame: pd.DataFrame, threshold: int):
+    def get_skewed_columns(self, DataFrame: pd.DataFrame, threshold: int, profile: ColumnProfile = None):
         
         '''
         This method is used to obtain a list of all columns that meet skewness threshold criteria.
@@ -247,19 +410,18 @@ class DataFrameInfo:
         Parameters:
             DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
             threshold (int): The absolute value of the skewness threshold.
+            profile (ColumnProfile): DEFAULT = None, a profile of the dataframe from profile_columns() to read the skewness from (the default profiles the dataframe).
 
         Returns:
             skewed_numeric_columns (list): A list containing the names of all the columns that exceed the skewness threshold.
         '''
 
         numerics_columns = DataFrameInfo.get_numeric_columns(self, DataFrame) # Call 'DataFrameInfo.get_numeric_columns()' method to get list of numeric columns.
-        skewed_columns = [] # Empty list.
-        for column in numerics_columns: # For each numeric column in the dataframe.
-            if abs(DataFrame[column].skew()) >= threshold: # If the absolute value of the skewness of column is greater than or equal to the threshold.
-                skewed_columns.append(column) # Add column to list.
+        skewness = DataFrameInfo.profile_columns(self, DataFrame, profile).skewness.reindex(numerics_columns) # The skewness of every numeric column, calculated in one pass.
+        skewed_columns = skewness.index[skewness.abs() >= threshold].tolist() # Columns where the absolute value of the skewness is greater than or equal to the threshold.
         return skewed_columns
     
-    def get_skewness(self, DataFrame: pd.DataFrame, column_names: list):
+    def get_skewness(self, DataFrame: pd.DataFrame, column_names: list, profile: ColumnProfile = None):
         
         '''
         This method is used to obtain a dictionary of skewness' for a list of columns.
@@ -267,15 +429,20 @@ class DataFrameInfo:
         Parameters:
             DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
             column_names (list): A list of columns for which the skewness will be computed.
+            profile (ColumnProfile): DEFAULT = None, a profile of the dataframe from profile_columns() to read the skewness from (the default calculates the skewness of only the listed columns).
 
         Returns:
             skewness (dict): A dictionary containing the column as a key with its skewness as a value.
         '''
 
+        if profile is not None and profile.DataFrame is DataFrame: # In the case a profile of this dataframe is provided, its skewness is reused.
+            profiled_skewness = profile.skewness
+        else: # Otherwise only the listed columns are calculated, rather than profiling every column.
+            profiled_skewness = pd.Series(dtype='float64')
         skewness = {} # Empty dictionary. 
         for column in column_names: # For each column in list of columns.
-            print(f'{column}: {round(DataFrame[column].skew(),2)}') # Print column name and skewness rounded to 2 d.p.
-            skewness[column] = DataFrame[column].skew() # Add column and its skewness to dictionary.
+            skewness[column] = profiled_skewness[column] if column in profiled_skewness.index else DataFrame[column].skew() # Add column and its skewness to dictionary, computing it only once.
+            print(f'{column}: {round(skewness[column],2)}') # Print column name and skewness rounded to 2 d.p.
         return skewness
     
     def calculate_column_percentage(self, DataFrame: pd.DataFrame, target_column_name: str, total_column_name: str):
@@ -314,6 +481,57 @@ class DataFrameInfo:
         percentage = (target/total)*100
         return percentage
     
+    def term_length_in_months(self, DataFrame: pd.DataFrame):
+
+        '''
+        This method is used to get the length of each loan's term in months from the 'term' column (e.g. '36 months' or 36).
+        The number is only extracted once for each distinct term value and then mapped back to every row.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+
+        Returns:
+            np.ndarray: The term length in months of each row as a float, NaN where the term is missing.
+        '''
+
+        codes, unique_terms = pd.factorize(DataFrame['term']) # Integer code for each row and the distinct term values, missing terms have a code of -1.
+        unique_lengths = pd.to_numeric(pd.Series(unique_terms, dtype='object').astype(str).str.extract(r'(\d+)', expand=False), errors='coerce').to_numpy(dtype='float64') # Extract the number of months from each distinct term.
+        return np.where(codes >= 0, unique_lengths[codes], np.nan) # Map the number of months back to every row.
+
+    def month_ordinals(self, DataFrame: pd.DataFrame, column_name: str):
+
+        '''
+        This method is used to convert a 'period[M]' date column into integer month ordinals (the number of months since January 1970), so that months between dates can be calculated with array arithmetic.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            column_name (str): The name of the 'period[M]' column.
+
+        Returns:
+            np.ndarray: The month ordinal of each row as a float, NaN where the date is missing.
+        '''
+
+        dates = DataFrame[column_name].array
+        ordinals = dates.asi8.astype('float64') # Integer month ordinals of the periods.
+        ordinals[dates.isna()] = np.nan # Missing dates are set to NaN.
+        return ordinals
+
+    def months_left_in_term(self, DataFrame: pd.DataFrame):
+
+        '''
+        This method is used to calculate how many months are left in each loan's term after the final payment date in the dataframe.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+
+        Returns:
+            np.ndarray: The number of months between each loan's term end and the final payment date, NaN where it can't be calculated.
+        '''
+
+        final_payment_date = np.nanmax(DataFrameInfo.month_ordinals(self, DataFrame, 'last_payment_date')) # identifies the final payment date.
+        term_end_date = DataFrameInfo.month_ordinals(self, DataFrame, 'issue_date') + DataFrameInfo.term_length_in_months(self, DataFrame) # Term end is the term length after the issue date.
+        return term_end_date - final_payment_date # calculate number of months between term end and final payment date.
+
     def calculate_total_collections_over_period(self, DataFrame: pd.DataFrame, period: int):
         
         '''
@@ -327,42 +545,67 @@ class DataFrameInfo:
             dict: the total collections, loan amount and loan outstanding over the period.
         '''
 
-        collections_df = DataFrame.copy() # Create copy of the dataframe.
+        months_left = DataFrameInfo.months_left_in_term(self, DataFrame)
+        current_loans = months_left > 0 # filter in only current loans.
 
-        final_payment_date = collections_df['last_payment_date'].max() # identifies the final payment date.
+        instalments = DataFrame['instalment'].to_numpy(dtype='float64')[current_loans]
+        collections = instalments * np.minimum(months_left[current_loans], period) # Each loan is collected for the number of months left in its term, up to the projection period.
 
-        def calculate_term_end(row): # Function used to calculate term end according to term length and issue date.
-            if row['term'] == '36 months': # In 36 month terms
-                return row['issue_date'] + 36 # Term end will be 36 months after issue date.
-            elif row['term'] == '60 months': # In 60 month terms
-                return row['issue_date'] + 60 # Term end will be 60 months after issue date.
+        collection_sum = np.nansum(collections)
+        total_loan = DataFrame['loan_amount'][current_loans].sum()
+        total_loan_left = total_loan - DataFrame['total_payment'][current_loans].sum()
 
-        # Apply the function to create the new 'term_end_date' column
-        collections_df['term_end_date'] = collections_df.apply(calculate_term_end, axis=1)
+        return {'total_collections': collection_sum, 'total_loan': total_loan, 'total_loan_outstanding': total_loan_left}
+    
+    def cumulative_instalments_by_month(self, instalments: np.ndarray, months_left: np.ndarray, horizon: int):
 
-        collections_df['mths_left'] = collections_df['term_end_date'] - final_payment_date # calculate number of months between term end and final payment date.
-        collections_df['mths_left'] = collections_df['mths_left'].apply(lambda x: x.n) # Extract integer value from 'mths_left' column.
+        '''
+        This method is used to calculate the cumulative sum of instalments paid at the end of every month up to a horizon, where each loan pays its instalment for the number of months it has left.
+        The instalments are added into a histogram by months left, so every month up to the horizon is calculated in a single pass over the loans.
 
-        collections_df = collections_df[collections_df['mths_left']>0] # filter in only current loans.
+        Parameters:
+            instalments (np.ndarray): The monthly instalment of each loan.
+            months_left (np.ndarray): The number of months each loan has left to pay, loans with 0 or less (or NaN) months left are ignored.
+            horizon (int): The number of months to calculate the cumulative sum for.
 
-        def calculate_collections(row): # Define function to sum collections over projection period.
-            if row['mths_left'] >= period: # If months left in term are equal to or greater than projection period.
-                return row['instalment'] * period #  projection period * Installments.
-            elif row['mths_left'] < period: # If less than projection period months left in term.
-                return row['instalment'] * row['mths_left'] # number of months left * installments.
+        Returns:
+            np.ndarray: The cumulative sum of instalments at the end of each month from 1 to the horizon.
+        '''
 
-        collections_df['collections_over_period'] = collections_df.apply(calculate_collections, axis=1) # Apply method to each row to get total collections in projected perid.
+        paying = (months_left > 0) & ~np.isnan(instalments) # Only loans with months left and a known instalment pay anything.
+        months = np.minimum(months_left[paying], horizon).astype('int64') # Loans with more months left than the horizon pay for every month of the horizon.
+        instalments_by_months_left = np.bincount(months, weights=instalments[paying], minlength=horizon + 1) # Total instalment of the loans with each number of months left.
+        instalments_per_month = instalments_by_months_left[::-1].cumsum()[::-1] # Total instalment paid in each month: loans with at least that many months left.
+        return np.cumsum(instalments_per_month[1:horizon + 1])
 
-        collection_sum = collections_df['collections_over_period'].sum()
-        total_loan = collections_df['loan_amount'].sum()
-        total_loan_left = total_loan - collections_df['total_payment'].sum()
+    def collection_projections(self, DataFrame: pd.DataFrame, period: int):
+
+        '''
+        This method is used to provide projections of the total collections for every period from 1 month up to a number of months in a single pass.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            period (int): The number of months the longest forecast is for.
+
+        Returns:
+            dict: the total collections for each month from 1 to the period (as a list), as well as the loan amount and loan outstanding.
+        '''
+
+        months_left = DataFrameInfo.months_left_in_term(self, DataFrame)
+        current_loans = months_left > 0 # filter in only current loans.
+
+        instalments = DataFrame['instalment'].to_numpy(dtype='float64')
+        collections = DataFrameInfo.cumulative_instalments_by_month(self, instalments, months_left, period)
+
+        total_loan = DataFrame['loan_amount'][current_loans].sum()
+        total_loan_left = total_loan - DataFrame['total_payment'][current_loans].sum()
+
+        return {'total_collections': collections.tolist(), 'total_loan': total_loan, 'total_loan_outstanding': total_loan_left}
 
-        return {'total_collections': collection_sum, 'total_loan': total_loan, 'total_loan_outstanding': total_loan_left}
-    
     def monthly_collection_percentage_projections(self, DataFrame: pd.DataFrame, period: int):
 
         '''
-        This method applies the calculate_total_collections_over_period() method over a range of months and for each month retrieves the percentage of collection out of 1) the total loan amount and 2) the outstanding loan amount.
+        This method projects the collections for every month up to the period and for each month retrieves the percentage of collection out of 1) the total loan amount and 2) the outstanding loan amount.
 
         Parameters:
             DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
@@ -374,25 +617,16 @@ class DataFrameInfo:
                 2) collections as a percentage of outstanding loan amount for each month in period.
         '''
 
-        # Generate empty lists that will contain percentages of collection out of total and outstanding loan.
-        percentage_of_loan = []
-        percentage_of_outstanding = []
+        projections = DataFrameInfo.collection_projections(self, DataFrame, period) # produce a dictionary containing the collections for every month, total loan and outstaniding loan amounts.
 
-        for month in range(1, (period+1)): # For each month in 1-6.
-            projections = DataFrameInfo.calculate_total_collections_over_period(self, DataFrame, period=month) # produce dictionaries containing collection, total loan and outstaniding loan amounts.
-            
-            total_collections = projections['total_collections'] # Extract total collection amount from dictionary.
-            total_loan = projections['total_loan'] # Extract total loan amount from dictionary.
-            total_loan_outstanding = projections['total_loan_outstanding'] # Extract total loan amount outstanding from dictionary.
-            
-            percent_total_loan = DataFrameInfo.calculate_percentage(self, total_collections, total_loan) # Calculate percentage of collections out of total loan.
-            percent_outstanding_loan = DataFrameInfo.calculate_percentage(self, total_collections, total_loan_outstanding) # Calculate percentage of collections out of outstanding loan.
+        total_collections = np.array(projections['total_collections']) # Extract collection amount for each month from dictionary.
+        total_loan = projections['total_loan'] # Extract total loan amount from dictionary.
+        total_loan_outstanding = projections['total_loan_outstanding'] # Extract total loan amount outstanding from dictionary.
 
-            # Add percentages to lists.
-            percentage_of_loan.append(percent_total_loan)
-            percentage_of_outstanding.append(percent_outstanding_loan)
-        
-        return {'total_loan_percent': percentage_of_loan, 'outstanding_loan_percent': percentage_of_outstanding}
+        percentage_of_loan = DataFrameInfo.calculate_percentage(self, total_collections, total_loan) # Calculate percentage of collections out of total loan for each month.
+        percentage_of_outstanding = DataFrameInfo.calculate_percentage(self, total_collections, total_loan_outstanding) # Calculate percentage of collections out of outstanding loan for each month.
+
+        return {'total_loan_percent': percentage_of_loan.tolist(), 'outstanding_loan_percent': percentage_of_outstanding.tolist()}
     
     def count_value_in_column(self, DataFrame: pd.DataFrame, column_name: str, value):
 
@@ -422,49 +656,36 @@ class DataFrameInfo:
             revenue_lost (list): A list which contains the cumulative revenue lost value for each month of the remaining term.
         '''
 
-        df = DataFrame.copy() # Create a copy of dataframe to avoid altering original.
+        term_completed = DataFrameInfo.month_ordinals(self, DataFrame, 'last_payment_date') - DataFrameInfo.month_ordinals(self, DataFrame, 'issue_date') # Calculating how much of each term was completed.
+        term_left = DataFrameInfo.term_length_in_months(self, DataFrame) - term_completed # Term remaining is term length - how much of term was completed.
 
-        df['term_completed'] = (df['last_payment_date'] - df['issue_date']) # Calculating how much of each term was completed.
-        df['term_completed'] = df['term_completed'].apply(lambda x: x.n) # Converting the row into an integer.
+        if not (term_left > 0).any(): # In the case no loans have any of their term left.
+            return []
+        horizon = int(np.nanmax(term_left)) # The maximum number of months left in any term.
 
-        def calculate_term_remaining(row): # Function used to calculate months remaining in term for each row.
-            if row['term'] == '36 months': # In 36 month terms
-                return 36 - row['term_completed'] # Term remaining is term length - how much of term was completed.
-            elif row['term'] == '60 months': # In 60 month terms
-                return 60 - row['term_completed'] # Term remaining is term length - how much of term was completed.
+        revenue_lost = DataFrameInfo.cumulative_instalments_by_month(self, DataFrame['instalment'].to_numpy(dtype='float64'), term_left, horizon) # Cumulatively sum the instalments of the loans with months left in each month.
+        return revenue_lost.tolist()
 
-        df['term_left'] = df.apply(calculate_term_remaining, axis=1) # Applying function to calculate term left for each loan.
-        
-        revenue_lost = [] # Empty list
-        cumulative_revenue_lost = 0
-        for month in range(1, (df['term_left'].max()+1)): # For each month in the maximum number of months left in any term.
-            df = df[df['term_left']>0] # Filter out any terms which have no months left.
-            cumulative_revenue_lost += df['instalment'].sum() # Cumulatively sum the total number of monthly instalments.
-            revenue_lost.append(cumulative_revenue_lost) # Add this cumulative sum to list of revenue projected to be lost.
-            df['term_left'] = df['term_left'] - 1 # Take away one from the number of terms left.
-        
-        return revenue_lost
-
-    def calculate_total_expected_revenue(self, DataFrame: pd.DataFrame):
+    def calculate_total_expected_revenue(self, DataFrame: pd.DataFrame, group_by: list = None):
         
         '''
-        This method is used to calculate the total expected revenue from a dataframe:
+        This method is used to calculate the total expected revenue from a dataframe, the dataframe itself is not altered.
         
         Parameters:
             DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            group_by (list): DEFAULT = None, a column name or list of column names (e.g. ['loan_status', 'grade', 'term']), if provided the expected revenue is totalled for each group in a single groupby pass.
         
         Returns:
-            total_expected_revenue (int): The total expected revenue.
+            total_expected_revenue (float): IF group_by is NOT specified, The total expected revenue.
+            pd.Series: IF group_by is specified, The total expected revenue of each group.
         '''
 
-        def calculate_total_revenue(row): # Function used to calculate total expected revenue for each loan.
-            if row['term'] == '36 months': # In 36 month terms
-                return 36 * row['instalment'] # Number of instalments * value of instalments = Total expected revenue.
-            elif row['term'] == '60 months': # In 60 month terms
-                return 60 * row['instalment'] # Number of instalments * value of instalments = Total expected revenue.
-
-        DataFrame['total_revenue'] = DataFrame.apply(calculate_total_revenue, axis=1)
-        total_expected_revenue = DataFrame['total_revenue'].sum()
+        expected_revenue = DataFrameInfo.term_length_in_months(self, DataFrame) * DataFrame['instalment'].to_numpy(dtype='float64') # Number of instalments * value of instalments = Total expected revenue for each loan.
 
-        return total_expected_revenue
+        if group_by is None: # In the case no grouping columns are provided.
+            return np.nansum(expected_revenue)
 
+        if isinstance(group_by, str): # A single column name is put into a list.
+            group_by = [group_by]
+        expected_revenue = pd.Series(expected_revenue, index=DataFrame.index, name='total_revenue')
+        return expected_revenue.groupby([DataFrame[column] for column in group_by], observed=True).sum() # Only groups that appear in the dataframe are returned.
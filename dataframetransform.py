@@ -1,12 +1,19 @@
+from concurrent.futures import ProcessPoolExecutor
+import time
 import numpy as np
 import pandas as pd
 from scipy import stats
 from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import RobustScaler
-from sklearn.svm import SVC
+from sklearn.model_selection import train_test_split
+# Auxiliary functions:
+from imputationmodels import CLASSIFIER_BACKENDS, fit_and_predict, make_classifier, predict_in_chunks
 # Auxiliary classes:
+from columnregistry import COLUMN_REGISTRY
 from dataframeinfo import DataFrameInfo as info
 from plotter import Plotter as plotter
+from featurematrix import FeatureMatrixBuilder
+from imputationmodelstore import ImputationModelStore
+from transformpipeline import TransformPipeline
 
 
 np.random.seed(123) # To ensure reproducibility, the random seed is set to '123'.
@@ -15,8 +22,24 @@ class DataFrameTransform:
 
     '''
     This class is used to apply transformations to the dataframe in regards to imputing or removing columns with missing data.
+    Removing columns, removing rows and filling nulls can also be chained lazily with pipeline(), which combines them and creates the transformed dataframe once.
     '''
 
+    def pipeline(self, DataFrame: pd.DataFrame):
+
+        '''
+        This method is used to start a chain of transformations on a dataframe, e.g. transform.pipeline(df).remove_null_rows('last_payment_date').fill_median('int_rate').drop_outlier_rows('annual_inc', 3).collect()
+        The transformations are recorded, every row removal is combined into a single mask and the transformed dataframe is only created when collect() is called, so no intermediate copies are made.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which the transformations will be applied, this is not altered.
+
+        Returns:
+            TransformPipeline: The pipeline of transformations.
+        '''
+
+        return TransformPipeline(DataFrame)
+
     def remove_null_columns(self, DataFrame: pd.DataFrame, column_name):
 
         '''
@@ -30,7 +53,7 @@ class DataFrameTransform:
             DataFrame (pd.DataFrame): The updated dataframe.
         '''
 
-        DataFrame.drop(column_name, axis=1, inplace=True)
+        DataFrame = DataFrame.drop(column_name, axis=1) # The result is assigned back like the fills, so the dataframe passed in is not altered.
         return DataFrame
 
     def remove_null_rows(self, DataFrame: pd.DataFrame, column_name):
@@ -45,7 +68,9 @@ class DataFrameTransform:
         Returns:
             DataFrame (pd.DataFrame): The updated dataframe.
         '''
-        DataFrame.dropna(subset=column_name, inplace=True)
+
+        DataFrame = DataFrame.dropna(subset=column_name).copy(deep=False) # The result is assigned back, so the dataframe passed in is not altered.
+        # The rows are already copied by dropna(), the shallow copy only marks the result as a dataframe of its own, so later fills don't warn about assigning to a slice.
         return DataFrame
     
     def fill_median(self, DataFrame: pd.DataFrame, column_name):
@@ -61,7 +86,7 @@ class DataFrameTransform:
             DataFrame (pd.DataFrame): The updated dataframe.
         '''
 
-        DataFrame[column_name].fillna(DataFrame[column_name].median(numeric_only=True), inplace=True)
+        DataFrame[column_name] = DataFrame[column_name].fillna(DataFrame[column_name].median(numeric_only=True)) # The filled column is assigned back, as filling a selected column in place does not alter the dataframe under copy-on-write.
         return DataFrame
     
     def fill_mean(self, DataFrame: pd.DataFrame, column_name):
@@ -77,10 +102,55 @@ class DataFrameTransform:
             DataFrame (pd.DataFrame): The updated dataframe.
         '''
 
-        DataFrame[column_name].fillna(DataFrame[column_name].mean(numeric_only=True, skipna=True), inplace=True)
+        DataFrame[column_name] = DataFrame[column_name].fillna(DataFrame[column_name].mean(numeric_only=True, skipna=True)) # The filled column is assigned back.
         return DataFrame
     
-    def linear_regression_fill(self, DataFrame: pd.DataFrame, column_to_fill: str, training_features: list = None, score: bool = False, check_distribution: bool = False):
+    def complete_columns(self, DataFrame: pd.DataFrame):
+
+        '''
+        This method is used to get the columns with no null values, which are the default training features of the imputation models.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+
+        Returns:
+            list: The names of the columns with no nulls, in the order of the dataframe.
+        '''
+
+        null_columns = info.get_null_columns(self, DataFrame)
+        return [column for column in DataFrame.columns if column not in null_columns]
+
+    def training_data(self, DataFrame: pd.DataFrame, column_to_fill: str, training_features: list = None, feature_builder: FeatureMatrixBuilder = None):
+
+        '''
+        This method is used to get the training features and target column used to impute a column, with string and date columns encoded as numerical codes.
+        The features are built by a FeatureMatrixBuilder() as a contiguous 'float32' matrix, passing the same builder when imputing several columns means each feature column is only encoded once.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            column_to_fill (str): The name of the column which will have null values imputed.
+            training_features (list): list of columns to use as training features in the model (the default uses all non-null columns).
+            feature_builder (FeatureMatrixBuilder): DEFAULT = None, the builder of the feature matrix, it is reset if it was built from a different dataframe (the default creates a new builder).
+
+        Returns:
+            x (np.ndarray): The encoded training features, with a row for each row of the dataframe.
+            y (pd.Series): The target column.
+        '''
+
+        if feature_builder is None: # In the case no builder is provided.
+            feature_builder = FeatureMatrixBuilder(DataFrame)
+        elif feature_builder.DataFrame is not DataFrame: # In the case the builder encoded a different dataframe.
+            feature_builder.reset(DataFrame)
+
+        if training_features == None: # In the case no training features are provided.
+            training_features = DataFrameTransform.complete_columns(self, DataFrame) # Only uses columns with no nulls for training.
+        y = DataFrame[column_to_fill] # Identify target column.
+
+        # String, categorical and date columns are encoded as numerical codes to be compatible with model.
+        x = feature_builder.matrix(training_features)
+        return x, y
+
+    def linear_regression_fill(self, DataFrame: pd.DataFrame, column_to_fill: str, training_features: list = None, score: bool = False, check_distribution: bool = False, feature_builder: FeatureMatrixBuilder = None, model_store: ImputationModelStore = None, chunk_size: int = 100000, prediction_workers: int = 1):
         
         '''
         This method is used to impute null values in a numerical column based on a linear regression model that ignores other null columns.
@@ -91,6 +161,10 @@ class DataFrameTransform:
             training_features (list): list of columns to use as training features in the model (the default uses all non-null columns).
             score (bool): a boolean value that indicates whether the model accuracy score should be computed.
             check_distribution (bool): a boolean value that determines whether the histogram distribution of the data in the target column from before and after this method should be printed.
+            feature_builder (FeatureMatrixBuilder): DEFAULT = None, a builder of the feature matrix to reuse the encoded columns of, the imputed values are written through it (the default encodes the features again).
+            model_store (ImputationModelStore): DEFAULT = None, a store of saved models, the saved model of this column is reused if it was trained on the same data and the trained model is saved (the default trains a new model and doesn't save it).
+            chunk_size (int): DEFAULT = 100000, the number of null rows predicted at a time, which bounds the memory used by the model when predicting.
+            prediction_workers (int): DEFAULT = 1, the number of threads predicting chunks at the same time.
 
         Returns:
             DataFrame (pd.DataFrame): The updated dataframe.
@@ -100,36 +174,30 @@ class DataFrameTransform:
             print(f'\n({column_to_fill}) Initial Distribution:\n')
             plotter.histogram(self, DataFrame, column_to_fill) # Plots histogram to display distribution before method is applied.
 
-        if training_features == None: # In the case no training features are provided.
-            x = DataFrame.drop(info.get_null_columns(self, DataFrame), axis=1) # Only uses columns with no nulls for training.
-        else:  # In the case training features are provided.
-            x = DataFrame[training_features] # Using provided list for training.
-        y = DataFrame[column_to_fill] # Identify target column.
-
-        # Encode string columns to numeric type to be compatible with model.
-        object_columns = x.select_dtypes(include=['object']).columns.tolist() # Adds all columns with 'object' as their data type into a list.
-        x[object_columns] = x[object_columns].astype('category') # Changes the data type of the columns in this list to 'category'.
-        x[object_columns] = x[object_columns].apply(lambda x: x.cat.codes) # Converts these categories into numerical codes.
-
-        # Encode date columns to numeric type to be compatible with model.
-        date_columns = x.select_dtypes(include=['period[M]']).columns.tolist() # Adds all columns with 'period [M]' as their data type into a list.
-        x[date_columns] = x[date_columns].astype('category') # Changes the data type of the columns in this list to 'category'.
-        x[date_columns] = x[date_columns].apply(lambda x: x.cat.codes) # Converts these categories into numerical codes.
+        feature_builder = FeatureMatrixBuilder(DataFrame) if feature_builder is None else feature_builder # The builder writes the imputed values.
+        if model_store is not None: # The saved model is identified by the training features and their encodings.
+            training_features = DataFrameTransform.complete_columns(self, DataFrame) if training_features == None else training_features
+        x, y = DataFrameTransform.training_data(self, DataFrame, column_to_fill, training_features, feature_builder) # Encoded training features and target column.
+        known = y.notna().to_numpy() # True where the target column value is known.
 
         # Data Split
-        x_train = x[~y.isna()] # Training input data: all columns except target column where target column values are known (not null).
-        y_train = y[~y.isna()] # Training output data: all non null (known) values in target column.
+        x_train = x[known] # Training input data: all columns except target column where target column values are known (not null).
+        y_train = y[known] # Training output data: all non null (known) values in target column.
 
-        x_test = x[y.isna()] # Testing input data: all columns except target column where target column values are not known (null).
+        x_test = x[~known] # Testing input data: all columns except target column where target column values are not known (null).
         # This will be input into the model to impute null values.
 
         # Train Linear Regression Model:
-        model = LinearRegression()
-        model.fit(x_train, y_train)
+        if model_store is not None: # The saved model is loaded if it was trained on the same data.
+            model = model_store.fit(column_to_fill, 'linear_regression', training_features, feature_builder.categories, x_train, y_train)
+        else:
+            model = LinearRegression()
+            model.fit(x_train, y_train)
 
         # Run model and impute null values with predicted values:
-        prediction = model.predict(x_test)
-        DataFrame[column_to_fill].loc[y.isna()] = prediction # Where values in target column are null, impute the model's predicted value.
+        prediction = predict_in_chunks(model, x_test, chunk_size, prediction_workers)
+        feature_builder.write_column(column_to_fill, ~known, prediction) # Where values in target column are null, impute the model's predicted value.
+        # The encoding of the imputed column is updated with them, so it can be used as a feature for the next column.
         
         if check_distribution == True:
             print(f'\n({column_to_fill}) Final Distribution:\n')
@@ -140,10 +208,12 @@ class DataFrameTransform:
 
         return DataFrame
 
-    def support_vector_machine_fill(self, DataFrame: pd.DataFrame, column_to_fill: str, training_features: list = None, score: bool = False, check_distribution: bool = False):
+    def support_vector_machine_fill(self, DataFrame: pd.DataFrame, column_to_fill: str, training_features: list = None, score: bool = False, check_distribution: bool = False, backend: str = 'svc', feature_builder: FeatureMatrixBuilder = None, model_store: ImputationModelStore = None, chunk_size: int = 100000, prediction_workers: int = 1):
         
         '''
         This method is used to impute null values in a categorical column based on a support vector machine (SVM) model that ignores other null columns.
+        The kernel SVM ('svc') is trained on a sample of the known rows, as its fit time grows faster than the number of rows. The scalable backends ('linear_svm', 'kernel_approximation' and 'gradient_boosting') are trained on every known row.
+        The features are scaled inside the model (see imputationmodels.make_classifier()).
 
         Parameters:
             DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
@@ -151,6 +221,11 @@ class DataFrameTransform:
             training_features (list): list of columns to use as training features in the model (the default uses all non-null columns).
             score (bool): a boolean value that indicates whether the model accuracy score should be computed.
             check_distribution (bool): a boolean value that determines whether the normalised value count of the data in the target column from before and after this method should be printed.
+            backend (str): DEFAULT = 'svc', the classifier to use: 'svc', 'linear_svm', 'kernel_approximation' or 'gradient_boosting'.
+            feature_builder (FeatureMatrixBuilder): DEFAULT = None, a builder of the feature matrix to reuse the encoded columns of, the imputed values are written through it (the default encodes the features again).
+            model_store (ImputationModelStore): DEFAULT = None, a store of saved models, the saved model of this column is reused if it was trained on the same data and the trained model is saved (the default trains a new model and doesn't save it).
+            chunk_size (int): DEFAULT = 100000, the number of null rows predicted at a time, which bounds the memory used by the model when predicting.
+            prediction_workers (int): DEFAULT = 1, the number of threads predicting chunks at the same time.
 
         Returns:
             DataFrame (pd.DataFrame): The updated dataframe.
@@ -159,47 +234,35 @@ class DataFrameTransform:
         if check_distribution == True:
             initial_distribution = DataFrame[column_to_fill].value_counts(normalize=True) # Stores the normalized value count (distribution of data) into a variable.
 
-        if training_features == None: # In the case no training features are provided.
-            x = DataFrame.drop(info.get_null_columns(self, DataFrame), axis=1) # Only uses columns with no nulls for training.
-        else: # In the case training features are provided.
-            x = DataFrame[training_features] # Using provided list for training.
-        y = DataFrame[column_to_fill]  # Identify target column.
-
-        # Encode string columns to numeric type to be compatible with model.
-        object_columns = x.select_dtypes(include=['object']).columns.tolist() # Adds all columns with 'object' as their data type into a list.
-        x[object_columns] = x[object_columns].astype('category') # Changes the data type of the columns in this list to 'category'.
-        x[object_columns] = x[object_columns].apply(lambda x: x.cat.codes) # Converts these categories into numerical codes.
-
-        # Encode date columns to numeric type to be compatible with model.
-        date_columns = x.select_dtypes(include=['period[M]']).columns.tolist() # Adds all columns with 'period [M]' as their data type into a list.
-        x[date_columns] = x[date_columns].astype('category') # Changes the data type of the columns in this list to 'category'.
-        x[date_columns] = x[date_columns].apply(lambda x: x.cat.codes) # Converts these categories into numerical codes.
-
-        # Scaling data for run time optimisation.
-        scaler = RobustScaler()
-        transformer = scaler.fit(x)
-        transformer.transform(x)
+        feature_builder = FeatureMatrixBuilder(DataFrame) if feature_builder is None else feature_builder # The builder writes the imputed values.
+        if model_store is not None: # The saved model is identified by the training features and their encodings.
+            training_features = DataFrameTransform.complete_columns(self, DataFrame) if training_features == None else training_features
+        x, y = DataFrameTransform.training_data(self, DataFrame, column_to_fill, training_features, feature_builder) # Encoded training features and target column.
+        known = y.notna().to_numpy() # True where the target column value is known.
 
         # Data Split:
-        sample_size = (DataFrame[column_to_fill].isna().sum()) * 4 # To keep a 80:20 split between training data and testing data size,
-        # the sample of training data is set to 4 times the size of testing (missing) data.
-        if sample_size < 10000:
-            sample_size = 10000 # If the training sample is less than 10,000, then it is set to 10,000 for accurate training.
-        x_train = x[~y.isna()].sample(sample_size, random_state=123)# Training input data: all columns except target column where target column values are known (not null).
-        # A random sample of at least 10,000 of these training data points are selected to optimise run time.
-        # The random state parameter ensures every time this method is run it uses the exact same sample, for reproducibility.
-        y_train = y[x.index.isin(x_train.index)] # Training output data: all non null (known) values in target column that correspond to x_train sample.
-
-        x_test = x[y.isna()] # Testing input data: all columns except target column where target column values are not known (null).
+        if backend == 'svc': # The kernel SVM is trained on a sample to optimise run time.
+            sample = DataFrameTransform.svc_training_sample(self, known)
+            x_train = x[sample] # Training input data: all columns except target column for the sampled rows.
+            y_train = y.iloc[sample] # Training output data: the known values in target column of the same rows, in the same order as x_train.
+        else: # The scalable backends are trained on every known value.
+            x_train = x[known]
+            y_train = y[known]
+
+        x_test = x[~known] # Testing input data: all columns except target column where target column values are not known (null).
         # This will be input into the model to impute null values.
 
-        # Train SVM model
-        model = SVC()
-        model.fit(x_train, y_train)
+        # Train the model, the features are scaled within the model:
+        if model_store is not None: # The saved model is loaded if it was trained on the same data, or warm started if only the data changed.
+            model = model_store.fit(column_to_fill, backend, training_features, feature_builder.categories, x_train, y_train)
+        else:
+            model = make_classifier(backend)
+            model.fit(x_train, y_train)
 
         # Run model and impute null values with predicted values:
-        prediction = model.predict(x_test)
-        DataFrame[column_to_fill].loc[y.isna()] = prediction # Where values in target column are null, impute the model's predicted value.
+        prediction = predict_in_chunks(model, x_test, chunk_size, prediction_workers)
+        feature_builder.write_column(column_to_fill, ~known, prediction) # Where values in target column are null, impute the model's predicted value.
+        # The encoding of the imputed column is updated with them, so it can be used as a feature for the next column.
 
         if check_distribution == True:
             final_distribution = DataFrame[column_to_fill].value_counts(normalize=True) # Stores the normalized value count (distribution of data) after method into a variable.
@@ -212,6 +275,144 @@ class DataFrameTransform:
         
         return DataFrame
     
+    def svc_training_sample(self, known: np.ndarray):
+
+        '''
+        This method is used to choose the rows the kernel SVM is trained on, as its fit time grows faster than the number of rows.
+
+        Parameters:
+            known (np.ndarray): True for each row where the target column value is known.
+
+        Returns:
+            np.ndarray: The positions of the sampled rows.
+        '''
+
+        sample_size = (~known).sum() * 4 # To keep a 80:20 split between training data and testing data size,
+        # the sample of training data is set to 4 times the size of testing (missing) data.
+        if sample_size < 10000:
+            sample_size = 10000 # If the training sample is less than 10,000, then it is set to 10,000 for accurate training.
+        sample_size = min(sample_size, known.sum()) # The sample can't be larger than the number of known values.
+        # A random sample of at least 10,000 of the rows where target column values are known (not null) are selected to optimise run time.
+        # The random state parameter ensures every time this method is run it uses the exact same sample, for reproducibility.
+        return pd.Series(np.flatnonzero(known)).sample(sample_size, random_state=123).to_numpy()
+
+    def imputation_order(self, DataFrame: pd.DataFrame, models: dict, training_features: dict = None):
+
+        '''
+        This method is used to find the training features of each column to impute and the order the columns can be imputed in.
+        A column that is a training feature of another column must be imputed first, columns that don't depend on each other are put in the same level and can be imputed at the same time.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            models (dict): The model type of each column to impute ('linear_regression' or a classifier backend, e.g. 'svc').
+            training_features (dict): DEFAULT = None, the list of training features of each column, columns that are not included use every column with no nulls.
+
+        Raises:
+            ValueError if the columns depend on each other in a cycle.
+
+        Returns:
+            features (dict): The training features of each column.
+            levels (list): Lists of columns, each level only depends on the columns of earlier levels.
+        '''
+
+        training_features = {} if training_features is None else training_features
+        complete_columns = DataFrameTransform.complete_columns(self, DataFrame)
+        features = {column: list(training_features.get(column) or complete_columns) for column in models}
+        dependencies = {column: {feature for feature in features[column] if feature in models and feature != column} for column in models} # Columns to impute that are features of this column.
+
+        levels = []
+        remaining = dict(dependencies)
+        while len(remaining) > 0: # Each level contains the columns whose dependencies have all been imputed.
+            level = [column for column, depends_on in remaining.items() if len(depends_on & set(remaining)) == 0]
+            if len(level) == 0: # In the case no column can be imputed.
+                raise ValueError(f"The columns {list(remaining)} depend on each other, so they can't be imputed in order.")
+            levels.append(level)
+            for column in level:
+                del remaining[column]
+        return features, levels
+
+    def batch_impute(self, DataFrame: pd.DataFrame, models: dict, training_features: dict = None, max_workers: int = None, feature_builder: FeatureMatrixBuilder = None, model_store: ImputationModelStore = None):
+
+        '''
+        This method is used to impute the null values of several columns at once, fitting the models of independent columns at the same time in a pool of processes.
+        Columns are imputed in the order found by imputation_order(), the imputed values of a column are written through the feature builder and used as features by the columns in later levels.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            models (dict): The model type of each column to impute: 'linear_regression' for numeric columns, or 'svc', 'linear_svm', 'kernel_approximation' or 'gradient_boosting' for categorical columns.
+            training_features (dict): DEFAULT = None, the list of training features of each column, columns that are not included use every column with no nulls.
+            max_workers (int): DEFAULT = None, the number of processes (the default uses one for each core).
+            feature_builder (FeatureMatrixBuilder): DEFAULT = None, a builder of the feature matrices to reuse the encoded columns of (the default creates a new builder).
+            model_store (ImputationModelStore): DEFAULT = None, a store of saved models, each column's saved model is reused if it was trained on the same data and the trained models are saved (the default trains new models and doesn't save them).
+                The models are loaded and saved in the worker processes, so the counts of the store are not updated.
+
+        Raises:
+            ValueError if a model type is not recognised.
+
+        Returns:
+            DataFrame (pd.DataFrame): The updated dataframe.
+        '''
+
+        for column, model_type in models.items(): # Checks every model type before any model is trained.
+            if model_type != 'linear_regression' and model_type not in CLASSIFIER_BACKENDS:
+                raise ValueError(f"'{model_type}' is not a model type, please use 'linear_regression' or one of {list(CLASSIFIER_BACKENDS)}.")
+        features, levels = DataFrameTransform.imputation_order(self, DataFrame, models, training_features)
+        if feature_builder is None or feature_builder.DataFrame is not DataFrame: # In the case no builder of this dataframe is provided.
+            feature_builder = FeatureMatrixBuilder(DataFrame)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for level in levels: # Columns in a level are trained at the same time.
+                futures = {}
+                for column in level:
+                    known = DataFrame[column].notna().to_numpy() # True where the column value is known.
+                    train_rows = DataFrameTransform.svc_training_sample(self, known) if models[column] == 'svc' else np.flatnonzero(known)
+                    x_train = feature_builder.matrix(features[column], train_rows)
+                    x_test = feature_builder.matrix(features[column], ~known)
+                    y_train = DataFrame[column].iloc[train_rows].to_numpy()
+                    categories = {feature: feature_builder.categories[feature] for feature in features[column] if feature in feature_builder.categories} # The encodings of the features identify the saved model.
+                    futures[column] = (known, executor.submit(fit_and_predict, models[column], x_train, y_train, x_test, model_store, column, features[column], categories))
+
+                for column, (known, future) in futures.items(): # Once the level is trained, the imputed values are used as features for the next level.
+                    feature_builder.write_column(column, ~known, future.result()) # Written the same way as by the single column methods, so the column keeps the same data type.
+        return DataFrame
+
+    def compare_classifier_backends(self, DataFrame: pd.DataFrame, column_to_fill: str, training_features: list = None, backends: list = None, test_size: float = 0.2):
+
+        '''
+        This method is used to compare the accuracy and fit time of the classifier backends of support_vector_machine_fill() on a categorical column.
+        The known values of the column are split into training and test rows, each backend is trained as it would be by support_vector_machine_fill() (the 'svc' backend on a sample of the training rows) and its accuracy is measured on the test rows.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            column_to_fill (str): The name of the categorical column.
+            training_features (list): list of columns to use as training features in the model (the default uses all non-null columns).
+            backends (list): DEFAULT = None, the backends to compare (the default compares every backend).
+            test_size (float): DEFAULT = 0.2, the proportion of the known values used to measure accuracy.
+
+        Returns:
+            pd.DataFrame: The 'training_rows', 'fit_time' (seconds) and 'accuracy' of each backend.
+        '''
+
+        backends = list(CLASSIFIER_BACKENDS) if backends is None else backends
+        x, y = DataFrameTransform.training_data(self, DataFrame, column_to_fill, training_features)
+        known = y.notna().to_numpy()
+        x_train, x_test, y_train, y_test = train_test_split(x[known], y[known], test_size=test_size, random_state=123)
+
+        results = {}
+        for backend in backends: # For each backend, train the model and measure its accuracy.
+            if backend == 'svc': # The kernel SVM is trained on a sample as in support_vector_machine_fill().
+                sample_size = min(max(DataFrame[column_to_fill].isna().sum() * 4, 10000), len(x_train))
+                sample = pd.Series(np.arange(len(x_train))).sample(sample_size, random_state=123).to_numpy()
+                backend_x_train, backend_y_train = x_train[sample], y_train.iloc[sample]
+            else:
+                backend_x_train, backend_y_train = x_train, y_train
+            model = make_classifier(backend)
+            start_time = time.perf_counter()
+            model.fit(backend_x_train, backend_y_train)
+            fit_time = time.perf_counter() - start_time
+            results[backend] = {'training_rows': len(backend_x_train), 'fit_time': round(fit_time, 2), 'accuracy': round(model.score(x_test, y_test), 3)}
+        return pd.DataFrame.from_dict(results, orient='index')
+
     def box_cox_transform(self, DataFrame: pd.DataFrame, column_name: str):
 
         '''
@@ -256,14 +457,19 @@ class DataFrameTransform:
             column_name(str) : The name of the column which will be transformed.
             z_score_threshold (int)
 
+        Raises:
+            ValueError if the column data type is not numeric.
+
         Returns:
             DataFrame (pd.DataFrame): The transformed dataframe.
         '''
 
+        if column_name not in COLUMN_REGISTRY.numeric_columns(DataFrame): # In the case the column is not numeric.
+            raise ValueError(f"The '{column_name}' column is not numerical datatype.")
         mean = np.mean(DataFrame[column_name]) # Identify the mean of the column.
         std = np.std(DataFrame[column_name]) # Identify the standard deviation of the column.
         z_scores = (DataFrame[column_name] - mean) / std # Identofy the 'z score' for each value in the column.
         abs_z_scores = pd.Series(abs(z_scores)) # Create a series with the absolute values of the 'z_score' stored.
         mask = abs_z_scores < z_score_threshold
-        DataFrame = DataFrame[mask] # Only keep rows where the 'z score' is below the threshold.        
+        DataFrame = DataFrame[mask].copy(deep=False) # Only keep rows where the 'z score' is below the threshold, marked as a dataframe of its own as in remove_null_rows().
         return DataFrame
\ No newline at end of file
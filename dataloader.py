@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+
+# The declared data types of the 'loan_payments' columns.
+LOAN_SCHEMA = {
+    'categories': ['term', 'grade', 'sub_grade', 'employment_length', 'home_ownership', 'verification_status', 'loan_status', 'payment_plan', 'purpose', 'application_type'], # Low cardinality string columns.
+    'dates': ['issue_date', 'earliest_credit_line', 'last_payment_date', 'next_payment_date', 'last_credit_pull_date'], # Month resolution date columns.
+    'date_format': None # The format of the date strings (e.g. '%b-%Y'), if None the format is inferred.
+}
+
+class DataLoader:
+
+    '''
+    This class is used to load the 'loan_payments' data with optimised data types before it is transformed, to reduce the memory it occupies.
+    A declared schema is applied as the data is read: numeric columns are downcast to the smallest data type that holds their values, enumerated string columns are made categorical and date columns are parsed to 'period[M]'.
+    '''
+
+    def optimise_dtypes(self, DataFrame: pd.DataFrame, schema: dict = None, downcast_floats: bool = True, report: bool = False):
+
+        '''
+        This method is used to apply the declared schema to a dataframe.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            schema (dict): DEFAULT = None, a dictionary with the 'categories' and 'dates' columns and the 'date_format' (the default uses LOAN_SCHEMA), columns in the schema that are not in the dataframe are ignored.
+            downcast_floats (bool): DEFAULT = True, if True float columns are downcast to 'float32' when every value is unchanged by the conversion, this halves their memory. Columns that would lose precision (e.g. money amounts with more than around 7 significant figures) are kept as 'float64'.
+            report (bool): DEFAULT = False, if True the memory used by the dataframe before and after is printed.
+
+        Returns:
+            DataFrame (pd.DataFrame): A new dataframe with the optimised data types.
+        '''
+
+        schema = LOAN_SCHEMA if schema is None else schema
+        memory_before = DataFrame.memory_usage(deep=True).sum()
+        DataFrame = DataFrame.copy() # Create a copy of the dataframe to avoid altering original.
+
+        for column in DataFrame.columns: # For each column in the dataframe.
+            if column in schema.get('categories', []): # Enumerated string columns are stored as integer codes with a single copy of each string.
+                DataFrame[column] = DataFrame[column].astype('category')
+            elif column in schema.get('dates', []): # Date columns are parsed to 'period[M]'.
+                if not isinstance(DataFrame[column].dtype, pd.PeriodDtype): # Columns that are already dates are left as they are.
+                    DataFrame[column] = pd.to_datetime(DataFrame[column], format=schema.get('date_format'), errors='coerce').dt.to_period('M')
+            elif DataFrame[column].dtype.kind == 'i': # Integer columns are downcast to the smallest integer type.
+                DataFrame[column] = pd.to_numeric(DataFrame[column], downcast='integer')
+            elif DataFrame[column].dtype.kind == 'f' and downcast_floats == True: # Float columns are downcast to 'float32' if no value loses precision.
+                values = DataFrame[column].to_numpy()
+                downcast = values.astype('float32')
+                if np.array_equal(downcast.astype(values.dtype), values, equal_nan=True):
+                    DataFrame[column] = downcast
+
+        if report == True:
+            DataLoader.print_memory_report(self, memory_before, DataFrame.memory_usage(deep=True).sum())
+        return DataFrame
+
+    def load_csv(self, file_path: str, schema: dict = None, chunk_size: int = 100000, downcast_floats: bool = True, report: bool = False, **read_csv_kwargs):
+
+        '''
+        This method is used to load a csv file with the declared schema applied as it is read.
+        The file is read in chunks which are each optimised before the next is read, so the un-optimised data is never held in memory all at once.
+
+        Parameters:
+            file_path (str): The path of the csv file.
+            schema (dict): DEFAULT = None, a dictionary with the 'categories' and 'dates' columns and the 'date_format' (the default uses LOAN_SCHEMA).
+            chunk_size (int): DEFAULT = 100000, the number of rows read at a time.
+            downcast_floats (bool): DEFAULT = True, if True float columns are downcast to 'float32' when no value loses precision.
+            report (bool): DEFAULT = False, if True the memory the data would use with the default data types and the memory it uses after optimisation are printed.
+            **read_csv_kwargs: Any other keyword arguments are passed to pd.read_csv() (e.g. index_col='id').
+
+        Returns:
+            DataFrame (pd.DataFrame): The loaded dataframe with optimised data types.
+        '''
+
+        memory_before = 0
+        chunks = []
+        for chunk in pd.read_csv(file_path, chunksize=chunk_size, **read_csv_kwargs): # For each chunk of rows in the file.
+            memory_before += chunk.memory_usage(deep=True).sum() # Memory this chunk uses with the default data types.
+            chunks.append(DataLoader.optimise_dtypes(self, chunk, schema=schema, downcast_floats=downcast_floats))
+
+        if len(chunks) == 0: # In the case the file contains no rows.
+            return pd.read_csv(file_path, **read_csv_kwargs)
+
+        # Chunks can contain different categories, so every chunk is given the union of categories for the column to be concatenated as a category.
+        for column in chunks[0].columns:
+            if isinstance(chunks[0][column].dtype, pd.CategoricalDtype):
+                categories = pd.Index(sorted(set().union(*[chunk[column].cat.categories for chunk in chunks])))
+                for chunk in chunks:
+                    chunk[column] = chunk[column].cat.set_categories(categories)
+        DataFrame = pd.concat(chunks)
+
+        if report == True:
+            DataLoader.print_memory_report(self, memory_before, DataFrame.memory_usage(deep=True).sum())
+        return DataFrame
+
+    def print_memory_report(self, memory_before: int, memory_after: int):
+
+        '''
+        This method is used to print the memory used by a dataframe before and after its data types were optimised.
+
+        Parameters:
+            memory_before (int): The memory in bytes before optimisation.
+            memory_after (int): The memory in bytes after optimisation.
+        '''
+
+        print(f'Memory before: {round(memory_before / 1024**2, 1)} MB')
+        print(f'Memory after: {round(memory_after / 1024**2, 1)} MB ({round(memory_before / memory_after, 1)} times smaller)')
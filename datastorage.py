@@ -0,0 +1,119 @@
+import os
+import tempfile
+import time
+import pandas as pd
+
+
+class DataStorage:
+
+    '''
+    This class is used to save and load the versions of the 'loan_payments' data at each stage of the EDA in the columnar Parquet format.
+    Unlike csv files, Parquet files keep the data types of the columns, so 'period[M]' dates, categories and nullable integers are loaded back as they were saved, without re-parsing text.
+
+    Attributes:
+        directory (str): the folder in which the Parquet files are stored.
+        compression (str): the compression codec used when writing the Parquet files.
+    '''
+
+    def __init__(self, directory: str = 'loan_payments_versions', compression: str = 'zstd'):
+
+        '''
+        This method is used to initialise this instance of the DataStorage class.
+
+        Parameters:
+            directory (str): DEFAULT = 'loan_payments_versions', the folder in which the Parquet files are stored.
+            compression (str): DEFAULT = 'zstd', the compression codec used when writing the Parquet files (e.g. 'snappy', 'gzip', 'zstd' or None).
+        '''
+
+        self.directory = directory
+        self.compression = compression
+
+    def stage_path(self, stage: str):
+
+        '''
+        This method is used to get the path of the Parquet file for a stage of the EDA.
+
+        Parameters:
+            stage (str): The name of the stage (e.g. 'loan_payments_post_null_imputation').
+
+        Returns:
+            (str): the path of the Parquet file.
+        '''
+
+        return os.path.join(self.directory, f'{stage}.parquet')
+
+    def save_stage(self, DataFrame: pd.DataFrame, stage: str):
+
+        '''
+        This method is used to save the dataframe at a stage of the EDA into a compressed Parquet file, keeping the data types and index of the dataframe.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe that will be saved.
+            stage (str): The name of the stage (e.g. 'loan_payments_post_null_imputation').
+
+        Returns:
+            (str): the path of the Parquet file that was written.
+        '''
+
+        os.makedirs(self.directory, exist_ok=True) # Creates the folder if it does not already exist.
+        path = self.stage_path(stage)
+        DataFrame.to_parquet(path, engine='pyarrow', compression=self.compression)
+        return path
+
+    def load_stage(self, stage: str, columns: list = None):
+
+        '''
+        This method is used to load the dataframe at a stage of the EDA from its Parquet file.
+
+        Parameters:
+            stage (str): The name of the stage (e.g. 'loan_payments_post_null_imputation').
+            columns (list): DEFAULT = None, the columns that will be loaded, only these columns are read from the file (the default loads every column).
+
+        Raises:
+            FileNotFoundError if the stage has not been saved.
+
+        Returns:
+            (pd.DataFrame): the dataframe with the data types it was saved with.
+        '''
+
+        path = self.stage_path(stage)
+        if not os.path.exists(path): # In the case the stage has not been saved.
+            raise FileNotFoundError(f"No saved data for stage '{stage}' at '{path}'.")
+        return pd.read_parquet(path, engine='pyarrow', columns=columns)
+
+    def compare_with_csv(self, DataFrame: pd.DataFrame, columns: list = None, repeats: int = 3):
+
+        '''
+        This method is used to compare the file size and load time of the dataframe saved as csv against Parquet.
+        Both files are written to a temporary folder so the saved stages are not altered.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe that will be compared.
+            columns (list): DEFAULT = None, the columns that will be loaded when timing the load (the default loads every column).
+            repeats (int): DEFAULT = 3, the number of times each file is loaded, the fastest load time is reported.
+
+        Returns:
+            (pd.DataFrame): the file size in megabytes and load time in seconds for each format.
+        '''
+
+        results = {}
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            csv_path = os.path.join(temporary_directory, 'data.csv')
+            parquet_path = os.path.join(temporary_directory, 'data.parquet')
+            DataFrame.to_csv(csv_path, encoding='utf-8')
+            DataFrame.to_parquet(parquet_path, engine='pyarrow', compression=self.compression)
+
+            loaders = {
+                'csv': lambda: pd.read_csv(csv_path, index_col=0, usecols=None if columns is None else [0] + [DataFrame.columns.get_loc(column) + 1 for column in columns]),
+                'parquet': lambda: pd.read_parquet(parquet_path, engine='pyarrow', columns=columns)
+            }
+            for file_format, loader in loaders.items(): # For each file format.
+                load_times = []
+                for _ in range(repeats):
+                    start = time.perf_counter()
+                    loader()
+                    load_times.append(time.perf_counter() - start)
+                path = csv_path if file_format == 'csv' else parquet_path
+                results[file_format] = {'file_size_mb': os.path.getsize(path) / 1024**2, 'load_time_s': min(load_times)}
+
+        return pd.DataFrame(results).T
@@ -1,12 +1,37 @@
+import json
+import os
+import re
+import numpy as np
 import pandas as pd
 
 
+# Formats tried, in order, when the format of a date column is not provided.
+# Month first is tried before day first, so ambiguous dates (e.g. '01/02/2020') are parsed as January like pd.to_datetime() does.
+DATE_FORMATS = ['%b-%Y', '%B-%Y', '%b %Y', '%B %Y', '%Y-%m', '%m/%Y', '%m-%Y', '%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']
+
+
 class DataTransform:
 
     '''
     This class is used to apply transformations to columns within the data.
+    Transformations can be applied one column at a time with the methods below, or to many columns at once from a declarative spec with apply_transform_spec().
+
+    Attributes:
+        compiled_patterns (dict): the compiled regular expressions used by transform specs, keyed by pattern, so each is only compiled once.
+        transformed_columns (dict): the operations, a fingerprint and the result of each column transformed by apply_transform_spec(), used to skip columns that have not been replaced since.
+        date_cache (dict): the period parsed from each date string, for each date format, so each string is only parsed once.
     '''
 
+    def __init__(self):
+
+        '''
+        This method is used to initialise this instance of the DataTransform class.
+        '''
+
+        self.compiled_patterns = {}
+        self.transformed_columns = {}
+        self.date_cache = {}
+
     def extract_integer_from_string(self, DataFrame: pd.DataFrame, column_name: str):
 
         '''
@@ -20,8 +45,9 @@ class DataTransform:
             DataFrame (pd.DataFrame): The updated DataFrame.
         '''
 
-        DataFrame[column_name] = DataFrame[column_name].str.extract('(\d+)').astype('Int32') # The first method extracts any digits from the string in the desired column
+        extract_integer = lambda values: values.str.extract(r'(\d+)', expand=False).astype('Int32') # The first method extracts any digits from the string in the desired column
         # the second method casts the digits into the 'Int32' data type, this is because this type of integer is a nullable type of integer.
+        DataFrame[column_name] = DataTransform.map_distinct_values(self, DataFrame[column_name], extract_integer) # Digits are only extracted once from each distinct string.
         return DataFrame
 
     def replace_string_text(self, DataFrame: pd.DataFrame, column_name: str, original_string: str, new_string: str):
@@ -39,21 +65,281 @@ class DataTransform:
             DataFrame (pd.DataFrame): the updated DataFrame.
         '''
 
-        DataFrame[column_name] = DataFrame[column_name].str.replace(original_string, new_string)
+        replace_string = lambda values: values.str.replace(original_string, new_string)
+        DataFrame[column_name] = DataTransform.map_distinct_values(self, DataFrame[column_name], replace_string, keep_categorical=True) # Text is only replaced once in each distinct string, categorical columns stay categorical.
         return DataFrame
 
-    def convert_string_to_date(self, DataFrame: pd.DataFrame, column_name: str):
+    def map_distinct_values(self, column: pd.Series, function, keep_categorical: bool = False):
+
+        '''
+        This method is used to apply a function to the distinct values of a column rather than to every row, then map the results back to the rows.
+        String columns such as 'term', 'employment_length' and the dates only contain a handful to a few hundred distinct values, so the time taken depends on the number of distinct values rather than the number of rows.
+        The distinct values of categorical columns are their categories, so these are not searched for.
+
+        Parameters:
+            column (pd.Series): The column to which the function will be applied.
+            function: A function that takes a pd.Series of the distinct values and returns a pd.Series of the same length.
+            keep_categorical (bool): DEFAULT = False, if True and the column is categorical the result is also categorical, with the results of the function as its categories.
+
+        Returns:
+            pd.Series: The result of the function for each row, null rows stay null.
+        '''
+
+        categorical = isinstance(column.dtype, pd.CategoricalDtype)
+        if categorical:
+            codes, uniques = column.cat.codes.to_numpy(), column.cat.categories
+        else:
+            codes, uniques = pd.factorize(column) # Integer code of each row's value, nulls have the code -1.
+        values = function(pd.Series(uniques, dtype='object'))
+
+        if categorical and keep_categorical == True: # Only the codes are remapped, as distinct categories can have the same result.
+            value_codes, categories = pd.factorize(values)
+            new_codes = np.full(len(codes), -1, dtype=value_codes.dtype)
+            new_codes[codes >= 0] = value_codes[codes[codes >= 0]]
+            return pd.Series(pd.Categorical.from_codes(new_codes, categories=categories), index=column.index, name=column.name)
+        result = values.array.take(codes, allow_fill=True) # Each row takes the result of its value.
+        if values.dtype == object and not categorical and (codes == -1).any(): # Null rows keep their original null (None or NaN), as with the .str methods.
+            result = result.to_numpy()
+            result[codes == -1] = column.to_numpy()[codes == -1]
+        return pd.Series(result, index=column.index, name=column.name)
+
+    def convert_string_to_date(self, DataFrame: pd.DataFrame, column_name: str, date_format: str = None, cache_path: str = None):
 
         '''
         This method is used to convert a date in string format into a date in period format. The reason for period format is because dates within the loan database only have a resolution of the month and year.
+        Date columns only contain a few hundred distinct months, so each distinct string is parsed once and the periods are mapped back to the rows by their codes, the time taken depends on the number of distinct dates rather than the number of rows.
 
         Parameters:
             column_name (str): The name of the column to which this method will be applied.
+            date_format (str): DEFAULT = None, the format of the date strings (e.g. '%b-%Y'), if None the format is inferred from the distinct strings.
+            cache_path (str): DEFAULT = None, the path of a .json file of previously parsed strings, which is read before and updated after parsing so strings are not parsed again in later runs (the default only keeps parsed strings for this instance).
 
         Returns:
             DataFrame (pd.DataFrame): the updated DataFrame.
         '''
-            
-        DataFrame[column_name] = pd.to_datetime(DataFrame[column_name], errors='coerce').dt.to_period('M') # The first method converts the string in the column to a datetime.
-        # The second method converts the datetime to a period (M) which is a date that contains only the month and year since this is the resolution of the data provided.
-        return DataFrame
\ No newline at end of file
+
+        if cache_path is not None:
+            DataTransform.load_date_cache(self, cache_path)
+        parse_dates = lambda strings: DataTransform.parse_dates(self, strings, date_format) # Converts each distinct string to a datetime then to a period (M).
+        DataFrame[column_name] = DataTransform.map_distinct_values(self, DataFrame[column_name], parse_dates) # Each row takes the period of its string.
+        if cache_path is not None:
+            DataTransform.save_date_cache(self, cache_path)
+        return DataFrame
+
+    def infer_date_format(self, strings: pd.Series):
+
+        '''
+        This method is used to find the format of date strings from a list of common formats.
+
+        Parameters:
+            strings (pd.Series): The distinct date strings.
+
+        Returns:
+            str: The first format in DATE_FORMATS which parses every non-null string, or None if no format does.
+        '''
+
+        strings = strings.dropna()
+        for date_format in DATE_FORMATS:
+            if pd.to_datetime(strings, format=date_format, errors='coerce').notna().all():
+                return date_format
+        return None
+
+    def parse_dates(self, strings: pd.Series, date_format: str = None):
+
+        '''
+        This method is used to convert distinct date strings to 'period[M]', parsing only the strings that are not in the date cache.
+
+        Parameters:
+            strings (pd.Series): The distinct date strings.
+            date_format (str): DEFAULT = None, the format of the date strings, if None the format is inferred from every distinct string.
+                If no format in DATE_FORMATS parses every string, each string is parsed on its own (month first), so its date doesn't depend on the other strings.
+
+        Returns:
+            pd.Series: The period of each string, strings that are not dates become NaT.
+        '''
+
+        parse_format = date_format
+        if parse_format is None: # The format is resolved before the cache is used, as the same string can be a different date in a different format.
+            parse_format = DataTransform.infer_date_format(self, pd.Series(strings, dtype='object'))
+            parse_format = 'mixed' if parse_format is None else parse_format
+        cache = self.date_cache.setdefault(parse_format, {}) # Strings are cached for each format.
+        new_strings = pd.Series([string for string in strings if string not in cache], dtype='object')
+        if len(new_strings) > 0:
+            parsed = pd.to_datetime(new_strings, format=parse_format, errors='coerce').dt.to_period('M')
+            cache.update(zip(new_strings, parsed))
+        return pd.Series(pd.array([cache[string] for string in strings], dtype='period[M]'), index=strings.index)
+
+    def load_date_cache(self, cache_path: str):
+
+        '''
+        This method is used to add the parsed date strings saved in a .json file to the date cache.
+
+        Parameters:
+            cache_path (str): The path of the .json file, nothing is loaded if it does not exist.
+        '''
+
+        if not os.path.exists(cache_path):
+            return
+        with open(cache_path, 'r') as file:
+            saved_cache = json.load(file)
+        for date_format, periods in saved_cache.items():
+            cache = self.date_cache.setdefault(date_format, {})
+            for string, period in periods.items():
+                cache.setdefault(string, pd.NaT if period is None else pd.Period(period, freq='M'))
+
+    def save_date_cache(self, cache_path: str):
+
+        '''
+        This method is used to save the date cache to a .json file, so parsed strings can be reused in later runs.
+
+        Parameters:
+            cache_path (str): The path of the .json file.
+        '''
+
+        saved_cache = {date_format: {str(string): None if pd.isna(period) else str(period) for string, period in periods.items()} for date_format, periods in self.date_cache.items()}
+        with open(cache_path, 'w') as file:
+            json.dump(saved_cache, file)
+
+    def compile_transform_spec(self, spec: dict):
+
+        '''
+        This method is used to check a transform spec and compile the regular expressions it uses.
+        A spec maps each column name to a list of operations which are applied in order, each operation is a tuple of its name and arguments:
+            ('replace', original_string, new_string): replaces text, as replace_string_text().
+            ('extract_integer',) or ('extract_integer', pattern): extracts an integer ('Int32'), as extract_integer_from_string(), optionally with a different regular expression.
+            ('to_date',) or ('to_date', date_format): converts to 'period[M]', as convert_string_to_date(), optionally with the format of the dates (e.g. '%b-%Y').
+        For example: {'term': [('extract_integer',)], 'employment_length': [('replace', '< 1 year', '0 years'), ('extract_integer',)], 'issue_date': [('to_date', '%b-%Y')]}
+
+        Parameters:
+            spec (dict): The transform spec.
+
+        Raises:
+            ValueError if an operation is not recognised.
+
+        Returns:
+            dict: The operations of each column, with regular expressions compiled.
+        '''
+
+        compiled_spec = {}
+        for column, operations in spec.items(): # For each column in the spec.
+            compiled_operations = []
+            for operation in operations:
+                name, arguments = operation[0], tuple(operation[1:])
+                if name == 'extract_integer':
+                    pattern = arguments[0] if len(arguments) > 0 else r'(\d+)'
+                    if pattern not in self.compiled_patterns: # Each pattern is only compiled once, for every column and every run.
+                        self.compiled_patterns[pattern] = re.compile(pattern)
+                    arguments = (self.compiled_patterns[pattern],)
+                elif name == 'replace':
+                    if len(arguments) != 2: # In the case the strings to replace are not both provided.
+                        raise ValueError(f"The 'replace' operation on '{column}' needs the original_string and the new_string.")
+                elif name == 'to_date':
+                    arguments = (arguments[0] if len(arguments) > 0 else None,)
+                else:
+                    raise ValueError(f"'{name}' is not a transform operation, please use 'replace', 'extract_integer' or 'to_date'.")
+                compiled_operations.append((name, arguments))
+            compiled_spec[column] = tuple(compiled_operations)
+        return compiled_spec
+
+    def transform_column(self, column: pd.Series, operations: tuple):
+
+        '''
+        This method is used to apply every operation for a column in a single pass.
+        The column is factorised once, the operations are applied to its distinct values only and the results are mapped back to the rows at the end, so the regular expressions and date parsing run once for each distinct value rather than once for each row.
+
+        Parameters:
+            column (pd.Series): The column to transform.
+            operations (tuple): The compiled operations for the column from compile_transform_spec().
+
+        Returns:
+            pd.Series: The transformed column.
+        '''
+
+        def apply_operations(values):
+            for name, arguments in operations: # Apply every operation to the distinct values.
+                if name == 'replace':
+                    values = values.str.replace(arguments[0], arguments[1])
+                elif name == 'extract_integer':
+                    values = values.str.extract(arguments[0], expand=False).astype('Int32')
+                elif name == 'to_date':
+                    values = DataTransform.parse_dates(self, values, arguments[0])
+            return values
+
+        return DataTransform.map_distinct_values(self, column, apply_operations) # Rows take the result of their value, null rows stay null.
+
+    def column_fingerprint(self, column: pd.Series):
+
+        '''
+        This method is used to get a cheap fingerprint of a column from its data type, length and the location of its data, without reading its values.
+
+        Parameters:
+            column (pd.Series): The column.
+
+        Returns:
+            tuple: the data type, length and memory location of the data of the column.
+        '''
+
+        if isinstance(column.dtype, pd.api.extensions.ExtensionDtype): # Extension arrays (e.g. 'Int32', 'period[M]') are identified by the array object.
+            location = id(column.array)
+        else: # Numpy arrays are identified by the address of their data.
+            location = column.to_numpy().__array_interface__['data'][0]
+        return (str(column.dtype), len(column), location)
+
+    def is_transformed(self, column: pd.Series, operations: tuple):
+
+        '''
+        This method is used to check whether a column is still the result of the same operations from a previous run of apply_transform_spec().
+        The fingerprint of the column is compared first. pandas can move a column's data (e.g. when another column is assigned), so if only the location differs the values are compared with the kept result.
+
+        Parameters:
+            column (pd.Series): The column.
+            operations (tuple): The compiled operations for the column from compile_transform_spec().
+
+        Returns:
+            bool: True if the column holds the result of the operations.
+        '''
+
+        if column.name not in self.transformed_columns:
+            return False
+        transformed_operations, fingerprint, result = self.transformed_columns[column.name]
+        current_fingerprint = DataTransform.column_fingerprint(self, column)
+        if transformed_operations != operations or current_fingerprint[:2] != fingerprint[:2]: # In the case of different operations, data type or length.
+            return False
+        if current_fingerprint != fingerprint:
+            if not result.array.equals(column.array): # In the case the column was replaced.
+                return False
+            self.transformed_columns[column.name] = (operations, current_fingerprint, column) # The new location is recorded, so the values are not compared again.
+        return True
+
+    def apply_transform_spec(self, DataFrame: pd.DataFrame, spec: dict, skip_unchanged: bool = True):
+
+        '''
+        This method is used to apply a declarative transform spec to a dataframe, transforming many columns at once.
+        Each column is transformed in a single pass (see transform_column()) and each transformed column is assigned back to the dataframe once.
+        A column is skipped if it is still the result of the same operations from a previous run (see is_transformed()), so re-running a notebook cell doesn't transform columns again.
+        Values edited in place after the transform are not detected, skip_unchanged=False transforms every column.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            spec (dict): The transform spec, see compile_transform_spec() for the format.
+            skip_unchanged (bool): DEFAULT = True, if True columns that are still the result of the same operations are skipped.
+
+        Raises:
+            ValueError if a column in the spec is not in the dataframe.
+
+        Returns:
+            DataFrame (pd.DataFrame): The updated DataFrame.
+        '''
+
+        compiled_spec = DataTransform.compile_transform_spec(self, spec)
+        missing_columns = [column for column in compiled_spec if column not in DataFrame.columns]
+        if len(missing_columns) > 0: # In the case a column in the spec is NOT in the dataframe.
+            raise ValueError(f"Columns {missing_columns} not found in the dataframe.")
+
+        for column, operations in compiled_spec.items():
+            if skip_unchanged == True and DataTransform.is_transformed(self, DataFrame[column], operations): # Only columns that aren't the result of their operations are transformed.
+                continue
+            DataFrame[column] = DataTransform.transform_column(self, DataFrame[column], operations) # Each column is assigned once.
+            result = DataFrame[column]
+            self.transformed_columns[column] = (operations, DataTransform.column_fingerprint(self, result), result) # The result is kept, so its memory location can't be reused by another column.
+        return DataFrame
@@ -1,6 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import json
+import os
+import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, func, MetaData, select, Table
+import sqlalchemy as sa
 import yaml
+# Auxiliary classes:
+from datatransform import DataTransform
 
 
 # Extract the credentials from the yaml file into a dictionary.
@@ -16,9 +24,6 @@ def extract_credentials():
     with open('credentials.yaml', 'r') as file:
         return yaml.safe_load(file)
 
-# Store the dictionary into a variable.
-credentials: dict = extract_credentials()
-
 # Creates class object to connect to RDS database and extract data.
 class RDSDatabaseConnector():
 
@@ -41,13 +46,19 @@ class RDSDatabaseConnector():
         self.credentials_dict = credentials_dict # when class is initiated it requires the credentials argument.
 
     # Initialises SQLAlchemy engine.
-    def create_engine(self):
+    def create_engine(self, database_url: str = None, pool_size: int = 5):
         
         '''
         This method is used to create the SQLAlchemy engine which will be required to connect to the AiCore RDS.
+
+        Parameters:
+            database_url (str): DEFAULT = None, a SQLAlchemy database url to connect to instead of the RDS (e.g. 'sqlite:///loan_payments_versions/loan_payments.db' for a local stand-in database).
+            pool_size (int): DEFAULT = 5, the number of connections kept open in the engine's connection pool, this should be at least the number of workers used in extract_loans_data_partitioned().
         '''
 
-        self.engine = create_engine(f"postgresql+psycopg2://{self.credentials_dict['RDS_USER']}:{self.credentials_dict['RDS_PASSWORD']}@{self.credentials_dict['RDS_HOST']}:{self.credentials_dict['RDS_PORT']}/{self.credentials_dict['RDS_DATABASE']}")
+        if database_url is None: # In the case no database url is provided, the RDS credentials are used.
+            database_url = f"postgresql+psycopg2://{self.credentials_dict['RDS_USER']}:{self.credentials_dict['RDS_PASSWORD']}@{self.credentials_dict['RDS_HOST']}:{self.credentials_dict['RDS_PORT']}/{self.credentials_dict['RDS_DATABASE']}"
+        self.engine = create_engine(database_url, pool_size=pool_size)
 
     # Establishes a connection to the database and creates a pandas dataframe from the 'loan payments' table.
     def extract_loans_data(self):
@@ -62,7 +73,147 @@ class RDSDatabaseConnector():
         with self.engine.connect() as connection:
             self.loan_payments_df = pd.read_sql_table('loan_payments', self.engine)
             return self.loan_payments_df
-    
+
+    # Streams the 'loan payments' table from the database in batches of rows.
+    def extract_loans_data_in_chunks(self, chunk_size: int = 50000, table_name: str = 'loan_payments'):
+
+        '''
+        This method is used to stream the 'loan_payments' table from the RDS in batches of rows, so that peak memory depends on the batch size rather than the size of the table.
+        A server-side cursor is used (through the 'stream_results' execution option) so that rows are only fetched from the database as each batch is requested.
+
+        Parameters:
+            chunk_size (int): DEFAULT = 50000, the number of rows in each batch.
+            table_name (str): DEFAULT = 'loan_payments', the name of the table that will be extracted.
+
+        Yields:
+            (pd.DataFrame): a dataframe containing the next batch of rows from the table.
+        '''
+
+        if chunk_size < 1: # In the case the batch size is not a positive integer.
+            raise ValueError(f"'chunk_size' must be a positive integer, got {chunk_size}.")
+        with self.engine.connect().execution_options(stream_results=True, max_row_buffer=chunk_size) as connection: # Server-side cursor which only buffers one batch at a time.
+            for chunk in pd.read_sql_table(table_name, connection, chunksize=chunk_size): # For each batch of rows in the table.
+                yield chunk
+
+    # Extracts the 'loan payments' table concurrently in ranges of a numeric column.
+    def extract_loans_data_partitioned(self, partition_column: str = 'id', partitions: int = 8, max_workers: int = 4, table_name: str = 'loan_payments'):
+
+        '''
+        This method is used to extract the 'loan_payments' table by splitting it into ranges of a numeric column, fetching these ranges concurrently over the engine's connection pool and reassembling them in order.
+
+        Parameters:
+            partition_column (str): DEFAULT = 'id', the numeric column whose values are split into ranges.
+            partitions (int): DEFAULT = 8, the number of ranges the table is split into.
+            max_workers (int): DEFAULT = 4, the maximum number of ranges fetched at the same time.
+            table_name (str): DEFAULT = 'loan_payments', the name of the table that will be extracted.
+
+        Raises:
+            ValueError if 'partition_column' is not a numeric column of the table.
+
+        Returns:
+            (pd.DataFrame): a dataframe containing all the data from the table, ordered by the ranges of the partition column.
+        '''
+
+        if partitions < 1 or max_workers < 1: # In the case the number of ranges or workers is not a positive integer.
+            raise ValueError("'partitions' and 'max_workers' must be positive integers.")
+        table = Table(table_name, MetaData(), autoload_with=self.engine) # Reflects the table so that the queries are built with correctly quoted columns.
+        if partition_column not in table.c: # In the case the partition column is not in the table.
+            raise ValueError(f"Column '{partition_column}' not found in the '{table_name}' table.")
+        column = table.c[partition_column]
+        if not isinstance(column.type, (sa.Integer, sa.Numeric, sa.Float)): # In the case the partition column is not numeric.
+            raise ValueError(f"The '{partition_column}' column is not numerical datatype.")
+        integer_column = isinstance(column.type, sa.Integer) or (not isinstance(column.type, sa.Float) and column.type.scale == 0) # Integers and decimals with no fractional digits.
+
+        with self.engine.connect() as connection:
+            lower, upper = connection.execute(select(func.min(column), func.max(column))).one() # The range of values in the partition column.
+
+        queries = []
+        if lower is not None: # In the case the table contains non-null values in the partition column.
+            edges = np.linspace(float(lower), float(upper), partitions + 1) # Evenly spaced range boundaries, decimal values are converted to floats.
+            if integer_column:
+                edges = np.unique(np.ceil(edges).astype('int64')) # Integer boundaries, duplicates are removed for small ranges.
+            edges = edges.tolist()
+            for start, end in zip(edges[:-1], edges[1:]): # For each range, the upper boundary is excluded.
+                queries.append(select(table).where(column >= start, column < end))
+            queries.append(select(table).where(column >= edges[-1])) # The final range includes the maximum value.
+        queries.append(select(table).where(column.is_(None))) # Rows with a null partition value are fetched separately so none are lost.
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor: # Each worker checks out its own connection from the pool.
+            chunks = list(executor.map(lambda query: pd.read_sql_query(query, self.engine), queries)) # 'map' returns the results in the order of the ranges.
+
+        non_empty_chunks = [chunk for chunk in chunks if len(chunk) > 0] # Empty ranges are excluded so they don't change the column data types.
+        self.loan_payments_df = pd.concat(non_empty_chunks or chunks[:1], ignore_index=True)
+        return self.loan_payments_df
+
+    # Extracts only the rows of the 'loan payments' table that are newer than a watermark.
+    def extract_new_loans_data(self, watermark_column: str = 'id', watermark = None, key_column: str = 'id', table_name: str = 'loan_payments'):
+
+        '''
+        This method is used to extract only the rows of the 'loan_payments' table that were added or changed since the last extraction, based on a watermark value of a column.
+
+        Parameters:
+            watermark_column (str): DEFAULT = 'id', the column whose maximum value was recorded in the last extraction (e.g. 'id' or 'last_payment_date').
+                Numeric and date columns are compared in the database. Text date columns (e.g. 'Mon-YYYY') don't sort correctly as text, so their distinct values are parsed as dates and the rows with dates from the watermark onwards are extracted.
+            watermark: DEFAULT = None, the maximum value of 'watermark_column' from the last extraction, dates can be given as ISO strings (if None the whole table is extracted).
+            key_column (str): DEFAULT = 'id', the column that uniquely identifies each loan.
+                If the watermark column is the key column only rows above the watermark are extracted, otherwise rows equal to the watermark are extracted again as they may have changed since.
+            table_name (str): DEFAULT = 'loan_payments', the name of the table that will be extracted.
+
+        Raises:
+            ValueError if the watermark column is not in the table, or is a text column whose values are not dates.
+
+        Returns:
+            (pd.DataFrame): a dataframe containing the new or changed rows of the table.
+        '''
+
+        table = Table(table_name, MetaData(), autoload_with=self.engine)
+        if watermark_column not in table.c: # In the case the watermark column is not in the table.
+            raise ValueError(f"Column '{watermark_column}' not found in the '{table_name}' table.")
+        query = select(table)
+        if watermark is not None: # In the case a watermark from a previous extraction is provided.
+            column = table.c[watermark_column]
+            include_watermark = watermark_column != key_column # Rows equal to the watermark are extracted again unless the watermark is the key.
+            if isinstance(column.type, sa.String): # Text dates are compared once parsed, as they don't sort correctly as text.
+                distinct_values = pd.read_sql_query(select(column).distinct(), self.engine)[watermark_column].dropna()
+                dates = orderable_watermark(distinct_values)
+                watermark = pd.Timestamp(watermark)
+                newer_values = distinct_values[(dates >= watermark) if include_watermark else (dates > watermark)]
+                query = query.where(column.in_(newer_values.tolist()))
+            else:
+                if isinstance(column.type, (sa.Date, sa.DateTime)): # Dates recorded as ISO strings are converted back to dates.
+                    watermark = pd.Timestamp(watermark).to_pydatetime()
+                    watermark = watermark if isinstance(column.type, sa.DateTime) else watermark.date()
+                query = query.where(column >= watermark if include_watermark else column > watermark)
+        return pd.read_sql_query(query, self.engine)
+
+# Converts the values of a watermark column into values that sort correctly.
+def orderable_watermark(values: pd.Series):
+
+    '''
+    This function is used to convert the values of a watermark column into values that sort in the correct order, text dates (e.g. 'Mar-2021') are parsed as dates since they don't sort correctly as text.
+
+    Args:
+        values (pd.Series): The values of the watermark column.
+
+    Raises:
+        ValueError if the values are text that can't be parsed as dates.
+
+    Returns:
+        (pd.Series): the values, with text, date and datetime values converted to timestamps.
+    '''
+
+    if values.dtype != object: # Numeric and datetime columns already sort correctly.
+        return values
+    non_null = values.dropna()
+    if len(non_null) == 0:
+        return pd.to_datetime(values)
+    if not isinstance(non_null.iloc[0], str): # Date and datetime objects.
+        return pd.to_datetime(values)
+    date_format = DataTransform().infer_date_format(pd.Series(non_null.unique()))
+    if date_format is None: # In the case the text is not a date, it has no reliable order so it can't be used as a watermark.
+        raise ValueError(f"The '{values.name}' column contains text that is not a date, so it can't be used as a watermark, please use a numeric or date column.")
+    return pd.to_datetime(values, format=date_format)
+
 # Writes the pandas dataframe into a csv file.
 def save_data_to_csv(loans_df: pd.DataFrame):
 
@@ -76,9 +227,174 @@ def save_data_to_csv(loans_df: pd.DataFrame):
     with open('loan_payments_versions/loan_payments.csv', 'w') as file:
         loans_df.to_csv(file, encoding= 'utf-8', index= False)
 
+# Writes batches of the 'loan_payments' table into a csv file as they are streamed.
+def save_chunks_to_csv(loan_chunks, file_path: str = 'loan_payments_versions/loan_payments.csv'):
+
+    '''
+    This function is used to write batches of the 'loan_payments' table into a single csv file as they are received, so the whole table never has to be held in memory.
+
+    Args:
+        loan_chunks (iterable): An iterable of dataframes (e.g. from RDSDatabaseConnector.extract_loans_data_in_chunks()) that will be written into the csv file.
+        file_path (str): DEFAULT = 'loan_payments_versions/loan_payments.csv', the path of the csv file that will be written.
+
+    Returns:
+        (int): the total number of rows written into the csv file.
+    '''
+
+    rows_written = 0
+    header_written = False
+    with open(file_path, 'w', newline='') as file:
+        for chunk in loan_chunks: # For each batch of rows.
+            chunk.to_csv(file, encoding= 'utf-8', index= False, header= not header_written) # The header is only written with the first batch, even if it is empty.
+            header_written = True
+            rows_written += len(chunk)
+    return rows_written
+
+# Writes the pandas dataframe into a local SQLite database.
+def save_data_to_sqlite(loans_df: pd.DataFrame, database_path: str = 'loan_payments_versions/loan_payments.db', table_name: str = 'loan_payments'):
+
+    '''
+    This function is used to write the 'loan_payments' dataframe into a local SQLite database, this can be used as a stand-in for the RDS to run and benchmark extraction locally.
+
+    Args:
+        loans_df (pd.DataFrame): The 'loan_payments' dataframe that will be written into the database.
+        database_path (str): DEFAULT = 'loan_payments_versions/loan_payments.db', the path of the SQLite database file.
+        table_name (str): DEFAULT = 'loan_payments', the name of the table that will be written.
+
+    Returns:
+        (str): the SQLAlchemy database url of the SQLite database, which can be passed to RDSDatabaseConnector.create_engine().
+    '''
+
+    database_url = f'sqlite:///{database_path}'
+    engine = create_engine(database_url)
+    loans_df.to_sql(table_name, engine, if_exists='replace', index=False)
+    engine.dispose()
+    return database_url
+
+# Reads the state of the last incremental sync from a json file.
+def load_sync_state(state_path: str = 'loan_payments_versions/sync_state.json'):
+
+    '''
+    This function is used to read the watermark recorded by the last incremental sync.
+
+    Args:
+        state_path (str): DEFAULT = 'loan_payments_versions/sync_state.json', the path of the json state file.
+
+    Returns:
+        (dict): the 'watermark_column', 'watermark' and 'row_hashes' of the last sync, or an empty dictionary if no sync has been recorded.
+    '''
+
+    if not os.path.exists(state_path): # In the case no sync has been recorded yet.
+        return {}
+    with open(state_path, 'r') as file:
+        return json.load(file)
+
+# Writes the state of an incremental sync to a json file.
+def save_sync_state(watermark_column: str, watermark, state_path: str = 'loan_payments_versions/sync_state.json', row_hashes: dict = None):
+
+    '''
+    This function is used to record the watermark of an incremental sync so the next sync only extracts newer rows.
+
+    Args:
+        watermark_column (str): the column the watermark was taken from.
+        watermark: the maximum value of the watermark column in the local data.
+        state_path (str): DEFAULT = 'loan_payments_versions/sync_state.json', the path of the json state file.
+        row_hashes (dict): DEFAULT = None, the hash of each row at the watermark by key (see hash_rows()), used to tell whether they changed when they are extracted again.
+    '''
+
+    if isinstance(watermark, np.datetime64): # Numpy dates are converted to timestamps so they are stored in ISO format.
+        watermark = pd.Timestamp(watermark)
+    if isinstance(watermark, (datetime.date, datetime.time)): # Dates, datetimes and timestamps are stored in ISO format.
+        watermark = watermark.isoformat()
+    elif isinstance(watermark, np.generic): # Numpy values are converted to python values so they can be written to json.
+        watermark = watermark.item()
+    with open(state_path, 'w') as file:
+        json.dump({'watermark_column': watermark_column, 'watermark': watermark, 'row_hashes': {} if row_hashes is None else row_hashes}, file)
+
+# Hashes each row of a dataframe by its key.
+def hash_rows(rows: pd.DataFrame, key_column: str = 'id'):
+
+    '''
+    This function is used to get a hash of the values of each row, so a row extracted again can be compared with the version already in the local file without reading the file.
+
+    Args:
+        rows (pd.DataFrame): The rows extracted from the database.
+        key_column (str): DEFAULT = 'id', the column that uniquely identifies each loan.
+
+    Returns:
+        (dict): the hash of each row, with the keys converted to text so they can be written to json.
+    '''
+
+    hashes = pd.util.hash_pandas_object(rows, index=False).tolist()
+    return dict(zip(rows[key_column].astype(str), hashes))
+
+# Incrementally updates the local csv file with new or changed rows from the database.
+def sync_loans_data(connector: RDSDatabaseConnector, file_path: str = 'loan_payments_versions/loan_payments.csv', state_path: str = 'loan_payments_versions/sync_state.json', watermark_column: str = 'id', key_column: str = 'id'):
+
+    '''
+    This function is used to keep the local csv file up to date by only extracting rows that are newer than the watermark recorded by the last sync and merging them into the file.
+    If there is no recorded watermark (or it was taken from a different column) the whole table is streamed into the file.
+    If the watermark is not the key column, the rows at the watermark are extracted again on every sync. They are compared with the hashes recorded in the state file, so the local csv file is only read and rewritten when a row has actually changed.
+
+    Args:
+        connector (RDSDatabaseConnector): a connector on which create_engine() has been called.
+        file_path (str): DEFAULT = 'loan_payments_versions/loan_payments.csv', the path of the local csv file.
+        state_path (str): DEFAULT = 'loan_payments_versions/sync_state.json', the path of the json state file.
+        watermark_column (str): DEFAULT = 'id', the column used as the watermark (e.g. 'id' or 'last_payment_date').
+        key_column (str): DEFAULT = 'id', the column that uniquely identifies each loan, used to replace changed rows.
+
+    Returns:
+        (int): the number of new or changed rows written into the local csv file.
+    '''
+
+    state = load_sync_state(state_path)
+    if state.get('watermark_column') != watermark_column or not os.path.exists(file_path): # In the case there is no usable previous sync.
+        watermark = None
+        row_hashes = {}
+        def track_watermark(loan_chunks): # Records the maximum watermark value, and the hashes of the rows at it, as the batches are written.
+            nonlocal watermark, row_hashes
+            for chunk in loan_chunks:
+                values = orderable_watermark(chunk[watermark_column])
+                chunk_max = values.max()
+                if pd.notna(chunk_max) and (watermark is None or chunk_max >= watermark):
+                    if watermark is None or chunk_max > watermark: # In the case of a new maximum, the rows at the previous maximum are no longer extracted again.
+                        watermark, row_hashes = chunk_max, {}
+                    if watermark_column != key_column:
+                        row_hashes.update(hash_rows(chunk[(values == chunk_max).to_numpy()], key_column))
+                yield chunk
+        rows_written = save_chunks_to_csv(track_watermark(connector.extract_loans_data_in_chunks()), file_path)
+        save_sync_state(watermark_column, watermark, state_path, row_hashes)
+        return rows_written
+
+    new_rows = connector.extract_new_loans_data(watermark_column, state['watermark'], key_column)
+    if len(new_rows) == 0: # In the case nothing has changed the local file is left untouched.
+        return 0
+    values = orderable_watermark(new_rows[watermark_column])
+    watermark = values.max() # Taken from every extracted row, which are all at or above the previous watermark.
+
+    if watermark_column == key_column: # New keys are all above the existing keys, so the rows can be appended.
+        new_rows.to_csv(file_path, mode='a', encoding= 'utf-8', index= False, header= False)
+        save_sync_state(watermark_column, watermark, state_path)
+        return len(new_rows)
+
+    # Rows at the watermark are extracted again on every sync, those whose hash matches the recorded hash are unchanged and skipped.
+    recorded_hashes = state.get('row_hashes', {})
+    row_hashes = pd.util.hash_pandas_object(new_rows, index=False).tolist()
+    changed = np.array([recorded_hashes.get(key) != row_hash for key, row_hash in zip(new_rows[key_column].astype(str), row_hashes)], dtype=bool)
+    if not changed.any(): # In the case every extracted row is unchanged, the local file is neither read nor rewritten.
+        return 0
+    changed_rows = new_rows[changed]
+    local_df = pd.read_csv(file_path) # Changed rows replace their existing versions in the local file.
+    local_df = local_df[~local_df[key_column].isin(changed_rows[key_column])]
+    pd.concat([local_df, changed_rows], ignore_index=True).to_csv(file_path, encoding= 'utf-8', index= False)
+
+    at_watermark = (values == watermark).to_numpy()
+    save_sync_state(watermark_column, watermark, state_path, hash_rows(new_rows[at_watermark], key_column))
+    return len(changed_rows)
+
 if __name__ == '__main__':
-    connector = RDSDatabaseConnector(credentials) # Instantiates the 'RDSDatabaseConnector' class using the .
+    credentials: dict = extract_credentials() # Store the credentials dictionary into a variable.
+    connector = RDSDatabaseConnector(credentials) # Instantiates the 'RDSDatabaseConnector' class using the credentials.
     # Calling all defined methods:
     connector.create_engine() # Creates the sqlalchemy engine to establish connection.
-    extracted_data_frame: pd.DataFrame = connector.extract_loans_data() # Extracts sql data to a pandas dataframe.
-    save_data_to_csv(extracted_data_frame) # Writes the dataframe into a csv file.
\ No newline at end of file
+    sync_loans_data(connector) # Streams the whole table into the csv file on the first run, then only merges in rows newer than the recorded watermark.
\ No newline at end of file
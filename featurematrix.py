@@ -0,0 +1,188 @@
+import numpy as np
+import pandas as pd
+
+
+class FeatureMatrixBuilder:
+
+    '''
+    This class is used to build the feature matrices that the imputation models are trained on, encoding each column of a dataframe once and reusing it for every model.
+    Numeric columns are stored as 'float32', string, categorical and 'period[M]' columns are stored as the codes of their sorted categories (the same codes as astype('category').cat.codes, with -1 for nulls) and the categories are kept.
+    Each encoding is kept with a cheap fingerprint of the column: the memory location of its data (a reference to the data is kept so the location can't be reused by a new column) and a version number. A column that is replaced in the dataframe is encoded again.
+    Imputed values should be written with write_column(), which writes them to the dataframe, updates the encoding of only those rows and increases the column's version. Values edited in place by other code (e.g. with .loc) are not detected, invalidate() should be called after such edits.
+
+    Attributes:
+        DataFrame (pd.DataFrame): the dataframe whose columns are encoded.
+        encoded_columns (dict): the encoded values of each column that has been encoded.
+        categories (dict): the categories of each encoded string, categorical and date column.
+        fingerprints (dict): the fingerprint of each encoded column when it was encoded, used to tell whether it has been replaced or changed.
+        column_data (dict): the data of each encoded column when it was encoded, kept so its memory location can't be reused.
+        versions (dict): the version number of each column, increased every time the column is written or invalidated.
+    '''
+
+    def __init__(self, DataFrame: pd.DataFrame):
+
+        '''
+        This method is used to initialise this instance of the FeatureMatrixBuilder class.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe whose columns will be encoded.
+        '''
+
+        FeatureMatrixBuilder.reset(self, DataFrame)
+
+    def reset(self, DataFrame: pd.DataFrame = None):
+
+        '''
+        This method is used to discard every encoded column, e.g. to build matrices from a different dataframe.
+
+        Parameters:
+            DataFrame (pd.DataFrame): DEFAULT = None, the dataframe whose columns will be encoded (the default keeps the current dataframe).
+        '''
+
+        if DataFrame is not None:
+            self.DataFrame = DataFrame
+        self.encoded_columns = {}
+        self.categories = {}
+        self.fingerprints = {}
+        self.column_data = {}
+        self.versions = {}
+
+    def column_fingerprint(self, column_name: str):
+
+        '''
+        This method is used to get a cheap fingerprint of a column, which changes when the column is replaced or written with write_column().
+
+        Parameters:
+            column_name (str): The name of the column.
+
+        Returns:
+            data: the array holding the column's data.
+            tuple: the length, data type, memory location of the data and version of the column.
+        '''
+
+        column = self.DataFrame[column_name]
+        if isinstance(column.dtype, pd.api.extensions.ExtensionDtype): # Extension arrays (e.g. 'Int32', 'period[M]', 'category') are held by the dataframe as a single object.
+            data = column.array
+            location = id(data)
+        else: # Numpy arrays are identified by the address of their data.
+            data = column.to_numpy() # A view of the dataframe's data.
+            location = data.__array_interface__['data'][0]
+        return data, (len(column), str(column.dtype), location, self.versions.get(column_name, 0))
+
+    def record_fingerprint(self, column_name: str):
+
+        '''
+        This method is used to record that the encoding of a column matches the column as it is now.
+
+        Parameters:
+            column_name (str): The name of the column.
+        '''
+
+        self.column_data[column_name], self.fingerprints[column_name] = FeatureMatrixBuilder.column_fingerprint(self, column_name) # The data is kept so its memory location can't be reused by another column.
+
+    def encode_column(self, column_name: str):
+
+        '''
+        This method is used to get the encoded values of a column, encoding it if it has not been encoded or has been replaced since.
+
+        Parameters:
+            column_name (str): The name of the column.
+
+        Returns:
+            np.ndarray: The 'float32' encoded values of the column.
+        '''
+
+        if column_name in self.fingerprints and self.fingerprints[column_name] == FeatureMatrixBuilder.column_fingerprint(self, column_name)[1]: # In the case the column is unchanged since it was encoded.
+            return self.encoded_columns[column_name]
+
+        column = self.DataFrame[column_name]
+        if column.dtype.kind in 'iufb' and not isinstance(column.dtype, pd.CategoricalDtype): # Numeric and boolean columns are used as they are.
+            encoded = column.to_numpy(dtype='float32', na_value=np.nan)
+            self.categories.pop(column_name, None)
+        else: # String, categorical and date columns are encoded as the codes of their sorted categories.
+            categorical = pd.Categorical(column)
+            encoded = categorical.codes.astype('float32')
+            self.categories[column_name] = categorical.categories
+        self.encoded_columns[column_name] = encoded
+        FeatureMatrixBuilder.record_fingerprint(self, column_name)
+        return encoded
+
+    def matrix(self, column_names: list, rows: np.ndarray = None):
+
+        '''
+        This method is used to build a contiguous 'float32' feature matrix from encoded columns.
+
+        Parameters:
+            column_names (list): The names of the columns, in the order of the matrix's columns.
+            rows (np.ndarray): DEFAULT = None, a boolean mask or positions of the rows to include (the default includes every row).
+
+        Returns:
+            np.ndarray: A matrix with a row for each row and a column for each column.
+        '''
+
+        row_count = len(self.DataFrame) if rows is None else (int(np.count_nonzero(rows)) if rows.dtype == bool else len(rows))
+        matrix = np.empty((row_count, len(column_names)), dtype='float32') # Row-major, so each row of features is contiguous for the models.
+        for position, column in enumerate(column_names):
+            encoded = FeatureMatrixBuilder.encode_column(self, column)
+            matrix[:, position] = encoded if rows is None else encoded[rows]
+        return matrix
+
+    def write_column(self, column_name: str, rows: np.ndarray, values):
+
+        '''
+        This method is used to write imputed values into a column of the dataframe in a single positional assignment, and update the encoding of only those rows.
+        Unlike assigning through DataFrame[column_name].loc[...], which sets the values on an intermediate object, this always updates the dataframe. Values are cast to the column's float type (e.g. 'float32'), so the column keeps its data type.
+
+        Parameters:
+            column_name (str): The name of the column.
+            rows (np.ndarray): A boolean mask or positions of the rows that were imputed.
+            values: The imputed values, in the order of the rows.
+        '''
+
+        values = np.asarray(values)
+        dtype = self.DataFrame[column_name].dtype
+        if isinstance(dtype, np.dtype) and dtype.kind == 'f': # Predictions are cast to the column's float type.
+            values = values.astype(dtype)
+        positions = np.flatnonzero(rows) if rows.dtype == bool else rows
+        self.DataFrame.iloc[positions, self.DataFrame.columns.get_loc(column_name)] = values
+        FeatureMatrixBuilder.update_column(self, column_name, rows, values)
+
+    def update_column(self, column_name: str, rows: np.ndarray, values):
+
+        '''
+        This method is used to update the encoding of a column after some of its values have been imputed, without encoding the whole column again, and increase the column's version.
+        This is called by write_column(), it should only be called directly after the values have been written to the dataframe.
+
+        Parameters:
+            column_name (str): The name of the column.
+            rows (np.ndarray): A boolean mask or positions of the rows that were imputed.
+            values: The imputed values, in the order of the rows.
+        '''
+
+        self.versions[column_name] = self.versions.get(column_name, 0) + 1
+        if column_name not in self.encoded_columns: # Columns that have not been encoded are encoded when first needed.
+            return
+        values = np.asarray(values)
+        if column_name in self.categories: # Imputed values are converted to the codes of the existing categories.
+            codes = self.categories[column_name].get_indexer(values)
+            if (codes == -1).any(): # In the case a value is not one of the categories, the categories change so the column is encoded again.
+                FeatureMatrixBuilder.invalidate(self, column_name)
+                return
+            self.encoded_columns[column_name][rows] = codes
+        else:
+            self.encoded_columns[column_name][rows] = values.astype('float32')
+        FeatureMatrixBuilder.record_fingerprint(self, column_name) # The encoding matches the column as it is now.
+
+    def invalidate(self, column_name: str = None):
+
+        '''
+        This method is used to discard the encoding of a column after its values were edited in place by other code, so it is encoded again when next needed.
+
+        Parameters:
+            column_name (str): DEFAULT = None, the name of the column (the default discards every encoding).
+        '''
+
+        for column in list(self.encoded_columns) if column_name is None else [column_name]:
+            self.versions[column] = self.versions.get(column, 0) + 1 # Encodings recorded with the previous version are no longer matched.
+            for encodings in (self.encoded_columns, self.categories, self.fingerprints, self.column_data):
+                encodings.pop(column, None)
@@ -0,0 +1,123 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.kernel_approximation import Nystroem
+from sklearn.linear_model import LinearRegression, SGDClassifier
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import RobustScaler
+from sklearn.svm import SVC
+
+
+# The classifiers that can be used to impute categorical columns, with a description of each.
+CLASSIFIER_BACKENDS = {
+    'svc': 'Kernel support vector machine, fit time grows faster than the number of rows so it is trained on a sample.',
+    'linear_svm': 'Linear support vector machine trained by stochastic gradient descent, fit time grows linearly with the number of rows.',
+    'kernel_approximation': 'Approximate RBF kernel (Nystroem) followed by a linear support vector machine, close to the kernel SVM at a fraction of the fit time.',
+    'gradient_boosting': 'Histogram gradient boosted trees, which capture non-linear relationships and handle many rows quickly.'
+}
+
+def make_classifier(backend: str = 'svc', random_state: int = 123):
+
+    '''
+    This function is used to create a classifier for imputing a categorical column, with the features scaled as part of the model.
+    The features are scaled with a RobustScaler (which is not affected by outliers) inside the pipeline, so the same scaling is applied when the model is trained and when it predicts.
+    Gradient boosted trees are not affected by the scale of the features, so no scaler is used for 'gradient_boosting'.
+    The stochastic gradient descent classifiers stop once the training loss stops improving, the limit of 1000 passes over the data is only there to bound the fit time (they usually stop within 100 passes).
+
+    Parameters:
+        backend (str): DEFAULT = 'svc', the classifier to use, one of CLASSIFIER_BACKENDS.
+        random_state (int): DEFAULT = 123, the random seed of the classifier, for reproducibility.
+
+    Raises:
+        ValueError if the backend is not one of CLASSIFIER_BACKENDS.
+
+    Returns:
+        sklearn.pipeline.Pipeline: The unfitted classifier.
+    '''
+
+    if backend == 'svc':
+        return make_pipeline(RobustScaler(), SVC(random_state=random_state))
+    elif backend == 'linear_svm':
+        return make_pipeline(RobustScaler(), SGDClassifier(loss='hinge', alpha=1e-4, max_iter=1000, tol=1e-3, random_state=random_state))
+    elif backend == 'kernel_approximation':
+        return make_pipeline(RobustScaler(), Nystroem(kernel='rbf', n_components=300, random_state=random_state), SGDClassifier(loss='hinge', alpha=1e-4, max_iter=1000, tol=1e-3, random_state=random_state))
+    elif backend == 'gradient_boosting':
+        return make_pipeline(HistGradientBoostingClassifier(random_state=random_state))
+    raise ValueError(f"'{backend}' is not a classifier backend, please use one of {list(CLASSIFIER_BACKENDS)}.")
+
+def make_model(model_type: str = 'linear_regression', random_state: int = 123):
+
+    '''
+    This function is used to create a model for imputing a column, either a linear regression for a numeric column or one of the classifier backends for a categorical column.
+
+    Parameters:
+        model_type (str): DEFAULT = 'linear_regression', 'linear_regression' or one of CLASSIFIER_BACKENDS.
+        random_state (int): DEFAULT = 123, the random seed of the classifier, for reproducibility.
+
+    Returns:
+        The unfitted model.
+    '''
+
+    if model_type == 'linear_regression':
+        return LinearRegression()
+    return make_classifier(model_type, random_state)
+
+def predict_in_chunks(model, x_test: np.ndarray, chunk_size: int = 100000, max_workers: int = 1):
+
+    '''
+    This function is used to predict the missing values of a column in chunks of rows, so the memory used by the model's intermediate arrays (e.g. the scaled features or kernel approximation) is bounded by the chunk size rather than the number of null rows.
+    The predictions of each chunk are written into a single output array, and the chunks can be predicted at the same time in a pool of threads.
+
+    Parameters:
+        model: The fitted model.
+        x_test (np.ndarray): The features of the rows where the column is null.
+        chunk_size (int): DEFAULT = 100000, the number of rows predicted at a time.
+        max_workers (int): DEFAULT = 1, the number of threads, each thread holds the intermediate arrays of one chunk.
+
+    Returns:
+        np.ndarray: The predicted value of each null row.
+    '''
+
+    if len(x_test) <= chunk_size: # In the case there is only one chunk.
+        return model.predict(x_test)
+    starts = range(0, len(x_test), chunk_size)
+    first_chunk = model.predict(x_test[:chunk_size]) # The first chunk gives the data type of the predictions.
+    prediction = np.empty(len(x_test), dtype=object if first_chunk.dtype.kind in 'US' else first_chunk.dtype) # Fixed width strings are stored as objects, so longer classes in later chunks are not cut short.
+    prediction[:chunk_size] = first_chunk
+
+    def predict_chunk(start: int):
+        prediction[start:start + chunk_size] = model.predict(x_test[start:start + chunk_size])
+
+    if max_workers > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(predict_chunk, starts[1:]))
+    else:
+        for start in starts[1:]:
+            predict_chunk(start)
+    return prediction
+
+def fit_and_predict(model_type: str, x_train: np.ndarray, y_train: np.ndarray, x_test: np.ndarray, model_store = None, column_name: str = None, features: list = None, categories: dict = None):
+
+    '''
+    This function is used to train an imputation model and predict the missing values of a column.
+    It is defined at the top level of the module so that it can be run in a separate process.
+
+    Parameters:
+        model_type (str): 'linear_regression' or one of CLASSIFIER_BACKENDS.
+        x_train (np.ndarray): The training features of the rows where the column is known.
+        y_train (np.ndarray): The known values of the column.
+        x_test (np.ndarray): The features of the rows where the column is null.
+        model_store (ImputationModelStore): DEFAULT = None, a store of saved models to reuse the model of this column from (the default trains a new model).
+        column_name (str): DEFAULT = None, the name of the imputed column, needed with a model_store.
+        features (list): DEFAULT = None, the names of the training features, needed with a model_store.
+        categories (dict): DEFAULT = None, the categories used to encode the string, categorical and date features, needed with a model_store.
+
+    Returns:
+        np.ndarray: The predicted value of each null row.
+    '''
+
+    if model_store is not None: # The saved model is reused if it was trained on the same data.
+        return predict_in_chunks(model_store.fit(column_name, model_type, features, categories or {}, x_train, y_train), x_test)
+    model = make_model(model_type)
+    model.fit(x_train, y_train)
+    return predict_in_chunks(model, x_test)
@@ -0,0 +1,179 @@
+import hashlib
+import os
+import joblib
+import numpy as np
+# Auxiliary functions:
+from imputationmodels import make_model
+
+
+class ImputationModelStore:
+
+    '''
+    This class is used to save the fitted imputation models to disk and reuse them in later runs, rather than training them from zero every time.
+    Each model is saved with its features, the categories used to encode them (the scaler is part of the model), a fingerprint of the feature set and a fingerprint of the training data.
+    When a model is needed: if the training data fingerprint matches, the saved model is loaded and only used to predict, so the imputed values are the same as the previous run. If only the feature set matches and the model can be trained incrementally ('linear_svm' and 'kernel_approximation'), the saved model is warm started with the new training data. Otherwise a new model is trained and saved.
+
+    Attributes:
+        directory (str): the folder in which the models are saved.
+        loaded (int): the number of models loaded and used to predict without training.
+        warm_started (int): the number of saved models updated with new training data.
+        trained (int): the number of models trained from zero.
+    '''
+
+    def __init__(self, directory: str = 'imputation_models'):
+
+        '''
+        This method is used to initialise this instance of the ImputationModelStore class.
+
+        Parameters:
+            directory (str): DEFAULT = 'imputation_models', the folder in which the models are saved.
+        '''
+
+        self.directory = directory
+        self.loaded = 0
+        self.warm_started = 0
+        self.trained = 0
+
+    def model_path(self, column_name: str):
+
+        '''
+        This method is used to get the path of the saved model of a column.
+
+        Parameters:
+            column_name (str): The name of the imputed column.
+
+        Returns:
+            str: the path of the .joblib file.
+        '''
+
+        return os.path.join(self.directory, f'{column_name}.joblib')
+
+    def feature_fingerprint(self, model_type: str, features: list, categories: dict):
+
+        '''
+        This method is used to get a fingerprint of the model type, the features and their encodings, which changes if a model trained on them would not accept the same feature matrix.
+
+        Parameters:
+            model_type (str): 'linear_regression' or one of the classifier backends.
+            features (list): The names of the training features, in order.
+            categories (dict): The categories used to encode each string, categorical and date feature.
+
+        Returns:
+            str: the fingerprint.
+        '''
+
+        description = repr((model_type, list(features), {feature: [str(category) for category in categories[feature]] for feature in sorted(categories)}))
+        return hashlib.sha256(description.encode()).hexdigest()
+
+    def data_fingerprint(self, x_train: np.ndarray, y_train: np.ndarray):
+
+        '''
+        This method is used to get a fingerprint of the training data, which changes if any training value changes.
+
+        Parameters:
+            x_train (np.ndarray): The training features.
+            y_train (np.ndarray): The known values of the column.
+
+        Returns:
+            str: the fingerprint.
+        '''
+
+        digest = hashlib.sha256()
+        digest.update(repr(x_train.shape).encode())
+        digest.update(np.ascontiguousarray(x_train).tobytes())
+        digest.update('\x00'.join(map(str, y_train)).encode() if y_train.dtype == object else np.ascontiguousarray(y_train).tobytes())
+        return digest.hexdigest()
+
+    def load(self, column_name: str):
+
+        '''
+        This method is used to load the saved model of a column.
+
+        Parameters:
+            column_name (str): The name of the imputed column.
+
+        Returns:
+            dict: the 'model', 'model_type', 'features', 'categories', 'feature_fingerprint' and 'data_fingerprint', or None if no model is saved.
+        '''
+
+        path = ImputationModelStore.model_path(self, column_name)
+        if not os.path.exists(path):
+            return None
+        return joblib.load(path)
+
+    def save(self, column_name: str, saved_model: dict):
+
+        '''
+        This method is used to save the model of a column.
+
+        Parameters:
+            column_name (str): The name of the imputed column.
+            saved_model (dict): The 'model', 'model_type', 'features', 'categories', 'feature_fingerprint' and 'data_fingerprint'.
+        '''
+
+        os.makedirs(self.directory, exist_ok=True) # Creates the folder if it does not already exist.
+        joblib.dump(saved_model, ImputationModelStore.model_path(self, column_name))
+
+    def warm_start(self, model, x_train: np.ndarray, y_train: np.ndarray):
+
+        '''
+        This method is used to update a fitted model with new training data, if the model can be trained incrementally.
+        The scaler (and kernel approximation) keep the scaling they were fitted with, only the final linear classifier is updated.
+
+        Parameters:
+            model: The fitted model.
+            x_train (np.ndarray): The new training features.
+            y_train (np.ndarray): The new known values of the column.
+
+        Returns:
+            bool: True if the model was updated, False if it can't be trained incrementally (e.g. the training data contains a new class).
+        '''
+
+        if not hasattr(model, 'steps') or not hasattr(model[-1], 'partial_fit'): # Only the stochastic gradient descent classifiers can be updated.
+            return False
+        if not np.isin(np.unique(y_train), model[-1].classes_).all(): # In the case there is a class the model has not seen.
+            return False
+        model[-1].partial_fit(model[:-1].transform(x_train), y_train)
+        return True
+
+    def fit(self, column_name: str, model_type: str, features: list, categories: dict, x_train: np.ndarray, y_train: np.ndarray):
+
+        '''
+        This method is used to get a fitted model for a column, loading, warm starting or training it depending on the saved model's fingerprints.
+
+        Parameters:
+            column_name (str): The name of the imputed column.
+            model_type (str): 'linear_regression' or one of the classifier backends.
+            features (list): The names of the training features, in the order of the columns of x_train.
+            categories (dict): The categories of the encoded string, categorical and date columns, only those of the features are used.
+            x_train (np.ndarray): The training features.
+            y_train (np.ndarray): The known values of the column.
+
+        Returns:
+            The fitted model.
+        '''
+
+        y_train = np.asarray(y_train)
+        categories = {feature: categories[feature] for feature in features if feature in categories}
+        feature_fingerprint = ImputationModelStore.feature_fingerprint(self, model_type, features, categories)
+        data_fingerprint = ImputationModelStore.data_fingerprint(self, x_train, y_train)
+        saved_model = ImputationModelStore.load(self, column_name)
+
+        if saved_model is not None and saved_model['feature_fingerprint'] == feature_fingerprint:
+            if saved_model['data_fingerprint'] == data_fingerprint: # In the case the model was trained on the same data, it is only used to predict.
+                self.loaded += 1
+                return saved_model['model']
+            if ImputationModelStore.warm_start(self, saved_model['model'], x_train, y_train): # In the case the model can be updated with the new data.
+                self.warm_started += 1
+                model = saved_model['model']
+            else:
+                model = None
+        else:
+            model = None
+
+        if model is None: # In the case no usable model is saved, a new model is trained.
+            self.trained += 1
+            model = make_model(model_type)
+            model.fit(x_train, y_train)
+        ImputationModelStore.save(self, column_name, {'model': model, 'model_type': model_type, 'features': list(features), 'categories': categories, 'feature_fingerprint': feature_fingerprint, 'data_fingerprint': data_fingerprint})
+        return model
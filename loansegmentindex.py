@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+
+
+# The named segments of loans used in the analysis, by their 'loan_status'.
+LOAN_SEGMENTS = {
+    'fully_paid': ['Fully Paid'], # Fully Paid Loans
+    'charged_off_default': ['Charged Off', 'Default'], # Charged off or defaulted loans
+    'risky': ['Late (31-120 days)', 'In Grace Period', 'Late (16-30 days)'], # Risky Loans
+    'current': ['Current', 'Late (31-120 days)', 'In Grace Period', 'Late (16-30 days)'] # Current Loans (including risky loans)
+}
+
+class LoanSegmentIndex:
+
+    '''
+    This class is used to index the rows of a dataframe by loan status once, so that subsets of loans (e.g. fully paid, charged off and default, risky or current loans) can be retrieved repeatedly without scanning the whole dataframe each time.
+    The row positions of each loan status and each named segment are computed when the index is built, retrieving a segment then only takes the rows and columns that are requested.
+    The index is rebuilt automatically if it is used with a different dataframe, or the dataframe's rows have changed. If the loan status values are edited in place, refresh() should be called.
+
+    Attributes:
+        DataFrame (pd.DataFrame): the dataframe that is indexed.
+        status_column (str): the name of the column containing the loan status.
+        segments (dict): the names of the segments with the list of loan statuses in each segment.
+        status_positions (dict): the row positions of each loan status.
+        segment_positions (dict): the row positions of each named segment.
+    '''
+
+    def __init__(self, DataFrame: pd.DataFrame, status_column: str = 'loan_status', segments: dict = None):
+
+        '''
+        This method is used to initialise this instance of the LoanSegmentIndex class.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe that will be indexed.
+            status_column (str): DEFAULT = 'loan_status', the name of the column containing the loan status.
+            segments (dict): DEFAULT = None, the names of the segments with the list of loan statuses in each segment (the default uses LOAN_SEGMENTS).
+        '''
+
+        self.status_column = status_column
+        self.segments = dict(LOAN_SEGMENTS if segments is None else segments)
+        self.refresh(DataFrame)
+
+    def refresh(self, DataFrame: pd.DataFrame = None):
+
+        '''
+        This method is used to (re)build the index from a dataframe in a single pass over the loan status column.
+
+        Parameters:
+            DataFrame (pd.DataFrame): DEFAULT = None, the dataframe that will be indexed (the default rebuilds the index of the current dataframe).
+        '''
+
+        if DataFrame is not None:
+            self.DataFrame = DataFrame
+        if self.status_column not in self.DataFrame.columns: # In the case the loan status column is not in the dataframe.
+            raise ValueError(f"Column '{self.status_column}' not found in the dataframe.")
+
+        codes, statuses = pd.factorize(self.DataFrame[self.status_column]) # Integer code of each row's loan status.
+        order = np.argsort(codes, kind='stable') # Row positions grouped by loan status, in their original order within each status.
+        boundaries = np.searchsorted(codes[order], np.arange(len(statuses) + 1)) # Where each status starts and ends in the grouped positions.
+        self.status_positions = {status: order[boundaries[code]:boundaries[code + 1]] for code, status in enumerate(statuses)}
+
+        empty = np.array([], dtype='int64')
+        self.segment_positions = {}
+        for name, segment_statuses in self.segments.items(): # For each named segment, combine the positions of its loan statuses.
+            positions = [self.status_positions[status] for status in segment_statuses if status in self.status_positions]
+            self.segment_positions[name] = np.sort(np.concatenate(positions)) if len(positions) > 0 else empty
+
+        self._shape = self.DataFrame.shape # Used to check the index still matches the dataframe.
+        self._index = self.DataFrame.index
+
+    def is_valid(self, DataFrame: pd.DataFrame = None):
+
+        '''
+        This method is used to check whether the index still matches a dataframe.
+
+        Parameters:
+            DataFrame (pd.DataFrame): DEFAULT = None, the dataframe that will be checked (the default checks the indexed dataframe).
+
+        Returns:
+            bool: True if the index was built from this dataframe and its rows have not changed.
+        '''
+
+        DataFrame = self.DataFrame if DataFrame is None else DataFrame
+        return DataFrame is self.DataFrame and DataFrame.shape == self._shape and DataFrame.index is self._index
+
+    def positions(self, segment: str, DataFrame: pd.DataFrame = None):
+
+        '''
+        This method is used to get the row positions of a named segment or a single loan status.
+
+        Parameters:
+            segment (str): The name of a segment (e.g. 'risky') or a loan status (e.g. 'Charged Off').
+            DataFrame (pd.DataFrame): DEFAULT = None, the dataframe the positions are for, the index is rebuilt if it does not match (the default uses the indexed dataframe).
+
+        Raises:
+            ValueError if the segment is neither a named segment nor a loan status present in the dataframe.
+
+        Returns:
+            np.ndarray: The row positions of the loans in the segment.
+        '''
+
+        if not self.is_valid(DataFrame): # In the case the dataframe has changed since the index was built.
+            self.refresh(DataFrame)
+        if segment in self.segment_positions:
+            return self.segment_positions[segment]
+        if segment in self.status_positions:
+            return self.status_positions[segment]
+        raise ValueError(f"'{segment}' is not a segment name or loan status.")
+
+    def segment(self, segment: str, columns: list = None):
+
+        '''
+        This method is used to get the rows of a named segment or a single loan status as a dataframe.
+
+        Parameters:
+            segment (str): The name of a segment (e.g. 'risky') or a loan status (e.g. 'Charged Off').
+            columns (list): DEFAULT = None, the columns to take, only these columns are copied (the default takes every column).
+
+        Returns:
+            pd.DataFrame: The rows of the loans in the segment.
+        '''
+
+        positions = self.positions(segment)
+        if columns is None:
+            return self.DataFrame.iloc[positions]
+        return self.DataFrame.iloc[positions, self.DataFrame.columns.get_indexer(columns)]
+
+    def column_segment(self, segment: str, column_name: str, mask: np.ndarray = None):
+
+        '''
+        This method is used to get the values of a single column for a named segment or a single loan status.
+
+        Parameters:
+            segment (str): The name of a segment (e.g. 'risky') or a loan status (e.g. 'Charged Off').
+            column_name (str): The name of the column.
+            mask (np.ndarray): DEFAULT = None, a boolean array over every row of the dataframe, if provided only rows of the segment where the mask is True are taken.
+
+        Returns:
+            pd.Series: The values of the column for the loans in the segment.
+        '''
+
+        positions = self.positions(segment)
+        if mask is not None: # Only the mask values of the segment's rows are checked.
+            positions = positions[mask[positions]]
+        return self.DataFrame[column_name].iloc[positions]
@@ -0,0 +1,79 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+
+def summarise_column_group(memory_name: str, shape: tuple, start: int, stop: int):
+
+    '''
+    This function is used by each worker process to calculate the statistics of a group of columns held in shared memory.
+    It is defined at the top level of the module so that it can be sent to the worker processes.
+
+    Parameters:
+        memory_name (str): The name of the shared memory block containing the numeric columns.
+        shape (tuple): The number of rows and columns in the shared memory block.
+        start (int): The position of the first column in the group.
+        stop (int): The position after the last column in the group.
+
+    Returns:
+        dict: The 'null_count', 'mean', 'median', 'standard_deviation' and 'skewness' of each column in the group, as arrays.
+    '''
+
+    memory = shared_memory.SharedMemory(name=memory_name) # Attaches to the block, the values are not copied.
+    try:
+        values = np.ndarray(shape, dtype='float64', buffer=memory.buf, order='F')[:, start:stop] # Columns are contiguous in memory.
+        nulls = np.isnan(values)
+        count = values.shape[0] - nulls.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.nansum(values, axis=0) / count
+            adjusted = np.where(nulls, 0, values - mean) # Differences from the mean, with nulls contributing nothing.
+            m2 = np.sum(adjusted**2, axis=0)
+            m3 = np.sum(adjusted**3, axis=0)
+            m2[np.abs(m2) < 1e-14] = 0 # Floating point error is removed as pandas does.
+            # The adjusted skewness and sample standard deviation, as calculated by pandas.
+            skewness = np.where(m2 == 0, 0.0, count * (count - 1) ** 0.5 / (count - 2) * (m3 / m2**1.5))
+            skewness = np.where(count < 3, np.nan, skewness)
+            standard_deviation = np.where(count < 2, np.nan, np.sqrt(m2 / (count - 1)))
+            median = np.array([np.median(column[~column_nulls]) if (~column_nulls).any() else np.nan for column, column_nulls in zip(values.T, nulls.T)])
+        del values, nulls, adjusted # The views of the block must be released before it is closed.
+    finally:
+        memory.close()
+    return {'null_count': shape[0] - count, 'mean': mean, 'median': median, 'standard_deviation': standard_deviation, 'skewness': skewness}
+
+def profile_numeric_columns(DataFrame: pd.DataFrame, columns: list, n_jobs: int):
+
+    '''
+    This function is used to calculate the null count, mean, median, standard deviation and skewness of numeric columns in parallel across a pool of processes.
+    The columns are copied once into a block of shared memory as 'float64', each process is given the name of the block and a group of columns, so the data is not pickled and sent to the processes.
+
+    Parameters:
+        DataFrame (pd.DataFrame): The dataframe containing the columns.
+        columns (list): The names of the numeric columns.
+        n_jobs (int): The number of processes to use.
+
+    Returns:
+        pd.DataFrame: A row for each column with the 'null_count', 'mean', 'median', 'standard_deviation' and 'skewness'.
+    '''
+
+    statistics = ['null_count', 'mean', 'median', 'standard_deviation', 'skewness']
+    if len(columns) == 0 or len(DataFrame) == 0: # In the case there is nothing to calculate.
+        return pd.DataFrame({statistic: DataFrame[columns].isna().sum() if statistic == 'null_count' else np.nan for statistic in statistics}, index=pd.Index(columns))
+
+    shape = (len(DataFrame), len(columns))
+    memory = shared_memory.SharedMemory(create=True, size=shape[0] * shape[1] * 8)
+    try:
+        values = np.ndarray(shape, dtype='float64', buffer=memory.buf, order='F')
+        for position, column in enumerate(columns): # Copies each column into the block, nullable integer nulls become NaN.
+            values[:, position] = DataFrame[column].to_numpy(dtype='float64', na_value=np.nan)
+        del values
+
+        groups = np.array_split(np.arange(len(columns)), min(n_jobs, len(columns))) # Contiguous groups of columns, one for each process.
+        with ProcessPoolExecutor(max_workers=len(groups)) as executor:
+            futures = [executor.submit(summarise_column_group, memory.name, shape, int(group[0]), int(group[-1]) + 1) for group in groups]
+            results = [future.result() for future in futures] # Results are merged in the order of the columns.
+    finally:
+        memory.close()
+        memory.unlink()
+
+    return pd.DataFrame({statistic: np.concatenate([result[statistic] for result in results]) for statistic in statistics}, index=pd.Index(columns))
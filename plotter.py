@@ -6,6 +6,9 @@ import plotly.express as px
 from scipy import stats
 import seaborn as sns
 from statsmodels.graphics.gofplots import qqplot
+# Auxiliary classes:
+from columnregistry import COLUMN_REGISTRY
+from loansegmentindex import LoanSegmentIndex
 
 
 class Plotter:
@@ -281,8 +284,9 @@ class Plotter:
             matplotlib.pyplot.figure: A heatmap showing the correlation between columns.
         '''
 
+        numeric_columns = set(COLUMN_REGISTRY.numeric_columns(DataFrame))
         for column in DataFrame.columns: # For each column in the dataframe.
-            if DataFrame[column].dtype not in ['int16', 'int32', 'int64', 'float16', 'float32', 'float64']: # If the datatype is not one of the listed numeric types.
+            if column not in numeric_columns: # If the datatype is not numeric.
                 raise ValueError(f"The '{column}' column is not numerical datatype.") # Raise a ValueError.
 
         corr = DataFrame.corr() # Compute the correlation matrix.
@@ -518,7 +522,7 @@ class Plotter:
             pyplot.title(title)
         return pyplot.show()
 
-    def discrete_value_risk_comparison(self, DataFrame: pd.DataFrame, column_name: str):
+    def discrete_value_risk_comparison(self, DataFrame: pd.DataFrame, column_name: str, segment_index: LoanSegmentIndex = None):
 
         '''
         This method is used to return a plot containing 2 rows of subplots, the first row contains pie charts, the second row contains bar plots. 
@@ -527,22 +531,22 @@ class Plotter:
         Parameters:
             DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
             column_name (str): The name of the column in the dataframe to which this method will be applied.
+            segment_index (LoanSegmentIndex): DEFAULT = None, an index of the dataframe's loan status segments, passing the same index to repeated plots avoids rebuilding the subsets each time (the default builds a new index).
         
         Returns:
             matplotlib.pyplot.subplots.figure: a grid containing pie chart and bar plot subplots.
         '''
 
-        # Defining DataFrames that contain subsets of loan status.
-        df = DataFrame # All loans
-        paid_df = df[df['loan_status'] == 'Fully Paid'] # Fully Paid Loans
-        charged_default_df = df[df['loan_status'].isin(['Charged Off','Default'])] # Charged off or defaulted loans
-        risky_df = df[df['loan_status'].isin(['Late (31-120 days)','In Grace Period', 'Late (16-30 days)'])] # Risky Loans
+        if segment_index is None: # In the case no index of the loan status segments is provided.
+            segment_index = LoanSegmentIndex(DataFrame)
+        elif not segment_index.is_valid(DataFrame): # In the case the index was built from a different or changed dataframe.
+            segment_index.refresh(DataFrame)
 
-        # Getting proportions of discrete values in column, only selecting the top 8.
-        probabilities = DataFrame[column_name].value_counts(normalize=True).head(8)
-        paid_probabilities = paid_df[column_name].value_counts(normalize=True).head(8)
-        charged_default_probabilities = charged_default_df[column_name].value_counts(normalize=True).head(8)
-        risky_probabilities = risky_df[column_name].value_counts(normalize=True).head(8)
+        # Getting proportions of discrete values in column for each subset of loan status, only selecting the top 8.
+        probabilities = DataFrame[column_name].value_counts(normalize=True).head(8) # All loans
+        paid_probabilities = segment_index.column_segment('fully_paid', column_name).value_counts(normalize=True).head(8) # Fully Paid Loans
+        charged_default_probabilities = segment_index.column_segment('charged_off_default', column_name).value_counts(normalize=True).head(8) # Charged off or defaulted loans
+        risky_probabilities = segment_index.column_segment('risky', column_name).value_counts(normalize=True).head(8) # Risky Loans
 
         # Generate main plot
         fig, axes = pyplot.subplots(nrows=2, ncols=4, figsize=(16, 8)) # Creating 2x4 grid
@@ -582,7 +586,7 @@ class Plotter:
 
         return pyplot.show()
 
-    def continuous_value_risk_comparison(self, DataFrame: pd.DataFrame, column_name: str, z_score_threshold: float=3):
+    def continuous_value_risk_comparison(self, DataFrame: pd.DataFrame, column_name: str, z_score_threshold: float=3, segment_index: LoanSegmentIndex = None):
 
         '''
         This method is used to return a plot containing 2 rows of subplots, the first row contains histograms, the second row contains violin plots. 
@@ -592,48 +596,49 @@ class Plotter:
             DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
             column_name (str): The name of the column in the dataframe to which this method will be applied.
             z_score_threshold (float): DEFAULT = 3, The threshold in terms of z_score for filtering outliers out of the data.
+            segment_index (LoanSegmentIndex): DEFAULT = None, an index of the dataframe's loan status segments, passing the same index to repeated plots avoids rebuilding the subsets each time (the default builds a new index).
         
         Returns:
             matplotlib.pyplot.subplots.figure: a grid containing histogram and violin subplots.
         '''
-        
-        def drop_outliers(Data_Frame: pd.DataFrame, column_name: str, z_score_threshold: float):
-            mean = np.mean(Data_Frame[column_name]) # Identify the mean of the column.
-            std = np.std(Data_Frame[column_name]) # Identify the standard deviation of the column.
-            z_scores = (Data_Frame[column_name] - mean) / std # Identofy the 'z score' for each value in the column.
-            abs_z_scores = pd.Series(abs(z_scores)) # Create a series with the absolute values of the 'z_score' stored.
-            mask = abs_z_scores < z_score_threshold
-            Data_Frame = Data_Frame[mask] # Only keep rows where the 'z score' is below the threshold.        
-            return Data_Frame
-
-        # Defining DataFrames that contain subsets of loan status.
-        df = drop_outliers(DataFrame, column_name, z_score_threshold) # All loans excluding outliers
-        paid_df = df[df['loan_status'] == 'Fully Paid'] # Fully Paid Loans
-        charged_default_df = df[df['loan_status'].isin(['Charged Off','Default'])] # Charged off or defaulted loans
-        risky_df = df[df['loan_status'].isin(['Late (31-120 days)','In Grace Period', 'Late (16-30 days)'])] # Risky Loans
+
+        if segment_index is None: # In the case no index of the loan status segments is provided.
+            segment_index = LoanSegmentIndex(DataFrame)
+        elif not segment_index.is_valid(DataFrame): # In the case the index was built from a different or changed dataframe.
+            segment_index.refresh(DataFrame)
+
+        values = DataFrame[column_name].to_numpy(dtype='float64', na_value=np.nan) # Nullable columns (e.g. 'Int64') have their missing values converted to NaN.
+        z_scores = (values - np.nanmean(values)) / np.nanstd(values) # Identify the 'z score' for each value in the column.
+        mask = np.abs(z_scores) < z_score_threshold # Only keep rows where the 'z score' is below the threshold.
+
+        # Defining the column values of subsets of loan status, excluding outliers.
+        values = DataFrame[column_name][mask] # All loans
+        paid_values = segment_index.column_segment('fully_paid', column_name, mask) # Fully Paid Loans
+        charged_default_values = segment_index.column_segment('charged_off_default', column_name, mask) # Charged off or defaulted loans
+        risky_values = segment_index.column_segment('risky', column_name, mask) # Risky Loans
 
         # Generate main plot
         fig, axes = pyplot.subplots(nrows=2, ncols=4, figsize=(20, 10)) # Creating 2x4 grid
 
         # Set titles
-        axes[0, 0].set_title(f'All Loans\nMean: {round(df[column_name].mean(),1)}')
-        axes[0, 1].set_title(f'Fully Paid Loans\nMean: {round(paid_df[column_name].mean(),1)}')
-        axes[0, 2].set_title(f'Charged off and Default Loans\nMean: {round(charged_default_df[column_name].mean(),1)}')
-        axes[0, 3].set_title(f'Risky Loans\nMean: {round(risky_df[column_name].mean(),1)}')
+        axes[0, 0].set_title(f'All Loans\nMean: {round(values.mean(),1)}')
+        axes[0, 1].set_title(f'Fully Paid Loans\nMean: {round(paid_values.mean(),1)}')
+        axes[0, 2].set_title(f'Charged off and Default Loans\nMean: {round(charged_default_values.mean(),1)}')
+        axes[0, 3].set_title(f'Risky Loans\nMean: {round(risky_values.mean(),1)}')
 
         colour_palette = ['#a6cee3', '#fdbf6f', '#b2df8a', '#fb9a99', '#cab2d6', '#ffff99', '#1f78b4']
 
         # Generating subplot histograms
-        sns.histplot(data=df, x=column_name, kde=True, color='#a6cee3', ax=axes[0, 0])
-        sns.histplot(data=paid_df, x=column_name, kde=True, color='#a6cee3', ax=axes[0, 1])
-        sns.histplot(data=charged_default_df, x=column_name, kde=True, color='#a6cee3', ax=axes[0, 2])
-        sns.histplot(data=risky_df, x=column_name, kde=True, color='#a6cee3', ax=axes[0, 3])
+        sns.histplot(x=values, kde=True, color='#a6cee3', ax=axes[0, 0])
+        sns.histplot(x=paid_values, kde=True, color='#a6cee3', ax=axes[0, 1])
+        sns.histplot(x=charged_default_values, kde=True, color='#a6cee3', ax=axes[0, 2])
+        sns.histplot(x=risky_values, kde=True, color='#a6cee3', ax=axes[0, 3])
         
         # Acdding vertical mean lines
-        axes[0, 0].axvline(df[column_name].mean(), color='blue', linestyle='dashed', linewidth=1.5, label='Mean')
-        axes[0, 1].axvline(paid_df[column_name].mean(), color='blue', linestyle='dashed', linewidth=1.5, label='Mean')
-        axes[0, 2].axvline(charged_default_df[column_name].mean(), color='blue', linestyle='dashed', linewidth=1.5, label='Mean')
-        axes[0, 3].axvline(risky_df[column_name].mean(), color='blue', linestyle='dashed', linewidth=1.5, label='Mean')
+        axes[0, 0].axvline(values.mean(), color='blue', linestyle='dashed', linewidth=1.5, label='Mean')
+        axes[0, 1].axvline(paid_values.mean(), color='blue', linestyle='dashed', linewidth=1.5, label='Mean')
+        axes[0, 2].axvline(charged_default_values.mean(), color='blue', linestyle='dashed', linewidth=1.5, label='Mean')
+        axes[0, 3].axvline(risky_values.mean(), color='blue', linestyle='dashed', linewidth=1.5, label='Mean')
 
         # Remove spine from histograms
         sns.despine(ax=axes[0, 0])
@@ -642,16 +647,16 @@ class Plotter:
         sns.despine(ax=axes[0, 3])
 
         # Generate violin plots
-        sns.violinplot(data=df, y=column_name, color='#fb9a99', ax=axes[1, 0])
-        sns.violinplot(data=paid_df, y=column_name, color='#fb9a99', ax=axes[1, 1])
-        sns.violinplot(data=charged_default_df, y=column_name, color='#fb9a99', ax=axes[1, 2])
-        sns.violinplot(data=risky_df, y=column_name, color='#fb9a99', ax=axes[1, 3])
+        sns.violinplot(y=values, color='#fb9a99', ax=axes[1, 0])
+        sns.violinplot(y=paid_values, color='#fb9a99', ax=axes[1, 1])
+        sns.violinplot(y=charged_default_values, color='#fb9a99', ax=axes[1, 2])
+        sns.violinplot(y=risky_values, color='#fb9a99', ax=axes[1, 3])
 
         # Adding horizontal mean lines
-        axes[1, 0].axhline(df[column_name].mean(), color='red', linestyle='dashed', linewidth=1.5, label='Mean')
-        axes[1, 1].axhline(paid_df[column_name].mean(), color='red', linestyle='dashed', linewidth=2, label='Mean')
-        axes[1, 2].axhline(charged_default_df[column_name].mean(), color='red', linestyle='dashed', linewidth=2, label='Mean')        
-        axes[1, 3].axhline(risky_df[column_name].mean(), color='red', linestyle='dashed', linewidth=2, label='Mean')
+        axes[1, 0].axhline(values.mean(), color='red', linestyle='dashed', linewidth=1.5, label='Mean')
+        axes[1, 1].axhline(paid_values.mean(), color='red', linestyle='dashed', linewidth=2, label='Mean')
+        axes[1, 2].axhline(charged_default_values.mean(), color='red', linestyle='dashed', linewidth=2, label='Mean')        
+        axes[1, 3].axhline(risky_values.mean(), color='red', linestyle='dashed', linewidth=2, label='Mean')
 
         pyplot.suptitle(column_name, fontsize='xx-large') # Overall Plot title
         pyplot.tight_layout()
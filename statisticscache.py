@@ -0,0 +1,164 @@
+from collections import OrderedDict
+import weakref
+import pandas as pd
+
+
+class StatisticsCache:
+
+    '''
+    This class is used to keep the results of statistics calculated on dataframe columns, so that repeating the same query on an unchanged dataframe doesn't recalculate it.
+    Results are keyed on the statistic, the column and a fingerprint of the column. The fingerprint is cheap to compute: it contains the shape of the dataframe, the data type of the column, the memory location of the column's data and a version number of the dataframe.
+    Each kept result also keeps a reference to the column's data, so that memory can't be freed and reused by a new column while the result is kept (which would give the new column the same fingerprint). This means the data of replaced columns stays in memory until their results are discarded.
+    Replacing or re-assigning a column (e.g. DataFrame[column] = ...) or adding or removing rows changes the fingerprint, but editing values in place (e.g. with .loc) does not, invalidate() should be called after in place edits.
+    The number of results kept is bounded, when it is full the least recently used result is discarded.
+
+    Attributes:
+        max_size (int): the maximum number of results kept.
+        hits (int): the number of queries answered from the cache.
+        misses (int): the number of queries that had to be calculated.
+    '''
+
+    def __init__(self, max_size: int = 256):
+
+        '''
+        This method is used to initialise this instance of the StatisticsCache class.
+
+        Parameters:
+            max_size (int): DEFAULT = 256, the maximum number of results kept.
+        '''
+
+        if max_size < 1: # In the case the size is not a positive integer.
+            raise ValueError(f"'max_size' must be a positive integer, got {max_size}.")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.results = OrderedDict() # Results in order of use, the least recently used first.
+        self.versions = {} # Version number of each dataframe, keyed by the dataframe's id.
+
+    def column_fingerprint(self, DataFrame: pd.DataFrame, column_name: str):
+
+        '''
+        This method is used to get a cheap fingerprint of a column that changes when the column is replaced.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe containing the column.
+            column_name (str): The name of the column.
+
+        Returns:
+            tuple: the data type and memory location of the column's data.
+        '''
+
+        data = StatisticsCache.column_data(self, DataFrame, column_name)
+        if isinstance(data, pd.api.extensions.ExtensionArray): # Extension arrays (e.g. 'Int32', 'period[M]', 'category') are held by the dataframe as a single object.
+            location = id(data)
+        else: # Numpy arrays are identified by the address of their data.
+            location = data.__array_interface__['data'][0]
+        return (str(data.dtype), location)
+
+    def column_data(self, DataFrame: pd.DataFrame, column_name: str):
+
+        '''
+        This method is used to get the array holding a column's data, which is kept with each result so its memory location can't be reused while the result is kept.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe containing the column.
+            column_name (str): The name of the column.
+
+        Returns:
+            The extension array of the column, or a numpy view of its data.
+        '''
+
+        column = DataFrame[column_name]
+        if isinstance(column.dtype, pd.api.extensions.ExtensionDtype):
+            return column.array
+        return column.to_numpy() # A view of the dataframe's data, which keeps the data in memory while it is referenced.
+
+    def fingerprint(self, DataFrame: pd.DataFrame, column_name: str = None):
+
+        '''
+        This method is used to get the fingerprint of a column or of every column in a dataframe.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe to which this method will be applied.
+            column_name (str): DEFAULT = None, the name of the column (the default fingerprints every column).
+
+        Returns:
+            tuple: the fingerprint.
+        '''
+
+        frame_id = id(DataFrame)
+        if frame_id not in self.versions: # The first time a dataframe is seen, its results are set to be discarded when it is deleted.
+            self.versions[frame_id] = 0
+            weakref.finalize(DataFrame, self.forget, frame_id)
+        columns = DataFrame.columns if column_name is None else [column_name]
+        return (frame_id, self.versions[frame_id], DataFrame.shape, tuple(self.column_fingerprint(DataFrame, column) for column in columns))
+
+    def get_or_compute(self, statistic: str, DataFrame: pd.DataFrame, column_name, compute):
+
+        '''
+        This method is used to return a kept result if the column is unchanged, otherwise the result is calculated and kept.
+
+        Parameters:
+            statistic (str): The name of the statistic (e.g. 'median').
+            DataFrame (pd.DataFrame): The dataframe the statistic is calculated on.
+            column_name (str): The name of the column, or None if the statistic is for every column.
+            compute: A function with no arguments that calculates the statistic.
+
+        Returns:
+            The result of the statistic.
+        '''
+
+        key = (statistic, column_name, self.fingerprint(DataFrame, column_name))
+        if key in self.results: # In the case the result has already been calculated.
+            self.hits += 1
+            self.results.move_to_end(key) # Marks the result as the most recently used.
+            return self.results[key][0]
+
+        self.misses += 1
+        result = compute()
+        columns = DataFrame.columns if column_name is None else [column_name]
+        self.results[key] = (result, [self.column_data(DataFrame, column) for column in columns]) # The column data is kept with the result.
+        if len(self.results) > self.max_size: # In the case the cache is full, the least recently used result is discarded.
+            self.results.popitem(last=False)
+        return result
+
+    def invalidate(self, DataFrame: pd.DataFrame = None):
+
+        '''
+        This method is used to discard the results of a dataframe, e.g. after its values have been edited in place.
+
+        Parameters:
+            DataFrame (pd.DataFrame): DEFAULT = None, the dataframe whose results are discarded (the default discards every result).
+        '''
+
+        if DataFrame is None:
+            self.results.clear()
+        elif id(DataFrame) in self.versions:
+            self.versions[id(DataFrame)] += 1 # Results keyed on the previous version are no longer matched.
+            self.forget(id(DataFrame), keep_version=True)
+
+    def forget(self, frame_id: int, keep_version: bool = False):
+
+        '''
+        This method is used to remove the results of a dataframe from the cache.
+
+        Parameters:
+            frame_id (int): The id of the dataframe.
+            keep_version (bool): DEFAULT = False, if False the version number of the dataframe is also removed (used when the dataframe is deleted).
+        '''
+
+        for key in [key for key in self.results if key[2][0] == frame_id]:
+            del self.results[key]
+        if keep_version == False:
+            self.versions.pop(frame_id, None)
+
+    def info(self):
+
+        '''
+        This method is used to get the number of hits, misses and results kept.
+
+        Returns:
+            dict: the 'hits', 'misses', 'size' and 'max_size' of the cache.
+        '''
+
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self.results), 'max_size': self.max_size}
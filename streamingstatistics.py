@@ -0,0 +1,549 @@
+import os
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+
+class MomentSummary:
+
+    '''
+    This class is used to keep the count, mean and the second and third central moment sums of a set of numbers.
+    Summaries of separate chunks can be merged into the exact summary of all the chunks, from which the mean, standard deviation and skewness are calculated.
+
+    Attributes:
+        count (int): the number of values.
+        mean (float): the mean of the values.
+        m2 (float): the sum of squared differences from the mean.
+        m3 (float): the sum of cubed differences from the mean.
+    '''
+
+    def __init__(self, count: int = 0, mean: float = 0.0, m2: float = 0.0, m3: float = 0.0):
+
+        '''
+        This method is used to initialise this instance of the MomentSummary class.
+
+        Parameters:
+            count (int): DEFAULT = 0, the number of values.
+            mean (float): DEFAULT = 0.0, the mean of the values.
+            m2 (float): DEFAULT = 0.0, the sum of squared differences from the mean.
+            m3 (float): DEFAULT = 0.0, the sum of cubed differences from the mean.
+        '''
+
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.m3 = m3
+
+    def update(self, values: np.ndarray):
+
+        '''
+        This method is used to add a chunk of values to the summary.
+
+        Parameters:
+            values (np.ndarray): The values to add, these must not contain NaN.
+        '''
+
+        if len(values) == 0:
+            return
+        chunk_mean = values.mean()
+        deviations = values - chunk_mean
+        self.merge(MomentSummary(len(values), chunk_mean, np.dot(deviations, deviations), np.dot(deviations * deviations, deviations)))
+
+    def merge(self, other):
+
+        '''
+        This method is used to combine another summary into this summary, the result is the same as if all the values had been summarised together.
+
+        Parameters:
+            other (MomentSummary): The summary to combine.
+
+        Returns:
+            MomentSummary: This summary.
+        '''
+
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.m3 = other.count, other.mean, other.m2, other.m3
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        # Pairwise update of the central moment sums (Chan et al. / Pebay).
+        m3 = self.m3 + other.m3 + delta**3 * self.count * other.count * (self.count - other.count) / count**2 + 3 * delta * (self.count * other.m2 - other.count * self.m2) / count
+        m2 = self.m2 + other.m2 + delta**2 * self.count * other.count / count
+        self.mean = self.mean + delta * other.count / count
+        self.count, self.m2, self.m3 = count, m2, m3
+        return self
+
+    def get_mean(self):
+
+        '''
+        Returns:
+            float: The mean of the values, NaN if there are none.
+        '''
+
+        return self.mean if self.count > 0 else np.nan
+
+    def get_standard_deviation(self):
+
+        '''
+        Returns:
+            float: The sample standard deviation of the values (as calculated by pandas), NaN if there are fewer than 2 values.
+        '''
+
+        return np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+    def get_skewness(self):
+
+        '''
+        Returns:
+            float: The adjusted skewness of the values (as calculated by pandas), NaN if there are fewer than 3 values.
+        '''
+
+        if self.count < 3:
+            return np.nan
+        if self.m2 <= 1e-14 * max(abs(self.mean), 1) ** 2 * self.count: # In the case every value is the same.
+            return 0.0
+        return self.count * (self.count - 1) ** 0.5 / (self.count - 2) * (self.m3 / self.m2**1.5)
+
+class HyperLogLog:
+
+    '''
+    This class is used to approximately count the number of distinct values seen, using a fixed amount of memory.
+    The relative standard error of the count is about 1.04 / sqrt(2 ** precision), e.g. 0.8 % for the default precision of 14 (16,384 one byte registers), and the count is exact to within that error independent of the number of values.
+    Sketches of separate chunks can be merged into the sketch of all the chunks.
+
+    Attributes:
+        precision (int): the number of bits of each hash used to pick a register.
+        registers (np.ndarray): the registers of the sketch.
+    '''
+
+    def __init__(self, precision: int = 14):
+
+        '''
+        This method is used to initialise this instance of the HyperLogLog class.
+
+        Parameters:
+            precision (int): DEFAULT = 14, the number of bits of each hash used to pick a register, between 4 and 18.
+        '''
+
+        if not 4 <= precision <= 18:
+            raise ValueError(f"'precision' must be between 4 and 18, got {precision}.")
+        self.precision = precision
+        self.registers = np.zeros(2**precision, dtype='uint8')
+
+    def update(self, values: pd.Series):
+
+        '''
+        This method is used to add a chunk of values to the sketch, null values are ignored.
+
+        Parameters:
+            values (pd.Series): The values to add.
+        '''
+
+        values = values.dropna()
+        if len(values) == 0:
+            return
+        if values.dtype.kind in 'iufb': # Numbers are hashed as floats, so the same number read as an integer in one chunk and a float in another is counted once.
+            values = values.astype('float64')
+        hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+        remaining_bits = np.uint64(64 - self.precision)
+        register_index = (hashes >> remaining_bits).astype('int64') # The first bits of the hash pick the register.
+        remainder = hashes & np.uint64((1 << (64 - self.precision)) - 1) # The rest of the hash.
+
+        bit_length = np.zeros(len(remainder), dtype='int64') # Number of bits in the remainder, found with a binary search on the shifts.
+        for shift in (32, 16, 8, 4, 2, 1):
+            large = remainder >= np.uint64(1 << shift)
+            remainder = np.where(large, remainder >> np.uint64(shift), remainder)
+            bit_length += large * shift
+        bit_length += (remainder > 0)
+        leading_zeros_plus_one = (64 - self.precision) - bit_length + 1 # Position of the first set bit of the remainder.
+        np.maximum.at(self.registers, register_index, leading_zeros_plus_one.astype('uint8'))
+
+    def merge(self, other):
+
+        '''
+        This method is used to combine another sketch into this sketch.
+
+        Parameters:
+            other (HyperLogLog): The sketch to combine, this must have the same precision.
+
+        Returns:
+            HyperLogLog: This sketch.
+        '''
+
+        if other.precision != self.precision:
+            raise ValueError('Only sketches with the same precision can be merged.')
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+
+        '''
+        Returns:
+            int: The estimated number of distinct values.
+        '''
+
+        registers = len(self.registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(registers, 0.7213 / (1 + 1.079 / registers)) # The bias correction, the formula only holds from 128 registers.
+        estimate = alpha * registers**2 / np.sum(np.exp2(-self.registers.astype('float64')))
+        empty_registers = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * registers and empty_registers > 0: # Small range correction (linear counting).
+            estimate = registers * np.log(registers / empty_registers)
+        return int(round(estimate))
+
+class QuantileSketch:
+
+    '''
+    This class is used to approximately calculate quantiles (e.g. the median) of the values seen, using a fixed amount of memory.
+    A uniform random sample of at most 'size' values is kept, the quantiles of the sample estimate the quantiles of all the values.
+    By the Dvoretzky-Kiefer-Wolfowitz inequality, with probability 1 - delta the rank of the estimated quantile is within sqrt(ln(2 / delta) / (2 * size)) of the requested rank, e.g. 0.5 +/- 0.0051 for the median with the default size of 100,000 and delta = 0.01.
+    The quantiles are exact while no more than 'size' values have been seen. Sketches of separate chunks can be merged into the sketch of all the chunks.
+
+    Attributes:
+        size (int): the maximum number of values kept.
+        count (int): the number of values seen.
+        sample (np.ndarray): the values kept.
+    '''
+
+    def __init__(self, size: int = 100000, seed: int = 123):
+
+        '''
+        This method is used to initialise this instance of the QuantileSketch class.
+
+        Parameters:
+            size (int): DEFAULT = 100000, the maximum number of values kept.
+            seed (int): DEFAULT = 123, the seed of the random sampling, for reproducibility.
+        '''
+
+        self.size = size
+        self.count = 0
+        self.sample = np.array([], dtype='float64')
+        self.random = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray):
+
+        '''
+        This method is used to add a chunk of values to the sketch.
+
+        Parameters:
+            values (np.ndarray): The values to add, these must not contain NaN.
+        '''
+
+        chunk = QuantileSketch(self.size)
+        chunk.count = len(values)
+        chunk.sample = values if len(values) <= self.size else self.random.choice(values, self.size, replace=False)
+        self.merge(chunk)
+
+    def merge(self, other):
+
+        '''
+        This method is used to combine another sketch into this sketch, the kept values remain a uniform random sample of all the values seen.
+
+        Parameters:
+            other (QuantileSketch): The sketch to combine.
+
+        Returns:
+            QuantileSketch: This sketch.
+        '''
+
+        count = self.count + other.count
+        size = min(self.size, other.size)
+        if count <= size: # In the case every value fits in the sketch.
+            self.sample = np.concatenate([self.sample, other.sample])
+        else:
+            kept = min(size, count)
+            from_self = self.random.hypergeometric(self.count, other.count, kept) # Number of kept values drawn from each sketch in proportion to the values they have seen.
+            self.sample = np.concatenate([
+                self.random.choice(self.sample, from_self, replace=False),
+                self.random.choice(other.sample, kept - from_self, replace=False)
+            ])
+        self.count = count
+        self.size = size
+        return self
+
+    def quantile(self, q: float):
+
+        '''
+        Parameters:
+            q (float): The quantile, between 0 and 1 (e.g. 0.5 for the median).
+
+        Returns:
+            float: The estimated quantile, NaN if no values have been seen.
+        '''
+
+        return np.quantile(self.sample, q) if len(self.sample) > 0 else np.nan
+
+class ColumnSummary:
+
+    '''
+    This class is used to summarise a column chunk by chunk: the number of values and nulls, the moments and a quantile sketch of numeric values and a distinct count sketch of all values.
+    Summaries of separate chunks (or separate files) can be merged into the summary of all of them.
+
+    Attributes:
+        count (int): the number of values including nulls.
+        null_count (int): the number of null values.
+        is_numeric (bool): whether every chunk of the column was numeric.
+        moments (MomentSummary): the moments of the numeric values.
+        distinct (HyperLogLog): the distinct count sketch of the non-null values.
+        quantiles (QuantileSketch): the quantile sketch of the numeric values.
+    '''
+
+    def __init__(self, precision: int = 14, sketch_size: int = 100000):
+
+        '''
+        This method is used to initialise this instance of the ColumnSummary class.
+
+        Parameters:
+            precision (int): DEFAULT = 14, the precision of the distinct count sketch.
+            sketch_size (int): DEFAULT = 100000, the number of values kept by the quantile sketch.
+        '''
+
+        self.count = 0
+        self.null_count = 0
+        self.is_numeric = True
+        self.moments = MomentSummary()
+        self.distinct = HyperLogLog(precision)
+        self.quantiles = QuantileSketch(sketch_size)
+
+    def update(self, values: pd.Series):
+
+        '''
+        This method is used to add a chunk of a column to the summary.
+
+        Parameters:
+            values (pd.Series): The chunk of the column.
+        '''
+
+        nulls = values.isna()
+        self.count += len(values)
+        self.null_count += int(nulls.sum())
+        self.distinct.update(values)
+        if values.dtype.kind in 'iuf': # Moments and quantiles are only kept for numeric values.
+            numbers = values[~nulls].to_numpy(dtype='float64')
+            self.moments.update(numbers)
+            self.quantiles.update(numbers)
+        elif not nulls.all(): # A chunk of only nulls (which may be read as an 'object' column) doesn't change whether the column is numeric.
+            self.is_numeric = False
+
+    def merge(self, other):
+
+        '''
+        This method is used to combine another summary of the same column into this summary.
+
+        Parameters:
+            other (ColumnSummary): The summary to combine.
+
+        Returns:
+            ColumnSummary: This summary.
+        '''
+
+        self.count += other.count
+        self.null_count += other.null_count
+        self.is_numeric = self.is_numeric and other.is_numeric
+        self.moments.merge(other.moments)
+        self.distinct.merge(other.distinct)
+        self.quantiles.merge(other.quantiles)
+        return self
+
+    def null_percentage(self):
+
+        '''
+        Returns:
+            float: The percentage of null values.
+        '''
+
+        return self.null_count / self.count * 100 if self.count > 0 else np.nan
+
+    def count_distinct(self):
+
+        '''
+        Returns:
+            int: The estimated number of distinct values, where nulls count as one distinct value (as in DataFrameInfo.count_distinct()).
+        '''
+
+        return self.distinct.count() + (1 if self.null_count > 0 else 0)
+
+    def statistics(self):
+
+        '''
+        This method is used to calculate every statistic of the summary.
+
+        Returns:
+            dict: The 'count', 'null_count', 'null_percentage', 'sum', 'mean', 'median', 'standard_deviation', 'skewness' and 'distinct_count' of the column (NaN for statistics that only apply to numeric columns).
+        '''
+
+        numeric = self.is_numeric and self.moments.count > 0
+        return {
+            'count': self.count,
+            'null_count': self.null_count,
+            'null_percentage': self.null_percentage(),
+            'sum': self.moments.mean * self.moments.count if numeric else np.nan,
+            'mean': self.moments.get_mean() if numeric else np.nan,
+            'median': self.quantiles.quantile(0.5) if numeric else np.nan,
+            'standard_deviation': self.moments.get_standard_deviation() if numeric else np.nan,
+            'skewness': self.moments.get_skewness() if numeric else np.nan,
+            'distinct_count': self.count_distinct()
+        }
+
+class StreamingDataFrameInfo:
+
+    '''
+    This class is used to retrieve statistics from a csv or Parquet file that is too large to load into memory, by reading it in chunks and combining a summary of each chunk.
+    The mean, standard deviation, null count, null percentage and skewness are exact. The distinct count is approximate (HyperLogLog, relative standard error of about 1.04 / sqrt(2 ** precision)) and the median is approximate (uniform sample, rank error bounded by sqrt(ln(2 / delta) / (2 * sketch_size)) with probability 1 - delta), both are exact for small files.
+    Each method accepts either the path of a file, which is read once for that call, or the summaries returned by summarise(), so that several statistics can be retrieved from a single read.
+
+    Attributes:
+        chunk_size (int): the number of rows read at a time.
+        precision (int): the precision of the distinct count sketches.
+        sketch_size (int): the number of values kept by the quantile sketches.
+    '''
+
+    def __init__(self, chunk_size: int = 100000, precision: int = 14, sketch_size: int = 100000):
+
+        '''
+        This method is used to initialise this instance of the StreamingDataFrameInfo class.
+
+        Parameters:
+            chunk_size (int): DEFAULT = 100000, the number of rows read at a time, memory use depends on this rather than the size of the file.
+            precision (int): DEFAULT = 14, the precision of the distinct count sketches.
+            sketch_size (int): DEFAULT = 100000, the number of values kept by the quantile sketches.
+        '''
+
+        self.chunk_size = chunk_size
+        self.precision = precision
+        self.sketch_size = sketch_size
+
+    def read_chunks(self, file_path: str, columns: list = None):
+
+        '''
+        This method is used to read a csv or Parquet file in chunks of rows.
+
+        Parameters:
+            file_path (str): The path of the file, files ending in '.parquet' are read as Parquet, otherwise as csv.
+            columns (list): DEFAULT = None, the columns to read (the default reads every column).
+
+        Yields:
+            pd.DataFrame: The next chunk of rows.
+        '''
+
+        if os.path.splitext(file_path)[1] == '.parquet':
+            for batch in pq.ParquetFile(file_path).iter_batches(batch_size=self.chunk_size, columns=columns):
+                yield batch.to_pandas()
+        else:
+            yield from pd.read_csv(file_path, usecols=columns, chunksize=self.chunk_size)
+
+    def summarise(self, file_path: str, columns: list = None):
+
+        '''
+        This method is used to summarise every column of a file in a single read.
+
+        Parameters:
+            file_path (str): The path of the csv or Parquet file.
+            columns (list): DEFAULT = None, the columns to summarise (the default summarises every column).
+
+        Returns:
+            dict: A ColumnSummary for each column.
+        '''
+
+        summaries = {}
+        for chunk in self.read_chunks(file_path, columns): # For each chunk of rows in the file.
+            for column in chunk.columns:
+                if column not in summaries:
+                    summaries[column] = ColumnSummary(self.precision, self.sketch_size)
+                summaries[column].update(chunk[column])
+        return summaries
+
+    def get_summaries(self, source, column_name: str = None):
+
+        '''
+        This method is used to get the summaries of a file, or to check summaries that have already been calculated.
+
+        Parameters:
+            source: The path of a csv or Parquet file, or a dictionary of summaries from summarise().
+            column_name (str): DEFAULT = None, the column that is needed (the default needs every column).
+
+        Returns:
+            dict: A ColumnSummary for each column.
+        '''
+
+        summaries = self.summarise(source, None if column_name is None else [column_name]) if isinstance(source, str) else source
+        if column_name is not None and column_name not in summaries: # In the case the provided column_name is NOT in the file.
+            raise ValueError(f"Column '{column_name}' not found in the dataframe.")
+        return summaries
+
+    def statistic(self, source, column_name: str, calculate, numeric_only: bool):
+
+        '''
+        This method is used to calculate a statistic from the summaries of a column or of every column.
+
+        Parameters:
+            source: The path of a csv or Parquet file, or a dictionary of summaries from summarise().
+            column_name (str): The name of the column, or None for every column.
+            calculate: A function which calculates the statistic from a ColumnSummary.
+            numeric_only (bool): If True, only numeric columns are included when column_name is None.
+
+        Returns:
+            IF column_name is specified, the statistic of the column, otherwise a pd.Series of the statistic of each column.
+        '''
+
+        summaries = self.get_summaries(source, column_name)
+        if column_name is not None:
+            return calculate(summaries[column_name])
+        return pd.Series({column: calculate(summary) for column, summary in summaries.items() if summary.is_numeric or not numeric_only})
+
+    def mean(self, source, column_name: str = None):
+
+        '''
+        This method will provide the exact mean value of a column or of every numeric column.
+        '''
+
+        return self.statistic(source, column_name, lambda summary: summary.moments.get_mean(), numeric_only=True)
+
+    def standard_deviation(self, source, column_name: str = None):
+
+        '''
+        This method will provide the exact standard deviation of a column or of every numeric column.
+        '''
+
+        return self.statistic(source, column_name, lambda summary: summary.moments.get_standard_deviation(), numeric_only=True)
+
+    def skewness(self, source, column_name: str = None):
+
+        '''
+        This method will provide the exact skewness of a column or of every numeric column.
+        '''
+
+        return self.statistic(source, column_name, lambda summary: summary.moments.get_skewness(), numeric_only=True)
+
+    def median(self, source, column_name: str = None):
+
+        '''
+        This method will provide the approximate median value of a column or of every numeric column (exact while the column has no more values than the sketch size).
+        '''
+
+        return self.statistic(source, column_name, lambda summary: summary.quantiles.quantile(0.5), numeric_only=True)
+
+    def null_count(self, source, column_name: str = None):
+
+        '''
+        This method will count the number of null values within a column or every column.
+        '''
+
+        return self.statistic(source, column_name, lambda summary: summary.null_count, numeric_only=False)
+
+    def null_percentage(self, source, column_name: str = None):
+
+        '''
+        This method will provide the percentage of null values within a column or every column.
+        '''
+
+        return self.statistic(source, column_name, lambda summary: summary.null_percentage(), numeric_only=False)
+
+    def count_distinct(self, source, column_name: str):
+
+        '''
+        This method will provide the approximate number of unique or distinct values within a specified column.
+        '''
+
+        return self.statistic(source, column_name, lambda summary: summary.count_distinct(), numeric_only=False)
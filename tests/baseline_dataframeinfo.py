@@ -0,0 +1,73 @@
+'''
+This module contains the original row-wise implementations of the DataFrameInfo() projection methods, which the tests check the vectorised methods against and the benchmarks time them against.
+'''
+
+import pandas as pd
+
+
+def calculate_total_collections_over_period(DataFrame: pd.DataFrame, period: int):
+
+    '''
+    This is the original DataFrameInfo().calculate_total_collections_over_period(), which uses row-wise apply() calls.
+    '''
+
+    collections_df = DataFrame.copy() # Create copy of the dataframe.
+
+    final_payment_date = collections_df['last_payment_date'].max() # identifies the final payment date.
+
+    def calculate_term_end(row): # Function used to calculate term end according to term length and issue date.
+        if row['term'] == '36 months': # In 36 month terms
+            return row['issue_date'] + 36 # Term end will be 36 months after issue date.
+        elif row['term'] == '60 months': # In 60 month terms
+            return row['issue_date'] + 60 # Term end will be 60 months after issue date.
+
+    # Apply the function to create the new 'term_end_date' column
+    collections_df['term_end_date'] = collections_df.apply(calculate_term_end, axis=1)
+
+    collections_df['mths_left'] = collections_df['term_end_date'] - final_payment_date # calculate number of months between term end and final payment date.
+    collections_df['mths_left'] = collections_df['mths_left'].apply(lambda x: x.n) # Extract integer value from 'mths_left' column.
+
+    collections_df = collections_df[collections_df['mths_left']>0] # filter in only current loans.
+
+    def calculate_collections(row): # Define function to sum collections over projection period.
+        if row['mths_left'] >= period: # If months left in term are equal to or greater than projection period.
+            return row['instalment'] * period #  projection period * Installments.
+        elif row['mths_left'] < period: # If less than projection period months left in term.
+            return row['instalment'] * row['mths_left'] # number of months left * installments.
+
+    collections_df['collections_over_period'] = collections_df.apply(calculate_collections, axis=1) # Apply method to each row to get total collections in projected perid.
+
+    collection_sum = collections_df['collections_over_period'].sum()
+    total_loan = collections_df['loan_amount'].sum()
+    total_loan_left = total_loan - collections_df['total_payment'].sum()
+
+    return {'total_collections': collection_sum, 'total_loan': total_loan, 'total_loan_outstanding': total_loan_left}
+
+def revenue_lost_by_month(DataFrame: pd.DataFrame):
+
+    '''
+    This is the original DataFrameInfo().revenue_lost_by_month(), which filters the dataframe again for every month.
+    '''
+
+    df = DataFrame.copy() # Create a copy of dataframe to avoid altering original.
+
+    df['term_completed'] = (df['last_payment_date'] - df['issue_date']) # Calculating how much of each term was completed.
+    df['term_completed'] = df['term_completed'].apply(lambda x: x.n) # Converting the row into an integer.
+
+    def calculate_term_remaining(row): # Function used to calculate months remaining in term for each row.
+        if row['term'] == '36 months': # In 36 month terms
+            return 36 - row['term_completed'] # Term remaining is term length - how much of term was completed.
+        elif row['term'] == '60 months': # In 60 month terms
+            return 60 - row['term_completed'] # Term remaining is term length - how much of term was completed.
+
+    df['term_left'] = df.apply(calculate_term_remaining, axis=1) # Applying function to calculate term left for each loan.
+
+    revenue_lost = [] # Empty list
+    cumulative_revenue_lost = 0
+    for month in range(1, (df['term_left'].max()+1)): # For each month in the maximum number of months left in any term.
+        df = df[df['term_left']>0] # Filter out any terms which have no months left.
+        cumulative_revenue_lost += df['instalment'].sum() # Cumulatively sum the total number of monthly instalments.
+        revenue_lost.append(cumulative_revenue_lost) # Add this cumulative sum to list of revenue projected to be lost.
+        df['term_left'] = df['term_left'] - 1 # Take away one from the number of terms left.
+
+    return revenue_lost
@@ -0,0 +1,37 @@
+'''
+This script is used to time the original row-wise calculate_total_collections_over_period() against the vectorised DataFrameInfo() method on synthetic loans, checking that both give the same result.
+
+Usage:
+    python tests/benchmark_collections.py --rows 100000 1000000 10000000 --period 6
+'''
+
+import argparse
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # The modules are at the top level of the repository.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import baseline_dataframeinfo as baseline
+from dataframeinfo import DataFrameInfo
+from loan_fixtures import synthetic_loans, timed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Times the row-wise and vectorised collection projections.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000, 1000000, 10000000], help='the numbers of loans to time')
+    parser.add_argument('--period', type=int, default=6, help='the number of months projected')
+    parser.add_argument('--baseline-max-rows', type=int, default=None, help='the largest number of loans the row-wise method is timed on, as it takes minutes on millions of rows (the default times every size)')
+    arguments = parser.parse_args()
+
+    info = DataFrameInfo()
+    print(f"{'rows':>12}{'row-wise (s)':>16}{'vectorised (s)':>16}{'speedup':>10}{'  same result'}")
+    for rows in arguments.rows:
+        loans = synthetic_loans(rows)
+        result, vectorised_seconds = timed(info.calculate_total_collections_over_period, loans, arguments.period)
+        if arguments.baseline_max_rows is not None and rows > arguments.baseline_max_rows: # In the case the row-wise method is skipped for this size.
+            print(f'{rows:>12,}{"skipped":>16}{vectorised_seconds:>16.3f}{"":>10}')
+            continue
+        expected, baseline_seconds = timed(baseline.calculate_total_collections_over_period, loans, arguments.period)
+        same = all(np.isclose(result[key], expected[key]) for key in expected)
+        print(f'{rows:>12,}{baseline_seconds:>16.3f}{vectorised_seconds:>16.3f}{baseline_seconds / vectorised_seconds:>10.0f}{str(same):>13}')
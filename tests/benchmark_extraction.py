@@ -0,0 +1,38 @@
+'''
+This script is used to time the extraction of the 'loan_payments' table from a local SQLite stand-in database, comparing the single query of extract_loans_data() with extract_loans_data_partitioned() for an increasing number of workers.
+
+Usage:
+    python tests/benchmark_extraction.py --rows 1000000 --workers 1 2 4 8
+'''
+
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # The modules are at the top level of the repository.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from db_utils import RDSDatabaseConnector, save_data_to_sqlite
+from loan_fixtures import best_time, database_loans
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Times partitioned extraction from a SQLite stand-in database.')
+    parser.add_argument('--rows', type=int, default=1000000, help='the number of rows in the table')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='the numbers of workers to time')
+    parser.add_argument('--partitions', type=int, default=16, help='the number of id ranges')
+    parser.add_argument('--repeats', type=int, default=3, help='the number of runs of each method, the fastest is reported')
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        connector = RDSDatabaseConnector({})
+        connector.create_engine(save_data_to_sqlite(database_loans(arguments.rows), os.path.join(directory, 'loan_payments.db')), pool_size=max(arguments.workers))
+
+        baseline = best_time(connector.extract_loans_data, arguments.repeats)
+        print(f'{arguments.rows:,} rows, {os.cpu_count()} cores')
+        print(f"{'method':<28}{'seconds':>10}{'speedup':>10}")
+        print(f"{'extract_loans_data':<28}{baseline:>10.3f}{1:>10.2f}")
+        for workers in arguments.workers: # The same ranges are fetched by an increasing number of workers.
+            seconds = best_time(lambda: connector.extract_loans_data_partitioned('id', arguments.partitions, workers), arguments.repeats)
+            print(f"{f'partitioned, {workers} workers':<28}{seconds:>10.3f}{baseline / seconds:>10.2f}")
+        connector.engine.dispose()
@@ -0,0 +1,37 @@
+'''
+This script is used to time the original revenue_lost_by_month() against the DataFrameInfo() method built on cumulative_instalments_by_month(), on the charged off and risky subsets of synthetic loans, checking that both give the same result.
+
+Usage:
+    python tests/benchmark_revenue_lost.py --rows 100000 1000000
+'''
+
+import argparse
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))) # The modules are at the top level of the repository.
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import baseline_dataframeinfo as baseline
+from dataframeinfo import DataFrameInfo
+from loan_fixtures import synthetic_loans, timed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Times the original and cumulative sum revenue lost by month.')
+    parser.add_argument('--rows', type=int, nargs='+', default=[100000, 1000000], help='the numbers of loans, the subsets are taken from these')
+    arguments = parser.parse_args()
+
+    info = DataFrameInfo()
+    print(f"{'rows':>12}{'subset':>14}{'subset rows':>13}{'original (s)':>14}{'cumsum (s)':>12}{'speedup':>10}{'  same result'}")
+    for rows in arguments.rows:
+        loans = synthetic_loans(rows)
+        subsets = {
+            'charged off': loans[loans['loan_status'] == 'Charged Off'],
+            'risky': loans[loans['loan_status'].isin(['Late (31-120 days)', 'In Grace Period', 'Default'])]
+        }
+        for name, subset in subsets.items():
+            result, new_seconds = timed(info.revenue_lost_by_month, subset)
+            expected, baseline_seconds = timed(baseline.revenue_lost_by_month, subset)
+            same = len(result) == len(expected) and np.allclose(result, expected)
+            print(f'{rows:>12,}{name:>14}{len(subset):>13,}{baseline_seconds:>14.3f}{new_seconds:>12.4f}{baseline_seconds / new_seconds:>10.0f}{str(same):>13}')
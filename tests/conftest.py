@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The modules are at the top level of the repository, and the test helpers (fixtures and baseline implementations) are in this folder, so both are added to the import path.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -0,0 +1,87 @@
+'''
+This module is used to create synthetic loans with the columns used by the DataFrameInfo() projections, and to time functions, for the tests and benchmarks.
+'''
+
+import time
+import numpy as np
+import pandas as pd
+
+
+def synthetic_loans(rows: int, seed: int = 123):
+
+    '''
+    This function is used to create a dataframe of loans with 'period[M]' dates, where some loans have months of their term left, some have exactly none left and some are past their term.
+
+    Args:
+        rows (int): The number of loans.
+        seed (int): DEFAULT = 123, the random seed, for reproducibility.
+
+    Returns:
+        (pd.DataFrame): the loans.
+    '''
+
+    rng = np.random.default_rng(seed)
+    term_months = rng.choice([36, 60], rows)
+    issue_date = pd.period_range('2015-01', '2021-12', freq='M')[rng.integers(0, 84, rows)] # Issue dates from January 2015 to December 2021.
+    months_paid = np.minimum(rng.integers(0, term_months + 7), pd.Period('2021-12', 'M').ordinal - issue_date.asi8) # Up to 6 months past the term, with no payment after December 2021.
+    loan_amount = rng.uniform(500, 35000, rows).round(2)
+    return pd.DataFrame({
+        'id': np.arange(1, rows + 1),
+        'loan_amount': loan_amount,
+        'instalment': (loan_amount / term_months * rng.uniform(1.05, 1.4, rows)).round(2),
+        'total_payment': (loan_amount * rng.uniform(0, 1.2, rows)).round(2),
+        'term': np.where(term_months == 36, '36 months', '60 months'),
+        'issue_date': issue_date,
+        'last_payment_date': issue_date + months_paid,
+        'loan_status': rng.choice(['Fully Paid', 'Current', 'Charged Off', 'Late (31-120 days)', 'In Grace Period', 'Default'], rows, p=[0.45, 0.35, 0.1, 0.05, 0.03, 0.02])
+    })
+
+def database_loans(rows: int, seed: int = 123):
+
+    '''
+    This function is used to create the synthetic loans as they are stored in the 'loan_payments' table, with the dates as text (e.g. 'Jan-2021').
+
+    Args:
+        rows (int): The number of loans.
+        seed (int): DEFAULT = 123, the random seed, for reproducibility.
+
+    Returns:
+        (pd.DataFrame): the loans.
+    '''
+
+    loans = synthetic_loans(rows, seed)
+    for column in ['issue_date', 'last_payment_date']: # Periods can't be written to a database.
+        loans[column] = loans[column].dt.strftime('%b-%Y')
+    return loans
+
+def timed(function, *args):
+
+    '''
+    This function is used to run a function once and time it.
+
+    Args:
+        function: The function to run.
+        *args: The arguments of the function.
+
+    Returns:
+        (tuple): the result of the function and the run time in seconds.
+    '''
+
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+def best_time(function, repeats: int):
+
+    '''
+    This function is used to get the fastest of several runs of a function, which is the least affected by other processes.
+
+    Args:
+        function: A function with no arguments.
+        repeats (int): The number of runs.
+
+    Returns:
+        (float): the fastest run time in seconds.
+    '''
+
+    return min(timed(function)[1] for _ in range(repeats))
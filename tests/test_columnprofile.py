@@ -0,0 +1,34 @@
+import warnings
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+import pytest
+import parallelprofile
+from columnprofile import ColumnProfile
+from loan_fixtures import synthetic_loans
+
+
+def failing_summary(memory_name: str, shape: tuple, start: int, stop: int):
+    raise RuntimeError(memory_name) # The name of the block is sent back so the test can check it was unlinked.
+
+@pytest.fixture(scope='module')
+def loans():
+    loans = synthetic_loans(2000)
+    loans.loc[loans.index % 7 == 0, 'instalment'] = np.nan
+    loans['funded_amount'] = pd.array(np.where(loans.index % 5 == 0, None, loans['id'] * 10), dtype='Int64')
+    return loans
+
+@pytest.mark.parametrize('numeric_only', [False, True])
+def test_parallel_profile_matches_serial(loans, numeric_only):
+    df = loans.select_dtypes('number') if numeric_only else loans
+    with warnings.catch_warnings():
+        warnings.simplefilter('error') # A FutureWarning from concatenating an empty series fails the test.
+        parallel = ColumnProfile(df, n_jobs=2).summary()
+    pd.testing.assert_frame_equal(parallel, ColumnProfile(df).summary(), check_exact=False, rtol=1e-9)
+
+def test_shared_memory_is_unlinked_after_worker_error(loans, monkeypatch):
+    monkeypatch.setattr(parallelprofile, 'summarise_column_group', failing_summary)
+    with pytest.raises(RuntimeError) as error:
+        ColumnProfile(loans, n_jobs=2).summary()
+    with pytest.raises(FileNotFoundError): # The block no longer exists.
+        shared_memory.SharedMemory(name=str(error.value))
@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+import baseline_dataframeinfo as baseline
+from dataframeinfo import DataFrameInfo
+from loan_fixtures import synthetic_loans
+
+
+@pytest.fixture(scope='module')
+def loans():
+    return synthetic_loans(3000)
+
+@pytest.mark.parametrize('period', [1, 6, 24, 61])
+def test_total_collections_match_baseline(loans, period):
+    expected = baseline.calculate_total_collections_over_period(loans, period)
+    result = DataFrameInfo().calculate_total_collections_over_period(loans, period)
+    assert result == pytest.approx(expected)
+
+def test_collection_projections_match_baseline(loans):
+    projections = DataFrameInfo().collection_projections(loans, 12)
+    expected = [baseline.calculate_total_collections_over_period(loans, period)['total_collections'] for period in range(1, 13)]
+    assert projections['total_collections'] == pytest.approx(expected)
+
+def test_total_collections_does_not_alter_dataframe(loans):
+    columns = list(loans.columns)
+    DataFrameInfo().calculate_total_collections_over_period(loans, 6)
+    assert list(loans.columns) == columns
+
+def loan_subsets(loans):
+    return {
+        'every loan': loans,
+        'charged off': loans[loans['loan_status'] == 'Charged Off'],
+        'risky': loans[loans['loan_status'].isin(['Late (31-120 days)', 'In Grace Period', 'Default'])]
+    }
+
+@pytest.mark.parametrize('subset', ['every loan', 'charged off', 'risky'])
+def test_revenue_lost_by_month_matches_baseline(loans, subset):
+    df = loan_subsets(loans)[subset]
+    expected = baseline.revenue_lost_by_month(df)
+    result = DataFrameInfo().revenue_lost_by_month(df)
+    assert len(result) == len(expected)
+    assert result == pytest.approx(expected)
+
+def test_revenue_lost_by_month_edge_terms(loans):
+    df = loans.head(3).copy()
+    df['term'] = ['36 months', '36 months', '60 months']
+    df['issue_date'] = pd.PeriodIndex(['2018-01', '2018-01', '2021-01'], freq='M')
+    df['last_payment_date'] = pd.PeriodIndex(['2021-01', '2021-07', '2021-12'], freq='M') # 0 months left, 6 months past the term and 49 months left.
+    expected = baseline.revenue_lost_by_month(df)
+    assert len(expected) == 49
+    assert DataFrameInfo().revenue_lost_by_month(df) == pytest.approx(expected)
+
+def test_revenue_lost_by_month_with_no_term_left(loans):
+    df = loans.head(2).copy()
+    df['term'] = '36 months'
+    df['issue_date'] = pd.PeriodIndex(['2018-01', '2018-01'], freq='M')
+    df['last_payment_date'] = pd.PeriodIndex(['2021-01', '2021-07'], freq='M') # 0 months left and past the term.
+    assert DataFrameInfo().revenue_lost_by_month(df) == baseline.revenue_lost_by_month(df) == []
+
+def test_get_skewness_only_calculates_listed_columns(loans, monkeypatch):
+    profiled = []
+    monkeypatch.setattr(DataFrameInfo, 'profile_columns', lambda self, DataFrame, profile=None: profiled.append(DataFrame))
+    skewness = DataFrameInfo().get_skewness(loans, ['loan_amount'])
+    assert profiled == []
+    assert skewness['loan_amount'] == pytest.approx(loans['loan_amount'].skew())
+
+def test_get_skewness_reads_a_provided_profile(loans):
+    info = DataFrameInfo()
+    profile = info.profile_columns(loans)
+    skewness = info.get_skewness(loans, ['loan_amount', 'instalment'], profile)
+    assert skewness == pytest.approx({'loan_amount': loans['loan_amount'].skew(), 'instalment': loans['instalment'].skew()})
+
+@pytest.mark.parametrize('null_dtype', ['float64', 'object'])
+def test_merged_shard_summaries_match_whole_frame(loans, null_dtype):
+    loans = loans.assign(int_rate=(loans['instalment'] / loans['loan_amount'] * 100).where(loans.index % 7 != 0))
+    shards = [loans.iloc[:1000].copy(), loans.iloc[1000:1800].copy(), loans.iloc[1800:].copy()]
+    shards[1]['int_rate'] = pd.Series(np.nan if null_dtype == 'float64' else None, index=shards[1].index, dtype=null_dtype) # A shard where the column is entirely null.
+    loans = pd.concat(shards)
+    columns = ['loan_amount', 'instalment', 'int_rate', 'term']
+    info = DataFrameInfo()
+    merged = info.summary_statistics(info.merge_summaries(*[info.summarise(shard, columns) for shard in shards]))
+    for column in ['loan_amount', 'instalment', 'int_rate']:
+        values = loans[column].astype('float64')
+        expected = {'count': len(values), 'null_count': values.isna().sum(), 'sum': values.sum(), 'mean': values.mean(), 'median': values.median(), 'standard_deviation': values.std(), 'skewness': values.skew()}
+        for statistic, value in expected.items():
+            assert merged.loc[column, statistic] == pytest.approx(value, rel=1e-9), (column, statistic)
+        assert merged.loc[column, 'distinct_count'] == pytest.approx(values.nunique(dropna=False), rel=3 * 1.04 / 2**7) # Within 3 standard errors of the HyperLogLog sketch.
+    assert merged.loc['term', 'distinct_count'] == loans['term'].nunique()
+    assert np.isnan(merged.loc['term', 'mean'])
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+import warnings
+from dataframetransform import DataFrameTransform
+from featurematrix import FeatureMatrixBuilder
+from imputationmodels import CLASSIFIER_BACKENDS
+from loan_fixtures import synthetic_loans
+
+
+FEATURES = ['loan_amount', 'instalment', 'term', 'issue_date']
+
+@pytest.fixture
+def loans():
+    loans = synthetic_loans(2000)
+    loans['int_rate'] = (loans['instalment'] / loans['loan_amount'] * 100).astype('float32')
+    loans.loc[loans.index % 9 == 0, 'int_rate'] = np.nan
+    loans.loc[loans.index % 11 == 0, 'loan_status'] = np.nan
+    return loans
+
+def test_linear_regression_fill_keeps_float_type(loans):
+    filled = DataFrameTransform().linear_regression_fill(loans, 'int_rate', FEATURES)
+    assert filled['int_rate'].dtype == 'float32'
+    assert filled['int_rate'].notna().all()
+
+def test_batch_impute_matches_single_column_fills(loans):
+    models = {'int_rate': 'linear_regression', 'loan_status': 'gradient_boosting'}
+    batch = DataFrameTransform().batch_impute(loans.copy(), models, {column: FEATURES for column in models}, max_workers=1)
+    single = DataFrameTransform().linear_regression_fill(loans.copy(), 'int_rate', FEATURES)
+    single = DataFrameTransform().support_vector_machine_fill(single, 'loan_status', FEATURES, backend='gradient_boosting')
+    assert batch['int_rate'].dtype == single['int_rate'].dtype == 'float32'
+    assert batch['loan_status'].dtype == single['loan_status'].dtype
+    pd.testing.assert_frame_equal(batch, single)
+
+def test_predictions_in_chunks_match(loans):
+    whole = DataFrameTransform().support_vector_machine_fill(loans.copy(), 'loan_status', FEATURES, backend='linear_svm')
+    chunked = DataFrameTransform().support_vector_machine_fill(loans.copy(), 'loan_status', FEATURES, backend='linear_svm', chunk_size=17, prediction_workers=2)
+    pd.testing.assert_frame_equal(whole, chunked)
+
+def test_batch_impute_writes_through_feature_builder(loans, monkeypatch):
+    written = []
+    write_column = FeatureMatrixBuilder.write_column
+    def record(self, column_name, rows, values):
+        written.append(column_name)
+        write_column(self, column_name, rows, values)
+    monkeypatch.setattr(FeatureMatrixBuilder, 'write_column', record)
+    DataFrameTransform().batch_impute(loans, {'int_rate': 'linear_regression'}, {'int_rate': FEATURES}, max_workers=1)
+    assert written == ['int_rate']
+    assert loans['int_rate'].notna().all()
+
+@pytest.mark.parametrize('backend', ['linear_svm', 'kernel_approximation'])
+def test_stochastic_gradient_descent_fill_converges(loans, backend):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error') # A ConvergenceWarning fails the test.
+        filled = DataFrameTransform().support_vector_machine_fill(loans, 'loan_status', FEATURES, backend=backend)
+    assert filled['loan_status'].notna().all()
+
+def test_compare_classifier_backends_reports_every_backend(loans):
+    comparison = DataFrameTransform().compare_classifier_backends(loans, 'loan_status', FEATURES)
+    assert list(comparison.index) == list(CLASSIFIER_BACKENDS)
+    assert comparison['fit_time'].ge(0).all() and comparison['accuracy'].between(0, 1).all()
+    known = loans['loan_status'].notna().sum()
+    assert comparison.loc['linear_svm', 'training_rows'] == known - int(np.ceil(known * 0.2)) # The test rows are rounded up.
+
+def test_lazy_pipeline_matches_eager_methods(loans):
+    loans = loans.assign(total_payment=loans['total_payment'].where(loans.index % 5 != 0), empty=np.nan)
+    original = loans.copy()
+    transform = DataFrameTransform()
+    with warnings.catch_warnings():
+        warnings.simplefilter('error') # e.g. a SettingWithCopyWarning from filling a selection of rows.
+        eager = transform.remove_null_rows(loans, 'loan_status')
+        eager = transform.fill_median(eager, 'int_rate')
+        eager = transform.drop_outlier_rows(eager, 'total_payment', 2)
+        eager = transform.fill_mean(eager, 'total_payment')
+        eager = transform.remove_null_columns(eager, 'empty')
+    lazy = transform.pipeline(loans).remove_null_rows('loan_status').fill_median('int_rate').drop_outlier_rows('total_payment', 2).fill_mean('total_payment').remove_null_columns('empty').collect()
+    pd.testing.assert_frame_equal(lazy, eager)
+    pd.testing.assert_frame_equal(loans, original) # Neither alters the dataframe passed in.
+
+def test_batch_impute_in_parallel_matches_serial(loans):
+    models = {'int_rate': 'linear_regression', 'loan_status': 'gradient_boosting', 'total_payment': 'linear_regression'}
+    loans = loans.assign(total_payment=loans['total_payment'].where(loans.index % 13 != 0))
+    features = {'int_rate': FEATURES, 'loan_status': FEATURES, 'total_payment': FEATURES + ['int_rate']} # 'total_payment' is imputed after 'int_rate'.
+    serial = DataFrameTransform().batch_impute(loans.copy(), models, features, max_workers=1)
+    parallel = DataFrameTransform().batch_impute(loans.copy(), models, features, max_workers=2)
+    pd.testing.assert_frame_equal(parallel, serial)
+    assert parallel[list(models)].notna().all().all()
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+from dataloader import DataLoader
+
+
+def loans():
+    return pd.DataFrame({
+        'id': np.arange(1, 101),
+        'funded_amount': np.linspace(1000, 1234567.89, 100).round(2), # Money amounts that float32 can't hold exactly.
+        'int_rate': np.resize([7.5, 12.25, np.nan], 100), # Values that float32 holds exactly.
+        'term': np.resize(['36 months', '60 months'], 100),
+        'issue_date': np.resize(['Jan-2021', 'Feb-2022'], 100)
+    })
+
+def test_only_exact_float_columns_are_downcast():
+    df = loans()
+    optimised = DataLoader().optimise_dtypes(df)
+    assert optimised['funded_amount'].dtype == 'float64'
+    assert (optimised['funded_amount'] == df['funded_amount']).all()
+    assert optimised['int_rate'].dtype == 'float32'
+    pd.testing.assert_series_equal(optimised['int_rate'].astype('float64'), df['int_rate'])
+
+def test_schema_types():
+    optimised = DataLoader().optimise_dtypes(loans())
+    assert optimised['id'].dtype == 'int8'
+    assert isinstance(optimised['term'].dtype, pd.CategoricalDtype)
+    assert optimised['issue_date'].dtype == 'period[M]'
+
+def test_load_csv_matches_optimise_dtypes(tmp_path):
+    loans().to_csv(tmp_path / 'loans.csv', index=False)
+    loaded = DataLoader().load_csv(str(tmp_path / 'loans.csv'), chunk_size=30)
+    assert loaded['funded_amount'].tolist() == loans()['funded_amount'].tolist()
+    assert loaded['term'].cat.categories.tolist() == ['36 months', '60 months']
+
+def test_load_csv_is_quiet_by_default(tmp_path, capsys):
+    pd.DataFrame({'loan_amount': [1000.0, 2500.0], 'term': ['36 months', '60 months']}).to_csv(tmp_path / 'loans.csv', index=False)
+    DataLoader().load_csv(str(tmp_path / 'loans.csv'))
+    assert capsys.readouterr().out == ''
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datatransform import DataTransform
+
+
+def original_convert_string_to_date(column: pd.Series):
+    return pd.to_datetime(column, errors='coerce').dt.to_period('M')
+
+@pytest.mark.parametrize('strings', [
+    ['Jan-2021', 'Feb-2022', None, 'Mar-2021'],
+    ['01/02/2020', '03/04/2021', '12/01/2019'], # Ambiguous, parsed month first.
+    ['2020-01-15', '2021-12-01', None]
+])
+def test_convert_string_to_date_matches_original(strings):
+    df = pd.DataFrame({'issue_date': np.resize(np.array(strings, dtype='object'), 50)})
+    expected = original_convert_string_to_date(df['issue_date'])
+    result = DataTransform().convert_string_to_date(df.copy(), 'issue_date')['issue_date']
+    pd.testing.assert_series_equal(result, expected)
+
+def test_ambiguous_dates_are_month_first():
+    df = pd.DataFrame({'issue_date': ['01/02/2020', '05/06/2021']})
+    assert DataTransform().convert_string_to_date(df, 'issue_date')['issue_date'].tolist() == [pd.Period('2020-01', 'M'), pd.Period('2021-05', 'M')]
+
+def test_cache_is_kept_for_each_inferred_format():
+    transform = DataTransform()
+    month_first = pd.DataFrame({'date': ['01/02/2020', '12/31/2020']})
+    day_first = pd.DataFrame({'date': ['01/02/2020', '31/12/2020']}) # Only day first parses every string.
+    assert transform.convert_string_to_date(month_first, 'date')['date'][0] == pd.Period('2020-01', 'M')
+    assert transform.convert_string_to_date(day_first, 'date')['date'][0] == pd.Period('2020-02', 'M')
+
+def test_date_cache_round_trip(tmp_path):
+    cache_path = str(tmp_path / 'dates.json')
+    df = pd.DataFrame({'date': ['Jan-2021', 'Feb-2022', 'not a date']})
+    first = DataTransform().convert_string_to_date(df.copy(), 'date', cache_path=cache_path)
+    second = DataTransform().convert_string_to_date(df.copy(), 'date', cache_path=cache_path)
+    pd.testing.assert_frame_equal(first, second)
+    assert second['date'].isna().tolist() == [False, False, True]
+
+SPEC = {
+    'term': [('extract_integer',)],
+    'employment_length': [('replace', '< 1 year', '0 years'), ('replace', '10+ years', '10 years'), ('extract_integer',)],
+    'issue_date': [('to_date', '%b-%Y')]
+}
+
+def raw_loans():
+    return pd.DataFrame({
+        'term': np.resize(np.array(['36 months', '60 months', None], dtype='object'), 60),
+        'employment_length': np.resize(np.array(['< 1 year', '10+ years', '3 years', None, '1 year'], dtype='object'), 60),
+        'issue_date': np.resize(np.array(['Jan-2021', 'Feb-2022', None, 'Mar-2021'], dtype='object'), 60)
+    })
+
+def test_transform_spec_matches_eager_methods():
+    eager = DataTransform()
+    expected = raw_loans()
+    expected = eager.extract_integer_from_string(expected, 'term')
+    expected = eager.replace_string_text(expected, 'employment_length', '< 1 year', '0 years')
+    expected = eager.replace_string_text(expected, 'employment_length', '10+ years', '10 years')
+    expected = eager.extract_integer_from_string(expected, 'employment_length')
+    expected = eager.convert_string_to_date(expected, 'issue_date', '%b-%Y')
+    pd.testing.assert_frame_equal(DataTransform().apply_transform_spec(raw_loans(), SPEC), expected)
+
+def test_transform_spec_skips_transformed_columns_until_replaced():
+    transform = DataTransform()
+    df = transform.apply_transform_spec(raw_loans(), SPEC)
+    expected = df.copy()
+    pd.testing.assert_frame_equal(transform.apply_transform_spec(df, SPEC), expected) # Extracting integers again from 'Int32' columns would fail.
+    df['term'] = raw_loans()['term'] # The column is loaded again.
+    pd.testing.assert_frame_equal(transform.apply_transform_spec(df, SPEC), expected)
+
+@pytest.mark.parametrize('spec', [
+    {'term': [('extract_number',)]},
+    {'employment_length': [('replace', '< 1 year')]},
+    {'loan_amount': [('extract_integer',)]}
+])
+def test_invalid_transform_spec_raises(spec):
+    with pytest.raises(ValueError):
+        DataTransform().apply_transform_spec(raw_loans(), spec)
+
+def string_columns():
+    values = np.resize(np.array(['36 months', '60 months', None, '< 1 year', '10+ years', 'n/a'], dtype='object'), 90)
+    return {
+        'object': pd.Series(values, name='term'),
+        'categorical': pd.Series(values, name='term', dtype='category'),
+        'no nulls': pd.Series(values[values != None], name='term')
+    }
+
+@pytest.mark.parametrize('kind', ['object', 'categorical', 'no nulls'])
+def test_extract_integer_matches_str_accessor(kind):
+    column = string_columns()[kind]
+    expected = column.astype('object').str.extract(r'(\d+)', expand=False).astype('Int32')
+    result = DataTransform().extract_integer_from_string(column.to_frame(), 'term')['term']
+    pd.testing.assert_series_equal(result, expected)
+
+@pytest.mark.parametrize('kind', ['object', 'categorical', 'no nulls'])
+def test_replace_string_text_matches_str_accessor(kind):
+    column = string_columns()[kind]
+    expected = column.astype('object').str.replace('months', 'm')
+    result = DataTransform().replace_string_text(column.to_frame(), 'term', 'months', 'm')['term']
+    if kind == 'categorical': # Categorical columns stay categorical.
+        assert isinstance(result.dtype, pd.CategoricalDtype)
+        result = result.astype('object')
+    pd.testing.assert_series_equal(result, expected)
+
+def test_map_distinct_values_merges_categories_with_the_same_result():
+    column = pd.Series(['36 months', '36  months', None, '60 months'], dtype='category')
+    result = DataTransform().map_distinct_values(column, lambda values: values.str.replace('  ', ' '), keep_categorical=True)
+    assert list(result.cat.categories) == ['36 months', '60 months']
+    assert result.astype('object').tolist()[:2] == ['36 months', '36 months'] and pd.isna(result[2])
+
+def test_map_distinct_values_calls_function_once_for_each_distinct_value():
+    calls = []
+    def function(values):
+        calls.append(len(values))
+        return values.str.upper()
+    column = pd.Series(np.resize(np.array(['a', 'b', None], dtype='object'), 3000))
+    result = DataTransform().map_distinct_values(column, function)
+    assert calls == [2]
+    pd.testing.assert_series_equal(result, column.str.upper())
@@ -0,0 +1,116 @@
+import datetime
+import json
+import os
+import numpy as np
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+from db_utils import RDSDatabaseConnector, load_sync_state, save_chunks_to_csv, save_data_to_sqlite, save_sync_state, sync_loans_data
+
+
+@pytest.fixture
+def loans():
+    months = ['Jan-2021', 'Mar-2021', 'Dec-2021', 'Feb-2022'] # 'Mar-2021' sorts last as text, 'Feb-2022' is the latest date.
+    return pd.DataFrame({'id': np.arange(1, 401), 'loan_amount': np.arange(400) * 10.5, 'last_payment_date': np.resize(months, 400)})
+
+@pytest.fixture
+def connector(tmp_path, loans):
+    connector = RDSDatabaseConnector({})
+    connector.create_engine(save_data_to_sqlite(loans, str(tmp_path / 'loans.db')))
+    return connector
+
+@pytest.mark.parametrize('chunk_size', [1, 64, 400, 1000])
+def test_extract_in_chunks_matches_whole_table(tmp_path, loans, connector, chunk_size):
+    chunks = list(connector.extract_loans_data_in_chunks(chunk_size))
+    assert max(len(chunk) for chunk in chunks) <= chunk_size
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), connector.extract_loans_data())
+    assert save_chunks_to_csv(iter(chunks), str(tmp_path / 'loans.csv')) == len(loans)
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / 'loans.csv'), loans)
+
+def test_extract_in_chunks_rejects_invalid_size(connector):
+    with pytest.raises(ValueError):
+        next(connector.extract_loans_data_in_chunks(0))
+
+def test_save_chunks_writes_one_header_after_an_empty_chunk(tmp_path, loans):
+    assert save_chunks_to_csv([loans.head(0), loans.head(5), loans.iloc[5:10]], str(tmp_path / 'loans.csv')) == 10
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / 'loans.csv'), loans.head(10))
+
+@pytest.mark.parametrize('partitions, max_workers', [(1, 1), (8, 4), (1000, 3)])
+def test_partitioned_extraction_matches_whole_table(loans, connector, partitions, max_workers):
+    pd.testing.assert_frame_equal(connector.extract_loans_data_partitioned('id', partitions, max_workers), loans)
+
+def test_partitioned_extraction_on_decimal_column(tmp_path):
+    engine = sa.create_engine(f"sqlite:///{tmp_path / 'loans.db'}")
+    metadata = sa.MetaData()
+    table = sa.Table('loan_payments', metadata, sa.Column('id', sa.Numeric(10, 0)), sa.Column('loan_amount', sa.Float))
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(table.insert(), [{'id': id, 'loan_amount': id * 0.5} for id in range(1, 101)])
+    connector = RDSDatabaseConnector({})
+    connector.create_engine(f"sqlite:///{tmp_path / 'loans.db'}")
+    df = connector.extract_loans_data_partitioned('id', 6, 2)
+    assert df['id'].astype(int).tolist() == list(range(1, 101))
+
+def test_partitioned_extraction_rejects_text_column(loans, connector):
+    with pytest.raises(ValueError):
+        connector.extract_loans_data_partitioned('last_payment_date')
+
+def test_sync_text_date_watermark(tmp_path, loans, connector):
+    file_path, state_path = str(tmp_path / 'loans.csv'), str(tmp_path / 'state.json')
+    assert sync_loans_data(connector, file_path, state_path, watermark_column='last_payment_date') == 400
+    assert pd.Timestamp(load_sync_state(state_path)['watermark']) == pd.Timestamp('2022-02-01') # The latest date, not the latest text.
+
+    modified = os.path.getmtime(file_path)
+    assert sync_loans_data(connector, file_path, state_path, watermark_column='last_payment_date') == 0 # Rows at the watermark are unchanged.
+    assert os.path.getmtime(file_path) == modified
+
+    updated = loans.copy()
+    updated.loc[updated['id'] == 1, ['loan_amount', 'last_payment_date']] = [99.0, 'Apr-2022'] # 'Apr-2022' sorts before 'Feb-2022' as text.
+    save_data_to_sqlite(updated, str(tmp_path / 'loans.db'))
+    connector.engine.dispose()
+    assert sync_loans_data(connector, file_path, state_path, watermark_column='last_payment_date') == 1
+    local_df = pd.read_csv(file_path)
+    assert len(local_df) == 400
+    assert local_df.loc[local_df['id'] == 1, 'loan_amount'].item() == 99.0
+    assert pd.Timestamp(load_sync_state(state_path)['watermark']) == pd.Timestamp('2022-04-01')
+
+def test_unchanged_sync_does_not_read_local_file(tmp_path, loans, connector, monkeypatch):
+    file_path, state_path = str(tmp_path / 'loans.csv'), str(tmp_path / 'state.json')
+    sync_loans_data(connector, file_path, state_path, watermark_column='last_payment_date')
+    assert len(load_sync_state(state_path)['row_hashes']) == 100 # The rows at 'Feb-2022'.
+    def read_csv(*args, **kwargs):
+        raise AssertionError('The local file was read.')
+    monkeypatch.setattr(pd, 'read_csv', read_csv)
+    assert sync_loans_data(connector, file_path, state_path, watermark_column='last_payment_date') == 0
+
+def test_sync_replaces_changed_row_at_watermark(tmp_path, loans, connector):
+    file_path, state_path = str(tmp_path / 'loans.csv'), str(tmp_path / 'state.json')
+    sync_loans_data(connector, file_path, state_path, watermark_column='last_payment_date')
+    updated = loans.copy()
+    updated.loc[updated['id'] == 4, 'loan_amount'] = -1.0 # 'Feb-2022', so the watermark is unchanged.
+    save_data_to_sqlite(updated, str(tmp_path / 'loans.db'))
+    connector.engine.dispose()
+    assert sync_loans_data(connector, file_path, state_path, watermark_column='last_payment_date') == 1
+    local_df = pd.read_csv(file_path)
+    assert len(local_df) == 400 and local_df.loc[local_df['id'] == 4, 'loan_amount'].item() == -1.0
+    assert sync_loans_data(connector, file_path, state_path, watermark_column='last_payment_date') == 0
+
+def test_sync_key_watermark_appends(tmp_path, loans, connector):
+    file_path, state_path = str(tmp_path / 'loans.csv'), str(tmp_path / 'state.json')
+    sync_loans_data(connector, file_path, state_path)
+    assert sync_loans_data(connector, file_path, state_path) == 0
+    save_data_to_sqlite(pd.concat([loans, loans.tail(2).assign(id=[401, 402])]), str(tmp_path / 'loans.db'))
+    assert sync_loans_data(connector, file_path, state_path) == 2
+    assert pd.read_csv(file_path)['id'].tolist() == list(range(1, 403))
+
+def test_text_watermark_that_is_not_a_date_is_refused(tmp_path, loans):
+    connector = RDSDatabaseConnector({})
+    connector.create_engine(save_data_to_sqlite(loans.assign(reference='L' + loans['id'].astype(str)), str(tmp_path / 'loans.db')))
+    with pytest.raises(ValueError):
+        connector.extract_new_loans_data('reference', 'L5')
+
+@pytest.mark.parametrize('watermark, expected', [(datetime.date(2022, 2, 1), '2022-02-01'), (datetime.datetime(2022, 2, 1, 12), '2022-02-01T12:00:00'), (pd.Timestamp('2022-02-01'), '2022-02-01T00:00:00'), (np.datetime64('2022-02-01'), '2022-02-01T00:00:00'), (np.int64(5), 5)])
+def test_save_sync_state_serialises_watermarks(tmp_path, watermark, expected):
+    save_sync_state('last_payment_date', watermark, str(tmp_path / 'state.json'))
+    with open(tmp_path / 'state.json') as file:
+        assert json.load(file)['watermark'] == expected
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+from featurematrix import FeatureMatrixBuilder
+
+
+def loans():
+    return pd.DataFrame({'loan_amount': np.arange(1000, dtype='float64'), 'grade': np.resize(['A', 'B', 'C'], 1000)})
+
+def test_matrix_matches_category_codes():
+    df = loans()
+    matrix = FeatureMatrixBuilder(df).matrix(['loan_amount', 'grade'])
+    assert matrix.dtype == np.float32 and matrix.flags['C_CONTIGUOUS']
+    assert (matrix[:, 1] == df['grade'].astype('category').cat.codes).all()
+
+def test_reassigned_column_is_encoded_again():
+    df = loans()
+    builder = FeatureMatrixBuilder(df)
+    for step in range(5): # The previous column is freed on each assignment, so its memory could be reused by the next one.
+        assert builder.matrix(['loan_amount'])[0, 0] == step
+        df['loan_amount'] = df['loan_amount'] + 1
+
+def test_in_place_edit_is_encoded_again_after_invalidate():
+    df = loans()
+    builder = FeatureMatrixBuilder(df)
+    builder.matrix(['loan_amount', 'grade'])
+    df.loc[0, 'loan_amount'] = -1.0
+    df.loc[0, 'grade'] = 'C'
+    builder.invalidate('loan_amount')
+    builder.invalidate('grade')
+    matrix = builder.matrix(['loan_amount', 'grade'])
+    assert matrix[0, 0] == -1 and matrix[0, 1] == 2
+
+def test_write_column_matches_encoding_again():
+    df = loans()
+    df.loc[::7, 'grade'] = np.nan
+    builder = FeatureMatrixBuilder(df)
+    builder.matrix(['grade'])
+    rows = df['grade'].isna().to_numpy()
+    builder.write_column('grade', rows, np.full(rows.sum(), 'B'))
+    assert df['grade'].notna().all()
+    assert (builder.matrix(['grade'])[:, 0] == FeatureMatrixBuilder(df).matrix(['grade'])[:, 0]).all()
+
+def test_write_column_keeps_float32():
+    df = pd.DataFrame({'int_rate': np.array([1.5, np.nan, np.nan], dtype='float32')})
+    builder = FeatureMatrixBuilder(df)
+    builder.write_column('int_rate', np.array([False, True, True]), np.array([0.1, 0.2]))
+    assert df['int_rate'].dtype == 'float32'
+    assert df['int_rate'].tolist() == pytest.approx([1.5, 0.1, 0.2])
+    assert builder.matrix(['int_rate'])[:, 0].tolist() == pytest.approx([1.5, 0.1, 0.2])
+
+def test_unchanged_column_is_not_encoded_again(monkeypatch):
+    df = loans()
+    builder = FeatureMatrixBuilder(df)
+    builder.matrix(['loan_amount', 'grade'])
+    monkeypatch.setattr(pd, 'Categorical', None) # Encoding a column again would fail.
+    assert builder.matrix(['loan_amount', 'grade']).shape == (1000, 2)
@@ -0,0 +1,63 @@
+import os
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+from imputationmodelstore import ImputationModelStore
+
+
+FEATURES = ['loan_amount', 'grade']
+CATEGORIES = {'grade': pd.Index(list('ABC'))}
+
+def training_data(seed: int = 123, rows: int = 600):
+    rng = np.random.default_rng(seed)
+    x = np.column_stack([rng.uniform(500, 35000, rows), rng.integers(0, 3, rows)]).astype('float32')
+    y = np.where(x[:, 0] > 15000, 'Charged Off', 'Fully Paid').astype(object)
+    return x, y
+
+@pytest.fixture
+def store(tmp_path):
+    return ImputationModelStore(str(tmp_path / 'models'))
+
+def counts(store):
+    return store.loaded, store.warm_started, store.trained
+
+def test_unchanged_data_loads_saved_model(store):
+    x, y = training_data()
+    first = store.fit('loan_status', 'linear_svm', FEATURES, CATEGORIES, x, y)
+    second = store.fit('loan_status', 'linear_svm', FEATURES, CATEGORIES, x, y)
+    assert counts(store) == (1, 0, 1)
+    assert (first.predict(x) == second.predict(x)).all()
+
+def test_changed_data_warm_starts_saved_model(store):
+    store.fit('loan_status', 'linear_svm', FEATURES, CATEGORIES, *training_data())
+    saved_iterations = joblib.load(store.model_path('loan_status'))['model'][-1].t_
+    x, y = training_data(seed=456)
+    model = store.fit('loan_status', 'linear_svm', FEATURES, CATEGORIES, x, y)
+    assert counts(store) == (0, 1, 1)
+    assert model[-1].t_ > saved_iterations # The saved classifier was updated, not replaced.
+    assert store.load('loan_status')['data_fingerprint'] == store.data_fingerprint(x, y)
+
+def test_changed_data_retrains_model_that_cannot_warm_start(store):
+    store.fit('loan_status', 'gradient_boosting', FEATURES, CATEGORIES, *training_data())
+    store.fit('loan_status', 'gradient_boosting', FEATURES, CATEGORIES, *training_data(seed=456))
+    assert counts(store) == (0, 0, 2)
+
+@pytest.mark.parametrize('features, categories', [(['loan_amount'], {}), (FEATURES, {'grade': pd.Index(list('ABD'))})])
+def test_changed_feature_set_retrains(store, features, categories):
+    x, y = training_data()
+    store.fit('loan_status', 'linear_svm', FEATURES, CATEGORIES, x, y)
+    store.fit('loan_status', 'linear_svm', features, categories, x[:, :len(features)], y)
+    assert counts(store) == (0, 0, 2)
+    assert store.load('loan_status')['features'] == features
+
+def test_stale_file_is_retrained_and_replaced(store):
+    x, y = training_data()
+    store.fit('loan_status', 'linear_svm', FEATURES, CATEGORIES, x, y)
+    saved_model = store.load('loan_status')
+    saved_model['feature_fingerprint'] = 'stale' # e.g. saved by an earlier version with different encodings.
+    store.save('loan_status', saved_model)
+    store.fit('loan_status', 'linear_svm', FEATURES, CATEGORIES, x, y)
+    assert counts(store) == (0, 0, 2)
+    assert store.load('loan_status')['feature_fingerprint'] == store.feature_fingerprint('linear_svm', FEATURES, CATEGORIES)
+    assert os.listdir(store.directory) == ['loan_status.joblib']
@@ -0,0 +1,17 @@
+import matplotlib
+matplotlib.use('Agg') # Plots are drawn without a display.
+from matplotlib import pyplot
+import numpy as np
+import pandas as pd
+import pytest
+from loan_fixtures import synthetic_loans
+from plotter import Plotter
+
+
+@pytest.mark.parametrize('dtype', ['float64', 'Float64', 'Int64'])
+def test_continuous_value_risk_comparison_with_missing_values(dtype):
+    loans = synthetic_loans(500)
+    loans['loan_amount'] = pd.array(loans['loan_amount'].round().where(loans.index % 10 != 0), dtype=dtype) # Every tenth value is missing.
+    Plotter().continuous_value_risk_comparison(loans, 'loan_amount')
+    assert len(pyplot.gcf().axes) == 8
+    pyplot.close('all')
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+from dataframeinfo import DataFrameInfo
+
+
+def test_repeated_query_is_a_hit():
+    info = DataFrameInfo(cache_size=16)
+    df = pd.DataFrame({'a': np.arange(1000, dtype='float64')})
+    assert info.median(df, 'a') == info.median(df, 'a')
+    assert info.cache_info()['hits'] == 1
+    assert info.cache_info()['misses'] == 1
+
+def test_reassigned_column_is_a_miss():
+    info = DataFrameInfo(cache_size=16)
+    df = pd.DataFrame({'a': np.arange(1, 1001, dtype='float64'), 'b': np.zeros(1000)})
+    for step in range(10): # The previous column is freed on each assignment, so its memory could be reused by the next one.
+        assert info.median(df, 'a') == 500.5 + step
+        df['a'] = df['a'] + 1
+    assert info.cache_info()['hits'] == 0
+    assert info.cache_info()['misses'] == 10
+
+def test_reassigned_extension_column_is_a_miss():
+    info = DataFrameInfo(cache_size=16)
+    df = pd.DataFrame({'a': pd.array(np.arange(1, 1001), dtype='Int64')})
+    for step in range(5):
+        assert info.mean(df, 'a') == 500.5 + step
+        df['a'] = df['a'] + 1
+    assert info.cache_info()['hits'] == 0
+
+def test_invalidate_after_in_place_edit():
+    info = DataFrameInfo(cache_size=16)
+    df = pd.DataFrame({'a': np.arange(1000, dtype='float64')})
+    info.mean(df, 'a')
+    df.loc[:, 'a'] *= 2
+    info.clear_cache(df)
+    assert info.mean(df, 'a') == np.arange(1000).mean() * 2
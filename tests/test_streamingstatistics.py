@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+from streamingstatistics import HyperLogLog, StreamingDataFrameInfo
+
+
+ROWS = 50000
+SKETCH_SIZE = 2000
+PRECISION = 12
+
+@pytest.fixture
+def loans():
+    rng = np.random.default_rng(123)
+    loans = pd.DataFrame({
+        'loan_amount': rng.lognormal(9, 0.6, ROWS), # Right skewed, like the loan amounts.
+        'int_rate': rng.normal(13, 4, ROWS),
+        'member_id': rng.integers(0, 30000, ROWS),
+        'grade': rng.choice(list('ABCDEFG'), ROWS)
+    })
+    loans.loc[loans.index % 13 == 0, 'int_rate'] = np.nan
+    return loans
+
+@pytest.fixture
+def summaries(tmp_path, loans):
+    file_path = str(tmp_path / 'loans.parquet')
+    loans.to_parquet(file_path, row_group_size=7000)
+    return StreamingDataFrameInfo(chunk_size=4096, precision=PRECISION, sketch_size=SKETCH_SIZE).summarise(file_path)
+
+def test_moments_match_pandas(loans, summaries):
+    info = StreamingDataFrameInfo()
+    for column in ['loan_amount', 'int_rate', 'member_id']:
+        assert info.mean(summaries, column) == pytest.approx(loans[column].mean(), rel=1e-9)
+        assert info.standard_deviation(summaries, column) == pytest.approx(loans[column].std(), rel=1e-9)
+        assert info.skewness(summaries, column) == pytest.approx(loans[column].skew(), rel=1e-6, abs=1e-9)
+    assert info.null_count(summaries, 'int_rate') == loans['int_rate'].isna().sum()
+
+def test_distinct_count_within_error_bound(loans, summaries):
+    info = StreamingDataFrameInfo()
+    standard_error = 1.04 / np.sqrt(2**PRECISION)
+    for column in ['member_id', 'grade']:
+        assert info.count_distinct(summaries, column) == pytest.approx(loans[column].nunique(), rel=4 * standard_error)
+
+def test_median_within_rank_error(loans, summaries):
+    info = StreamingDataFrameInfo()
+    rank_error = np.sqrt(np.log(2 / 0.001) / (2 * SKETCH_SIZE)) # The bound holds with probability 0.999.
+    for column in ['loan_amount', 'int_rate']:
+        values = loans[column].dropna().to_numpy()
+        rank = np.mean(values <= info.median(summaries, column))
+        assert abs(rank - 0.5) <= rank_error
+
+@pytest.mark.parametrize('precision', [4, 5, 6])
+def test_small_precision_count_is_unbiased(precision):
+    standard_error = 1.04 / np.sqrt(2**precision)
+    estimates = []
+    for start in range(0, 200000, 20000): # The average of 10 sketches has a tenth of the variance.
+        sketch = HyperLogLog(precision)
+        sketch.update(pd.Series(np.arange(start, start + 20000)))
+        estimates.append(sketch.count())
+    assert np.mean(estimates) == pytest.approx(20000, rel=3 * standard_error / np.sqrt(10))
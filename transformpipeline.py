@@ -0,0 +1,199 @@
+import numpy as np
+import pandas as pd
+# Auxiliary classes:
+from columnregistry import COLUMN_REGISTRY
+
+
+class TransformPipeline:
+
+    '''
+    This class is used to chain the DataFrameTransform operations that remove columns, remove rows and fill nulls, without copying the dataframe after each operation.
+    Operations are recorded rather than applied: removed columns are noted, every row removal (null rows and outlier rows) is combined into a single boolean mask, and fill values are noted for each column. collect() then creates the transformed dataframe with a single selection of rows and columns.
+    The result is the same as applying the operations one after the other: the median, mean and outlier 'z scores' of each operation are calculated from the rows that remain after the previous operations, with previous fills applied.
+    The original dataframe is never altered.
+
+    Attributes:
+        DataFrame (pd.DataFrame): the dataframe the operations are applied to.
+        row_mask (np.ndarray): True for each row that is kept.
+        removed_columns (list): the columns that are removed.
+        fill_values (dict): the value null values are filled with, for each column.
+    '''
+
+    def __init__(self, DataFrame: pd.DataFrame):
+
+        '''
+        This method is used to initialise this instance of the TransformPipeline class.
+
+        Parameters:
+            DataFrame (pd.DataFrame): The dataframe the operations will be applied to.
+        '''
+
+        self.DataFrame = DataFrame
+        self.row_mask = np.ones(len(DataFrame), dtype=bool)
+        self.removed_columns = []
+        self.fill_values = {}
+
+    def check_columns(self, column_names):
+
+        '''
+        This method is used to check that columns are in the dataframe and have not been removed.
+
+        Parameters:
+            column_names: The name or list of names of the columns.
+
+        Raises:
+            ValueError if a column is not in the dataframe or has been removed.
+
+        Returns:
+            list: The names of the columns.
+        '''
+
+        column_names = [column_names] if isinstance(column_names, str) else list(column_names)
+        for column in column_names:
+            if column not in self.DataFrame.columns or column in self.removed_columns: # In the case the provided column_name is NOT in the dataframe.
+                raise ValueError(f"Column '{column}' not found in the dataframe.")
+        return column_names
+
+    def current_nulls(self, column_name: str):
+
+        '''
+        This method is used to find the null values of a column with the fills recorded so far applied.
+
+        Parameters:
+            column_name (str): The name of the column.
+
+        Returns:
+            np.ndarray: True for each row where the column is null.
+        '''
+
+        nulls = self.DataFrame[column_name].isna().to_numpy()
+        if column_name in self.fill_values and pd.notna(self.fill_values[column_name]): # Filled nulls are no longer null.
+            return np.zeros(len(nulls), dtype=bool)
+        return nulls
+
+    def current_values(self, column_name: str):
+
+        '''
+        This method is used to get the values of a numeric column with the fills recorded so far applied, as a float array.
+
+        Parameters:
+            column_name (str): The name of the column.
+
+        Returns:
+            np.ndarray: The values of the column, nulls are NaN.
+        '''
+
+        values = self.DataFrame[column_name].to_numpy(dtype='float64', na_value=np.nan)
+        if column_name in self.fill_values: # Only a temporary array of this column is created, not a copy of the dataframe.
+            values = np.where(np.isnan(values), self.fill_values[column_name], values)
+        return values
+
+    def remove_null_columns(self, column_name):
+
+        '''
+        This method is used to remove column(s) containing excess null or missing values.
+
+        Parameters:
+            column_name: the name(s) of columns that will be removed.
+
+        Returns:
+            TransformPipeline: This pipeline, so further operations can be chained.
+        '''
+
+        self.removed_columns.extend(TransformPipeline.check_columns(self, column_name))
+        return self
+
+    def remove_null_rows(self, column_name):
+
+        '''
+        This method is used to remove rows where data points from the specified column(s) are null.
+
+        Parameters:
+            column_name: The name(s) of the column(s) which will be checked for null values.
+
+        Returns:
+            TransformPipeline: This pipeline, so further operations can be chained.
+        '''
+
+        for column in TransformPipeline.check_columns(self, column_name):
+            self.row_mask &= ~TransformPipeline.current_nulls(self, column) # Combined with the rows already removed.
+        return self
+
+    def fill_median(self, column_name):
+
+        '''
+        This method is used to fill null values in numeric column(s) with the median value of the rows that remain.
+
+        Parameters:
+            column_name: The name(s) of the column(s) which will be filled with the median value for nulls.
+
+        Returns:
+            TransformPipeline: This pipeline, so further operations can be chained.
+        '''
+
+        for column in TransformPipeline.check_columns(self, column_name):
+            if column not in self.fill_values: # Once filled, a column has no nulls left to fill.
+                self.fill_values[column] = np.nanmedian(TransformPipeline.current_values(self, column)[self.row_mask]) if self.row_mask.any() else np.nan
+        return self
+
+    def fill_mean(self, column_name):
+
+        '''
+        This method is used to fill null values in numeric column(s) with the mean value of the rows that remain.
+
+        Parameters:
+            column_name: The name(s) of the column(s) which will be filled with the mean value for nulls.
+
+        Returns:
+            TransformPipeline: This pipeline, so further operations can be chained.
+        '''
+
+        for column in TransformPipeline.check_columns(self, column_name):
+            if column not in self.fill_values: # Once filled, a column has no nulls left to fill.
+                self.fill_values[column] = np.nanmean(TransformPipeline.current_values(self, column)[self.row_mask]) if self.row_mask.any() else np.nan
+        return self
+
+    def drop_outlier_rows(self, column_name: str, z_score_threshold: int):
+
+        '''
+        This method is used to remove rows based on the 'z score' of values in a specified numeric column, the mean and standard deviation are calculated from the rows that remain.
+
+        Parameters:
+            column_name (str): The name of the column whose 'z scores' are checked.
+            z_score_threshold (int): Rows with an absolute 'z score' at or above this threshold are removed.
+
+        Raises:
+            ValueError if the column data type is not numeric.
+
+        Returns:
+            TransformPipeline: This pipeline, so further operations can be chained.
+        '''
+
+        TransformPipeline.check_columns(self, column_name)
+        if column_name not in COLUMN_REGISTRY.numeric_columns(self.DataFrame): # In the case the column is not numeric.
+            raise ValueError(f"The '{column_name}' column is not numerical datatype.")
+        values = TransformPipeline.current_values(self, column_name)
+        kept_values = values[self.row_mask]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            z_scores = (values - np.nanmean(kept_values)) / np.nanstd(kept_values) # Identify the 'z score' for each value in the column.
+            self.row_mask &= np.abs(z_scores) < z_score_threshold # Combined with the rows already removed, null values are also removed.
+        return self
+
+    def collect(self):
+
+        '''
+        This method is used to create the transformed dataframe from the recorded operations.
+
+        Returns:
+            DataFrame (pd.DataFrame): The transformed dataframe.
+        '''
+
+        columns = [column for column in self.DataFrame.columns if column not in self.removed_columns]
+        DataFrame = self.DataFrame.loc[self.row_mask, columns] # Rows and columns are selected in a single copy.
+        for column, fill_value in self.fill_values.items():
+            if column in columns: # Fills of columns that were later removed are not needed.
+                dtype = DataFrame[column].dtype
+                if isinstance(dtype, np.dtype) and dtype.kind == 'f' and pd.notna(fill_value): # The fill value is cast to the column's float type (e.g. 'float32'), so the column keeps its data type as with the eager methods.
+                    fill_value = dtype.type(fill_value)
+                DataFrame[column] = DataFrame[column].fillna(fill_value)
+        return DataFrame